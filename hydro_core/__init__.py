@@ -0,0 +1,45 @@
+"""
+Hydro-Assess computation core
+Data fetchers, recommendation engine, design and cost model and groundwater
+lookup, with no Streamlit dependency. The Streamlit pages, the batch CLI
+(`python -m hydro_core`) and any worker process import from here.
+
+Submodules are imported on first use, and heavy dependencies (requests,
+pandas, shapely, geopandas) only inside the functions that need them, so
+`import hydro_core` and the scalar engine load in milliseconds.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'generate_recommendation': 'engine',
+    'calculate_efficiency_rating': 'engine',
+    'calculate_design_and_cost': 'engine',
+    'RUNOFF_COEFFICIENTS': 'engine',
+    'SOIL_INFILTRATION_RATES': 'engine',
+    'assess_sites': 'batch',
+    'get_daily_rainfall': 'rainfall',
+    'get_soil_info': 'soil',
+    'get_soil_type_fallback': 'soil',
+    'classify_soil_texture': 'soil',
+    'classify_soil_textures': 'soil',
+    'get_groundwater_data': 'groundwater',
+    'query_groundwater': 'groundwater',
+    'fetch_all': 'fetch',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
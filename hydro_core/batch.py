@@ -0,0 +1,167 @@
+"""
+Batch assessment engine for Hydro-Assess
+Vectorized counterpart of generate_recommendation, calculate_efficiency_rating
+and calculate_design_and_cost in engine.py for portfolio runs (every rooftop
+in a ward, a whole survey grid). Sites are columns of a table rather than one
+params dict, and every rule is evaluated over whole NumPy arrays at once.
+
+Arithmetic is written in the same order as the scalar functions, so each row
+matches the scalar result for the same inputs exactly.
+"""
+
+import math
+from typing import Mapping, Union
+
+import numpy as np
+
+from .engine import METRO_CITY_TYPE
+
+# Input columns, named like the keys of the scalar `params` dict
+INPUT_COLUMNS = [
+    'area', 'annual_rainfall', 'runoff_coefficient', 'household_size',
+    'post_monsoon_depth_m', 'city_type', 'water_cost_per_m3'
+]
+
+LITRES_PER_CAPITA_DAY = 135
+BUFFER_DAYS = 20
+
+RECOMMENDATION_TYPES = ["Storage Only", "Hybrid System"]
+
+# Reasons in rule order; codes index this list
+REASONS = [
+    "Annual rainfall is too low for effective groundwater recharge.",
+    "Groundwater level is too high (<8m), making recharge unsafe and ineffective.",
+    "High-density urban area with sufficient rainfall potential for both storage and groundwater recharge to mitigate flooding.",
+    "High-density urban area with limited rainfall potential - prioritizing direct water storage for household use.",
+    "Optimal balance of direct use and groundwater recharge.",
+]
+
+EFFICIENCY_RATINGS = ["Excellent", "Good", "Fair", "Limited"]
+
+PIT_DIAMETER_M = 2.0
+MAX_PIT_DEPTH_M = 4.0
+
+
+def _column(sites, name, dtype=np.float64) -> np.ndarray:
+    return np.asarray(sites[name], dtype=dtype)
+
+
+def assess_sites(sites: Union['pd.DataFrame', Mapping[str, np.ndarray]]) -> 'pd.DataFrame':
+    """Recommendation, design and financials for every site in `sites`.
+
+    `sites` holds the INPUT_COLUMNS as equal-length columns. Returns one row
+    per site (same index for DataFrame input) with categorical
+    recommendation_type / reason / efficiency_rating columns and numeric design
+    and cost columns; components a site does not need are 0.
+    """
+    import pandas as pd
+
+    area = _column(sites, 'area')
+    rainfall = _column(sites, 'annual_rainfall')
+    runoff = _column(sites, 'runoff_coefficient')
+    household = _column(sites, 'household_size')
+    gw_depth = _column(sites, 'post_monsoon_depth_m')
+    water_cost = _column(sites, 'water_cost_per_m3')
+    is_metro = _column(sites, 'city_type', dtype=object) == METRO_CITY_TYPE
+
+    # --- Recommendation (generate_recommendation) ---
+    annual_potential = area * (rainfall / 1000) * runoff * 1000
+    household_demand = household * LITRES_PER_CAPITA_DAY * BUFFER_DAYS
+
+    low_rain = rainfall < 500
+    high_gw = ~low_rain & (gw_depth < 8.0)
+    metro = ~low_rain & ~high_gw & is_metro
+    metro_hybrid = metro & (annual_potential > household_demand * 2)
+    reason_code = np.select(
+        [low_rain, high_gw, metro_hybrid, metro],
+        [0, 1, 2, 3],
+        default=4
+    ).astype(np.int8)
+    hybrid = (reason_code == 2) | (reason_code == 4)
+
+    volume_to_store = np.where(hybrid, np.minimum(household_demand, annual_potential * 0.6),
+                               annual_potential)
+    volume_to_recharge = np.where(hybrid, annual_potential - volume_to_store, 0.0)
+
+    # --- Efficiency rating (calculate_efficiency_rating) ---
+    with np.errstate(divide='ignore', invalid='ignore'):
+        potential_coverage = (annual_potential / (household * LITRES_PER_CAPITA_DAY * 365)) * 100
+    rating_code = np.select(
+        [potential_coverage >= 80, potential_coverage >= 60, potential_coverage >= 40],
+        [0, 1, 2],
+        default=3
+    ).astype(np.int8)
+
+    # --- Storage tank (calculate_design_and_cost) ---
+    has_tank = volume_to_store > 0
+    tank_volume_m3 = np.where(has_tank, volume_to_store / 1000, 0.0)
+    tank_radius = (tank_volume_m3 / (math.pi * 1.2)) ** (1 / 3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tank_height = np.where(has_tank, tank_volume_m3 / (math.pi * tank_radius ** 2), 0.0)
+    tank_diameter = tank_radius * 2
+    storage_cost = np.where(has_tank, volume_to_store * np.where(volume_to_store > 5000, 6, 4), 0.0)
+
+    # --- Recharge pits ---
+    has_recharge = volume_to_recharge > 0
+    recharge_volume_m3 = np.where(has_recharge, volume_to_recharge / 1000, 0.0)
+    pit_area = math.pi * (PIT_DIAMETER_M / 2) ** 2
+    required_depth = recharge_volume_m3 / pit_area
+    multi_pit = required_depth > MAX_PIT_DEPTH_M
+    num_pits = np.where(
+        multi_pit, np.ceil(recharge_volume_m3 / (pit_area * MAX_PIT_DEPTH_M)),
+        np.where(has_recharge, 1, 0)
+    ).astype(np.int64)
+    pit_depth = np.minimum(required_depth, MAX_PIT_DEPTH_M)
+    recharge_cost = recharge_volume_m3 * 2500
+
+    # --- Costs, summed in the scalar dict's insertion order ---
+    first_flush = np.full(area.shape, 3500.0)
+    filtration = np.full(area.shape, 4500.0)
+    guttering = area * 15
+    material_cost = 0 + storage_cost + recharge_cost + first_flush + filtration + guttering
+    installation = material_cost * 0.15
+    total_cost = material_cost + installation
+
+    # --- Financials ---
+    stored_m3_annual = volume_to_store / 1000
+    recharged_m3_annual = volume_to_recharge / 1000
+    direct_water_savings = stored_m3_annual * water_cost
+    recharge_benefits = np.where(recharged_m3_annual > 0, recharged_m3_annual * 5, 0.0)
+    annual_savings = direct_water_savings + recharge_benefits
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payback = np.where(annual_savings > 0, total_cost / annual_savings, np.inf)
+        net_10_year = annual_savings * 10 - (total_cost * 0.02) * 10 - total_cost
+        roi = np.where((payback != np.inf) & (payback > 0), (net_10_year / total_cost) * 100, -100.0)
+
+    index = sites.index if isinstance(sites, pd.DataFrame) else None
+    return pd.DataFrame({
+        'recommendation_type': pd.Categorical.from_codes(hybrid.astype(np.int8), RECOMMENDATION_TYPES),
+        'reason': pd.Categorical.from_codes(reason_code, REASONS),
+        'annual_potential': annual_potential,
+        'volume_to_store': volume_to_store,
+        'volume_to_recharge': volume_to_recharge,
+        'household_demand_20_days': household_demand,
+        'efficiency_rating': pd.Categorical.from_codes(rating_code, EFFICIENCY_RATINGS),
+        'tank_volume_m3': tank_volume_m3,
+        'tank_diameter_m': np.where(has_tank, tank_diameter, 0.0),
+        'tank_height_m': tank_height,
+        'recharge_volume_m3': recharge_volume_m3,
+        'num_pits': num_pits,
+        'pit_depth_m': pit_depth,
+        'storage_tank_cost': storage_cost,
+        'recharge_system_cost': recharge_cost,
+        'first_flush_diverter_cost': first_flush,
+        'filtration_system_cost': filtration,
+        'guttering_and_pipes_cost': guttering,
+        'installation_labor_cost': installation,
+        'total_cost': total_cost,
+        'annual_savings': annual_savings,
+        'direct_water_savings': direct_water_savings,
+        'recharge_benefits': recharge_benefits,
+        'payback_period_years': payback,
+        'roi_10_year': roi,
+        'flood_mitigation_benefit': has_recharge,
+        'groundwater_recharge_m3_annual': recharged_m3_annual,
+        'maintenance_cost_annual': total_cost * 0.02,
+    }, index=index)
@@ -0,0 +1,141 @@
+"""
+Persistent on-disk cache for Hydro-Assess
+A small SQLite key/value store shared by every process (and replica) that
+points at the same cache directory. Entries expire after a per-entry age limit
+and the file is kept under a size budget by evicting least-recently-used rows.
+
+Configuration (environment variables):
+    HYDRO_CACHE_DIR           Cache directory (default: ~/.cache/hydro_assess,
+                              set to an empty string to disable the disk cache)
+    HYDRO_CACHE_MAX_MB        Size budget for cached values in MB (default: 256)
+    HYDRO_CACHE_MAX_AGE_DAYS  Default age limit for entries in days (default: 30)
+    HYDRO_OFFLINE             Set to 1 to serve only cached data and never call
+                              external APIs; age limits are ignored in this mode
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'hydro_assess')
+CACHE_FILE_NAME = 'hydro_cache.sqlite3'
+
+
+def is_offline() -> bool:
+    """True when external APIs must not be called (HYDRO_OFFLINE=1)."""
+    return os.environ.get('HYDRO_OFFLINE', '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class DiskCache:
+    """SQLite-backed byte cache with LRU eviction and per-entry age limits."""
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024,
+                 max_age_seconds: float = 30 * 86400, offline: bool = False):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, CACHE_FILE_NAME)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at < now and not self.offline:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(value)
+
+    def set(self, key: str, value: bytes, max_age_seconds: Optional[float] = None):
+        """Store a value; `max_age_seconds` overrides the cache-wide age limit."""
+        now = time.time()
+        age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), now + age, now)
+            )
+            self._evict()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self):
+        """Drop expired rows, then least-recently-used rows until under budget."""
+        if not self.offline:
+            self._conn.execute("DELETE FROM entries WHERE expires_at < ?", (time.time(),))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+
+_default_cache = None
+_default_cache_failed = False
+_default_cache_lock = threading.Lock()
+
+
+def cache_directory() -> Optional[str]:
+    """Configured cache directory (HYDRO_CACHE_DIR), or None if caching to disk is disabled."""
+    return os.environ.get('HYDRO_CACHE_DIR', DEFAULT_CACHE_DIR) or None
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """Process-wide cache configured from the environment, or None if disabled."""
+    global _default_cache, _default_cache_failed
+    with _default_cache_lock:
+        if _default_cache is None and not _default_cache_failed:
+            directory = cache_directory()
+            if directory is None:
+                return None
+            try:
+                _default_cache = DiskCache(
+                    directory,
+                    max_bytes=int(float(os.environ.get('HYDRO_CACHE_MAX_MB', 256)) * 1024 * 1024),
+                    max_age_seconds=float(os.environ.get('HYDRO_CACHE_MAX_AGE_DAYS', 30)) * 86400,
+                    offline=is_offline(),
+                )
+            except (OSError, sqlite3.Error) as e:
+                print(f"Disk cache disabled ({directory}): {e}")
+                _default_cache_failed = True
+        return _default_cache
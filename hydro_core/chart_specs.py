@@ -0,0 +1,155 @@
+"""
+Interactive chart specs for Hydro-Assess
+Builds Vega-Lite specifications (plain dicts) for the dashboard's rainfall,
+cost breakdown and 10-year projection charts. The browser renders them, so
+the server only serializes a few hundred bytes of JSON per chart instead of
+rasterizing an image on every rerun.
+
+Matplotlib rendering in charts.py is kept for the PDF report, which needs
+images. Titles and axis labels mirror the report charts.
+"""
+
+from typing import Dict, List
+
+PROJECTION_YEARS = 10
+
+# Palette of the cost and projection charts
+FINANCIAL_COLORS = ['#2E8B57', '#FFD700', '#4682B4', '#FF6347', '#9370DB', '#20B2AA', '#FFA500', '#DC143C']
+INVESTMENT_COLOR = '#DC143C'
+
+
+def _rupee_thousands(value: str) -> str:
+    """Vega expression formatting `value` in thousands of rupees, as on the report charts."""
+    return f"'₹' + format({value} / 1000, ',.0f') + 'K'"
+
+
+def _cost_rows(costs: Dict[str, float]) -> List[Dict]:
+    total = sum(costs.values())
+    return [{'component': k.replace('_', ' ').title(), 'cost': float(v),
+             'share': float(v) / total if total else 0.0}
+            for k, v in costs.items()]
+
+
+def rainfall_spec(monthly_rainfall: Dict[str, float], theme: Dict[str, str]) -> Dict:
+    """Monthly rainfall bars, above-average months in the theme's primary colour."""
+    values = list(monthly_rainfall.values())
+    mean = sum(values) / len(values) if values else 0.0
+    rows = [{'month': month, 'rainfall_mm': float(value),
+             'band': 'Above average' if value >= mean else 'Below average'}
+            for month, value in monthly_rainfall.items()]
+    months = list(monthly_rainfall.keys())
+    x = {'field': 'month', 'type': 'ordinal', 'sort': months, 'title': 'Month', 'axis': {'labelAngle': 0}}
+    y = {'field': 'rainfall_mm', 'type': 'quantitative', 'title': 'Rainfall (mm)'}
+    return {
+        'title': 'Monthly Rainfall Distribution (2023)',
+        'data': {'values': rows},
+        'encoding': {'x': x, 'y': y},
+        'layer': [
+            {
+                'mark': {'type': 'bar', 'opacity': 0.8},
+                'encoding': {
+                    'color': {'field': 'band', 'type': 'nominal', 'title': None,
+                              'scale': {'domain': ['Above average', 'Below average'],
+                                        'range': [theme['primary_bar'], theme['secondary_bar']]}},
+                    'tooltip': [{'field': 'month', 'title': 'Month'},
+                                {'field': 'rainfall_mm', 'title': 'Rainfall (mm)', 'format': ',.0f'}],
+                },
+            },
+            {
+                'mark': {'type': 'text', 'dy': -6, 'fontWeight': 'bold'},
+                'encoding': {'text': {'field': 'rainfall_mm', 'format': '.0f'}},
+            },
+        ],
+    }
+
+
+def cost_share_spec(costs: Dict[str, float], title: str) -> Dict:
+    """Donut of the cost components with value and share in the tooltip."""
+    return {
+        'title': title,
+        'data': {'values': _cost_rows(costs)},
+        'mark': {'type': 'arc', 'innerRadius': 60, 'stroke': 'white', 'strokeWidth': 2},
+        'encoding': {
+            'theta': {'field': 'cost', 'type': 'quantitative', 'stack': True},
+            'order': {'field': 'cost', 'type': 'quantitative', 'sort': 'descending'},
+            'color': {'field': 'component', 'type': 'nominal', 'title': 'Components',
+                      'sort': {'field': 'cost', 'order': 'descending'},
+                      'scale': {'range': FINANCIAL_COLORS}},
+            'tooltip': [{'field': 'component', 'title': 'Component'},
+                        {'field': 'cost', 'title': 'Cost (₹)', 'format': ',.0f'},
+                        {'field': 'share', 'title': 'Share', 'format': '.1%'}],
+        },
+        'view': {'stroke': None},
+    }
+
+
+def cost_components_spec(costs: Dict[str, float]) -> Dict:
+    """Horizontal bars of the cost components, labelled in thousands of rupees."""
+    y = {'field': 'component', 'type': 'nominal', 'title': 'Components', 'sort': '-x'}
+    x = {'field': 'cost', 'type': 'quantitative', 'title': 'Cost (₹)',
+         'axis': {'labelExpr': _rupee_thousands('datum.value')}}
+    return {
+        'title': 'Cost Breakdown by Component',
+        'data': {'values': _cost_rows(costs)},
+        'transform': [{'calculate': _rupee_thousands('datum.cost'), 'as': 'label'}],
+        'encoding': {'x': x, 'y': y},
+        'layer': [
+            {
+                'mark': {'type': 'bar', 'opacity': 0.8},
+                'encoding': {
+                    'color': {'field': 'component', 'type': 'nominal', 'legend': None,
+                              'scale': {'range': FINANCIAL_COLORS}},
+                    'tooltip': [{'field': 'component', 'title': 'Component'},
+                                {'field': 'cost', 'title': 'Cost (₹)', 'format': ',.0f'}],
+                },
+            },
+            {
+                'mark': {'type': 'text', 'align': 'left', 'dx': 4, 'fontWeight': 'bold'},
+                'encoding': {'text': {'field': 'label'}},
+            },
+        ],
+    }
+
+
+def projection_spec(design_financial: Dict, title: str) -> Dict:
+    """Cumulative net savings per year against the initial investment, marking the payback year."""
+    investment = float(design_financial['total_cost'])
+    net_annual = float(design_financial['annual_savings']) - float(design_financial['maintenance_cost_annual'])
+    rows = [{'year': year, 'cumulative_savings': net_annual * year, 'investment': investment}
+            for year in range(1, PROJECTION_YEARS + 1)]
+    payback = [row for row in rows if row['cumulative_savings'] >= investment][:1]
+
+    y_axis = {'axis': {'labelExpr': _rupee_thousands('datum.value')}, 'title': 'Amount (₹)'}
+    layers = [
+        {
+            'mark': {'type': 'bar', 'opacity': 0.8, 'color': FINANCIAL_COLORS[0]},
+            'encoding': {
+                'x': {'field': 'year', 'type': 'ordinal', 'title': 'Years', 'axis': {'labelAngle': 0}},
+                'y': {'field': 'cumulative_savings', 'type': 'quantitative', **y_axis},
+                'tooltip': [{'field': 'year', 'title': 'Year'},
+                            {'field': 'cumulative_savings', 'title': 'Cumulative net savings (₹)', 'format': ',.0f'}],
+            },
+        },
+        {
+            'mark': {'type': 'rule', 'color': INVESTMENT_COLOR, 'strokeDash': [6, 4], 'strokeWidth': 2.5},
+            'encoding': {
+                'y': {'datum': investment, 'type': 'quantitative'},
+                'tooltip': {'value': f"Initial investment: ₹{investment:,.0f}"},
+            },
+        },
+    ]
+    if payback:
+        layers.append({
+            'data': {'values': payback},
+            'mark': {'type': 'point', 'filled': True, 'size': 120, 'color': INVESTMENT_COLOR},
+            'encoding': {
+                'x': {'field': 'year', 'type': 'ordinal'},
+                'y': {'field': 'investment', 'type': 'quantitative'},
+                'tooltip': {'value': f"Payback: Year {payback[0]['year']}"},
+            },
+        })
+    return {
+        'title': title,
+        'data': {'values': rows},
+        'layer': layers,
+    }
@@ -0,0 +1,408 @@
+"""
+Chart rendering for Hydro-Assess
+Draws the PDF report's charts with matplotlib and returns them as encoded PNG
+or SVG bytes; the dashboard itself uses the Vega-Lite specs in chart_specs.py.
+Rendered images are cached in process memory, keyed by a hash of everything
+that reaches the plot (data series, theme colours, titles, format and
+resolution), so a Streamlit rerun with unchanged chart inputs does no
+plotting at all and no live matplotlib Figure outlives a render.
+
+Figures are created with matplotlib's object API rather than pyplot, so they
+never enter pyplot's global figure registry. Each figure is cleared as soon as
+its image is written; matplotlib figures are reference cycles, so the emptied
+shells are garbage-collected once more than MAX_UNCOLLECTED_FIGURES pile up.
+live_figure_count() reports how many are still in memory.
+
+Charts are drawn by the PDF report build (in the report worker process, see
+report_jobs.py), never on a page rerun. Fonts and colours are set on each
+figure's own artists rather than through matplotlib's global rcParams, so
+renders on concurrent threads cannot restyle each other.
+
+Configuration (environment variables):
+    HYDRO_CHART_CACHE_BYTES    Process-wide cache size (default: 64 MiB)
+"""
+
+import gc
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+CHART_FORMATS = ('png', 'svg')
+
+# Resolution of PNG output; high enough for the PDF report, reused by the dashboard
+CHART_DPI = 150
+
+# Rendered images kept in memory at once, by count and total size
+MAX_CACHED_CHARTS = 64
+MAX_CACHE_BYTES = int(os.environ.get('HYDRO_CHART_CACHE_BYTES', 64 * 1024 * 1024))
+
+# Cleared figures tolerated before forcing a garbage collection
+MAX_UNCOLLECTED_FIGURES = 4
+
+# Applied to every text of a chart; DejaVu Sans has the ₹ sign and the Unicode minus
+CHART_FONT_FAMILY = ['DejaVu Sans', 'Arial Unicode MS', 'sans-serif']
+
+DARK_BACKGROUNDS = ('#1a1f2e', '#0e1117', '#262730')
+
+# Chart colours matching .streamlit/config.toml and config_dark.toml
+LIGHT_THEME = {
+    'bg_color': '#FAFBFC',
+    'text_color': '#1E2329',
+    'grid_color': '#F0F2F5',
+    'primary_bar': '#0066CC',
+    'secondary_bar': '#FFA500',
+    'edge_color': '#1E2329',
+}
+DARK_THEME = {
+    'bg_color': '#1A1F2E',
+    'text_color': '#E8EAED',
+    'grid_color': '#242B3D',
+    'primary_bar': '#00D4FF',
+    'secondary_bar': '#F59E0B',
+    'edge_color': '#242B3D',
+}
+
+
+def _thousands(x, pos):
+    return f'₹{x/1000:.0f}K'
+
+
+def _is_dark(theme: Dict[str, str]) -> bool:
+    return theme['bg_color'].lower() in DARK_BACKGROUNDS
+
+
+def _cost_labels(costs: Dict[str, float]) -> List[str]:
+    return [k.replace('_', ' ').title() for k in costs.keys()]
+
+
+def _apply_fonts(fig):
+    """Set the chart font on every text of `fig`, tick labels included, without touching rcParams."""
+    from matplotlib.text import Text
+
+    for ax in fig.axes:
+        ax.tick_params(labelfontfamily=CHART_FONT_FAMILY)
+    for text in fig.findobj(Text):
+        text.set_fontfamily(CHART_FONT_FAMILY)
+
+
+def _draw_rainfall(fig, monthly_rainfall: Dict[str, float], theme: Dict[str, str]):
+    """Monthly rainfall bars, above-average months in the primary colour."""
+    ax = fig.add_subplot()
+    fig.patch.set_facecolor(theme['bg_color'])
+    ax.set_facecolor(theme['bg_color'])
+
+    months = list(monthly_rainfall.keys())
+    values = list(monthly_rainfall.values())
+    colors = [theme['primary_bar'] if v >= (np.mean(values) if len(values) else 0) else theme['secondary_bar'] for v in values]
+    bars = ax.bar(months, values, color=colors, edgecolor=theme['edge_color'], linewidth=1, alpha=0.8)
+
+    ax.set_xlabel('Month', fontsize=12, fontweight='bold', color=theme['text_color'])
+    ax.set_ylabel('Rainfall (mm)', fontsize=12, fontweight='bold', color=theme['text_color'])
+    ax.set_title('Monthly Rainfall Distribution (2023)', fontsize=14, fontweight='bold', color=theme['text_color'])
+    ax.grid(axis='y', alpha=0.3, linestyle='--', color=theme['grid_color'])
+    ax.tick_params(colors=theme['text_color'])
+    ax.spines['bottom'].set_color(theme['text_color'])
+    ax.spines['left'].set_color(theme['text_color'])
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    for bar, value in zip(bars, values):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height, f'{value:.0f}',
+                ha='center', va='bottom', fontsize=9, color=theme['text_color'], fontweight='bold')
+    _apply_fonts(fig)
+    fig.tight_layout()
+
+
+def _draw_cost_distribution(fig, costs: Dict[str, float], theme: Dict[str, str]):
+    """Theme-aware donut of the non-zero cost components (report version)."""
+    ax = fig.add_subplot()
+    fig.patch.set_facecolor(theme['bg_color'])
+    ax.set_facecolor(theme['bg_color'])
+    if not costs:
+        return
+
+    if _is_dark(theme):  # Dark mode colors - brighter and more vibrant
+        custom_colors = [theme['primary_bar'], '#ffb74d', '#81c784', '#f06292',
+                         '#ba68c8', '#4db6ac', '#ffcc02', '#ff8a65']
+    else:  # Light mode colors - deeper and more professional
+        custom_colors = [theme['primary_bar'], theme['secondary_bar'], '#2E8B57', '#4682B4',
+                         '#FF6347', '#9370DB', '#20B2AA', '#DC143C']
+
+    labels = _cost_labels(costs)
+    values = list(costs.values())
+    colors = [custom_colors[i % len(custom_colors)] for i in range(len(values))]
+
+    wedges, texts, autotexts = ax.pie(
+        values,
+        labels=labels,
+        autopct=lambda pct: f'{pct:.1f}%' if pct <= 5 else f'{pct:.1f}%\n(₹{pct/100 * sum(values)/1000:.0f}K)',
+        colors=colors,
+        startangle=90,
+        explode=[0.05 if v == max(values) else 0 for v in values],  # Explode the largest slice
+        shadow=True,
+        wedgeprops=dict(width=0.8, edgecolor=theme['edge_color'], linewidth=2)
+    )
+    ax.set_title('System Cost Distribution', fontsize=16, fontweight='bold',
+                 pad=20, color=theme['text_color'])
+
+    for text in texts:
+        text.set_fontsize(11)
+        text.set_fontweight('bold')
+        text.set_color(theme['text_color'])
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+        autotext.set_fontsize(9)
+
+    legend_labels = [f'{label}: ₹{value/1000:.0f}K ({value/sum(values)*100:.1f}%)'
+                     for label, value in zip(labels, values)]
+    legend = ax.legend(wedges, legend_labels, title="Components", loc="center left",
+                       bbox_to_anchor=(1, 0, 0.5, 1), fontsize=10)
+    legend.get_title().set_color(theme['text_color'])
+    for text in legend.get_texts():
+        text.set_color(theme['text_color'])
+
+    ax.axis('equal')
+    _apply_fonts(fig)
+    fig.tight_layout()
+
+
+def _draw_savings_projection(fig, annual_savings: float, maintenance: float, total_cost: float,
+                             theme: Dict[str, str]):
+    """Ten-year cumulative net savings against the initial investment, with the payback year."""
+    ax = fig.add_subplot()
+    fig.patch.set_facecolor(theme['bg_color'])
+    ax.set_facecolor(theme['bg_color'])
+
+    years = list(range(1, 11))
+    cumulative_savings = np.cumsum([annual_savings - maintenance] * 10)
+    savings_color = theme['primary_bar']
+    investment_color = '#ff8a65' if _is_dark(theme) else '#DC143C'
+
+    ax.bar(years, cumulative_savings, alpha=0.8, color=savings_color,
+           label='Cumulative Net Savings', edgecolor=theme['edge_color'], linewidth=1)
+    ax.axhline(y=total_cost, color=investment_color, linestyle='--',
+               linewidth=2.5, label='Initial Investment', alpha=0.9)
+
+    payback_year = next((i+1 for i, val in enumerate(cumulative_savings) if val >= total_cost), None)
+    if payback_year and payback_year <= 10:
+        ax.plot(payback_year, total_cost, 'o', color=investment_color, markersize=8,
+                markeredgecolor='white', markeredgewidth=2)
+        ax.annotate(f'Payback: Year {payback_year}',
+                    xy=(payback_year, total_cost),
+                    xytext=(payback_year + 0.5, total_cost * 0.8),
+                    arrowprops=dict(arrowstyle='->', color=theme['text_color']),
+                    fontsize=10, fontweight='bold', color=theme['text_color'])
+
+    ax.set_xlabel('Years', fontsize=12, fontweight='bold', color=theme['text_color'])
+    ax.set_ylabel('Amount (₹)', fontsize=12, fontweight='bold', color=theme['text_color'])
+    ax.set_title('10-Year Financial Projection', fontsize=14, fontweight='bold',
+                 pad=20, color=theme['text_color'])
+    ax.tick_params(colors=theme['text_color'])
+    ax.spines['bottom'].set_color(theme['text_color'])
+    ax.spines['left'].set_color(theme['text_color'])
+
+    legend = ax.legend(fontsize=10, framealpha=0.9)
+    legend.get_frame().set_facecolor(theme['bg_color'])
+    legend.get_frame().set_edgecolor(theme['text_color'])
+    for text in legend.get_texts():
+        text.set_color(theme['text_color'])
+
+    ax.grid(True, alpha=0.3, linestyle='--', color=theme['grid_color'])
+    for spine in ['top', 'right']:
+        ax.spines[spine].set_visible(False)
+
+    from matplotlib.ticker import FuncFormatter
+    ax.yaxis.set_major_formatter(FuncFormatter(_thousands))
+    _apply_fonts(fig)
+    fig.tight_layout()
+
+
+_charts: "OrderedDict[str, bytes]" = OrderedDict()
+_charts_bytes = 0
+_charts_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+# Every figure drawn here that has not been garbage-collected yet
+_live_figures: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def chart_key(name: str, inputs: dict, figsize, fmt: str, dpi: int) -> str:
+    """Cache key of a chart: SHA-256 over its name, inputs and output settings."""
+    payload = json.dumps([name, inputs, list(figsize), fmt, dpi], default=float, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _draw_to_bytes(draw: Callable, inputs: dict, figsize, fmt: str, dpi: int) -> bytes:
+    from matplotlib.figure import Figure
+
+    buffer = io.BytesIO()
+    fig = Figure(figsize=figsize)
+    _live_figures.add(fig)
+    try:
+        draw(fig, **inputs)
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+    finally:
+        # Drop the artists now; the figure itself is a reference cycle left to the collector
+        fig.clear()
+        del fig
+    if len(_live_figures) > MAX_UNCOLLECTED_FIGURES:
+        gc.collect()
+    return buffer.getvalue()
+
+
+class ChartJob(NamedTuple):
+    """One chart to render: `draw(fig, **inputs)` on a figure of `figsize` inches."""
+    name: str
+    draw: Callable
+    inputs: dict
+    figsize: Tuple[float, float] = (10, 6)
+
+
+# Renders in progress, so concurrent requests for the same chart share one
+_pending: Dict[str, Future] = {}
+
+
+def _store(key: str, image: bytes):
+    global _charts_bytes
+
+    with _charts_lock:
+        if key not in _charts:
+            _charts[key] = image
+            _charts_bytes += len(image)
+        while len(_charts) > 1 and (len(_charts) > MAX_CACHED_CHARTS or _charts_bytes > MAX_CACHE_BYTES):
+            _, evicted = _charts.popitem(last=False)
+            _charts_bytes -= len(evicted)
+
+
+def render_charts(jobs: Dict[str, ChartJob], fmt: str = 'png', dpi: int = CHART_DPI) -> Dict[str, bytes]:
+    """Encoded images of several charts, keyed like `jobs`.
+
+    Charts seen before come from the cache and charts already being rendered
+    by another request are waited for; the rest are drawn in this thread. `inputs`
+    must be JSON-serializable and hold everything the drawing depends on;
+    dict order is part of the key since it is the plotting order.
+    """
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"unsupported chart format {fmt!r}; expected one of {CHART_FORMATS}")
+    keys = {label: chart_key(job.name, job.inputs, job.figsize, fmt, dpi) for label, job in jobs.items()}
+
+    images: Dict[str, bytes] = {}
+    waiting: Dict[str, Future] = {}
+    owned: Dict[str, str] = {}  # key -> label of the job this call renders
+    with _charts_lock:
+        for label, key in keys.items():
+            if key in _charts:
+                _charts.move_to_end(key)
+                _stats['hits'] += 1
+                images[label] = _charts[key]
+            elif key in _pending:
+                _stats['hits'] += 1
+                waiting[label] = _pending[key]
+            else:
+                _stats['misses'] += 1
+                _pending[key] = waiting[label] = Future()
+                owned[key] = label
+
+    try:
+        for key, label in owned.items():
+            job = jobs[label]
+            try:
+                image = _draw_to_bytes(job.draw, job.inputs, job.figsize, fmt, dpi)
+            except Exception as e:
+                waiting[label].set_exception(e)
+            else:
+                _store(key, image)
+                waiting[label].set_result(image)
+    finally:
+        with _charts_lock:
+            for key, label in owned.items():
+                _pending.pop(key, None)
+                if not waiting[label].done():
+                    waiting[label].set_exception(RuntimeError("chart rendering was interrupted"))
+
+    for label, future in waiting.items():
+        images[label] = future.result()
+    return {label: images[label] for label in jobs}
+
+
+def render_chart(name: str, draw: Callable, inputs: dict, figsize=(10, 6),
+                 fmt: str = 'png', dpi: int = CHART_DPI) -> bytes:
+    """Encoded image of `draw(fig, **inputs)`, drawn only the first time these inputs are seen."""
+    return render_charts({name: ChartJob(name, draw, inputs, figsize)}, fmt, dpi)[name]
+
+
+def _rainfall_job(monthly_rainfall: Dict[str, float], theme: Dict[str, str]) -> ChartJob:
+    return ChartJob('rainfall', _draw_rainfall, {'monthly_rainfall': dict(monthly_rainfall), 'theme': dict(theme)})
+
+
+def _cost_distribution_job(costs: Dict[str, float], theme: Dict[str, str]) -> ChartJob:
+    costs = {k: v for k, v in costs.items() if v > 0}
+    return ChartJob('cost_distribution', _draw_cost_distribution, {'costs': costs, 'theme': dict(theme)}, (10, 8))
+
+
+def _savings_projection_job(design_financial: Dict, theme: Dict[str, str]) -> ChartJob:
+    return ChartJob('savings_projection', _draw_savings_projection, {
+        'annual_savings': design_financial['annual_savings'],
+        'maintenance': design_financial['maintenance_cost_annual'],
+        'total_cost': design_financial['total_cost'],
+        'theme': dict(theme),
+    })
+
+
+def _report_chart_jobs(monthly_rainfall: Dict[str, float], design_financial: Dict,
+                       theme: Dict[str, str]) -> Dict[str, ChartJob]:
+    return {
+        'rainfall_chart': _rainfall_job(monthly_rainfall, theme),
+        'cost_chart': _cost_distribution_job(design_financial['cost_breakdown'], theme),
+        'savings_chart': _savings_projection_job(design_financial, theme),
+    }
+
+
+def report_charts(monthly_rainfall: Dict[str, float], design_financial: Dict,
+                  theme: Dict[str, str]) -> Dict[str, bytes]:
+    """PNG images of the PDF report's charts, keyed as generate_professional_pdf expects."""
+    return render_charts(_report_chart_jobs(monthly_rainfall, design_financial, theme))
+
+
+def report_chart_keys(monthly_rainfall: Dict[str, float], design_financial: Dict,
+                      theme: Dict[str, str]) -> Dict[str, str]:
+    """Cache keys of the images report_charts would return, computed without rendering them."""
+    return {label: chart_key(job.name, job.inputs, job.figsize, 'png', CHART_DPI)
+            for label, job in _report_chart_jobs(monthly_rainfall, design_financial, theme).items()}
+
+
+def live_figure_count() -> int:
+    """Matplotlib figures still in memory: ours awaiting collection plus any open in pyplot."""
+    count = len(_live_figures)
+    pyplot = sys.modules.get('matplotlib.pyplot')
+    if pyplot is not None:
+        count += len(pyplot.get_fignums())
+    return count
+
+
+def chart_cache_info() -> Dict[str, int]:
+    """Hits, misses (renders), cached images, their total size and live figures."""
+    with _charts_lock:
+        info = {**_stats, 'entries': len(_charts), 'bytes': _charts_bytes}
+    info['live_figures'] = live_figure_count()
+    return info
+
+
+def clear_chart_cache():
+    global _charts_bytes
+
+    with _charts_lock:
+        _charts.clear()
+        _charts_bytes = 0
+        _stats.update(hits=0, misses=0)
@@ -0,0 +1,319 @@
+"""
+Headless bulk assessment for Hydro-Assess
+Reads sites from a CSV or GeoJSON file, enriches each with rainfall, soil and
+groundwater data on a bounded worker pool, scores them with the batch engine
+and streams the results to CSV or Parquet chunk by chunk.
+
+Runs are resumable: with --resume, sites whose results are already in the
+output are skipped, so an interrupted nightly job picks up where it stopped.
+
+Usage:
+    python -m hydro_core sites.csv -o results.csv
+    python -m hydro_core meerut.geojson -o results.parquet --groundwater meerut.geojson --resume
+
+CSV input needs `lat` and `lon` columns (`latitude`/`longitude` also work).
+Any of area, surface_type, runoff_coefficient, household_size, city_type,
+water_cost_per_m3, post_monsoon_depth_m and principal_aquifer_type may be given
+per site; missing values take the command-line defaults or are looked up.
+A `site_id` (or `id`) column identifies sites for resuming; otherwise the row
+number is used. Parquet output is a directory of part files that pandas and
+pyarrow read as one table.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from .batch import assess_sites
+from .engine import METRO_CITY_TYPE, RUNOFF_COEFFICIENTS
+from .groundwater import get_groundwater_data, query_groundwater
+from .rainfall import get_daily_rainfall
+from .soil import get_soil_info
+
+DEFAULT_SURFACE_TYPE = "Concrete Roof"
+DEFAULT_CITY_TYPE = "Tier 2 & 3 (Lower Density)"
+
+# Columns enrich_site adds; the groundwater ones only for sites whose depth was looked up
+ENRICHED_COLUMNS = ['annual_rainfall', 'soil_type', 'soil_source', 'post_monsoon_depth_m', 'principal_aquifer_type']
+
+
+def read_sites(path: str) -> pd.DataFrame:
+    """Load sites as a DataFrame with string `site_id` and float `lat`/`lon` columns."""
+    if path.lower().endswith(('.geojson', '.json')):
+        from shapely.geometry import shape
+
+        with open(path, encoding='utf-8') as f:
+            features = json.load(f).get('features', [])
+        rows = []
+        for i, feature in enumerate(features):
+            point = shape(feature['geometry']).representative_point()
+            row = dict(feature.get('properties') or {})
+            row.setdefault('site_id', feature.get('id', i))
+            row['lat'], row['lon'] = point.y, point.x
+            rows.append(row)
+        sites = pd.DataFrame(rows)
+    else:
+        sites = pd.read_csv(path)
+        sites = sites.rename(columns={'latitude': 'lat', 'longitude': 'lon'})
+        if 'site_id' not in sites.columns:
+            sites['site_id'] = sites['id'] if 'id' in sites.columns else np.arange(len(sites))
+
+    missing = {'lat', 'lon'} - set(sites.columns)
+    if missing:
+        raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+    sites['site_id'] = sites['site_id'].astype(str)
+    if sites['site_id'].duplicated().any():
+        raise ValueError(f"{path}: site ids must be unique")
+    sites['lat'] = sites['lat'].astype(float)
+    sites['lon'] = sites['lon'].astype(float)
+    return sites
+
+
+def apply_defaults(sites: pd.DataFrame, args) -> pd.DataFrame:
+    """Fill design inputs not given per site with the command-line defaults."""
+    defaults = {
+        'area': args.area,
+        'surface_type': args.surface_type,
+        'household_size': args.household_size,
+        'city_type': args.city_type,
+        'water_cost_per_m3': args.water_cost,
+    }
+    for column, value in defaults.items():
+        if column not in sites.columns:
+            sites[column] = value
+        else:
+            sites[column] = sites[column].fillna(value)
+    coefficients = sites['surface_type'].map(RUNOFF_COEFFICIENTS)
+    if 'runoff_coefficient' in sites.columns:
+        coefficients = sites['runoff_coefficient'].fillna(coefficients)
+    unknown = coefficients.isna()
+    if unknown.any():
+        raise ValueError(f"unknown surface_type for {int(unknown.sum())} site(s); "
+                         f"expected one of: {', '.join(RUNOFF_COEFFICIENTS)}")
+    sites['runoff_coefficient'] = coefficients.astype(float)
+    return sites
+
+
+def enrich_site(site: Dict, groundwater_gdf=None) -> Dict:
+    """Rainfall, soil and groundwater for one site; raises if rainfall is unavailable."""
+    lat, lon = site['lat'], site['lon']
+    series = get_daily_rainfall(lat, lon)
+    if series is None:
+        raise RuntimeError("no rainfall data")
+    soil_info = get_soil_info(lat, lon)
+
+    enriched = {
+        'annual_rainfall': series.annual_total(),
+        'soil_type': soil_info['soil_type'],
+        'soil_source': soil_info['source'],
+    }
+    if pd.isna(site.get('post_monsoon_depth_m')):
+        if groundwater_gdf is not None:
+            groundwater = query_groundwater(lat, lon, groundwater_gdf)
+        else:
+            groundwater = get_groundwater_data(lat, lon)
+        enriched['post_monsoon_depth_m'] = float(groundwater['post_monsoon_depth_m'])
+        enriched['principal_aquifer_type'] = groundwater['principal_aquifer_type']
+    return enriched
+
+
+class ResultWriter:
+    """Appends result chunks to a CSV file or a directory of Parquet parts.
+
+    Every chunk is written with the same columns (and Parquet types): those of
+    the existing output when resuming, else those of the first chunk.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.parquet = path.lower().endswith('.parquet')
+        self._parts = len(self._part_files()) if self.parquet else 0
+        self.columns: Optional[List[str]] = None
+        self._schema = None
+        self._load_schema()
+
+    def _load_schema(self):
+        """Take the output schema from the existing output, if there is one."""
+        if self.parquet:
+            parts = self._part_files()
+            if parts:
+                import pyarrow.parquet as pq
+
+                self._schema = pq.read_schema(os.path.join(self.path, parts[0]))
+                self.columns = list(self._schema.names)
+        elif self.exists() and os.path.getsize(self.path) > 0:
+            self.columns = list(pd.read_csv(self.path, nrows=0).columns)
+
+    def _part_files(self):
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(f for f in os.listdir(self.path) if f.endswith('.parquet'))
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def remove(self):
+        if os.path.isdir(self.path):
+            shutil.rmtree(self.path)
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+        self._parts = 0
+        self.columns = None
+        self._schema = None
+
+    def done_ids(self) -> Set[str]:
+        """Site ids already written by earlier runs."""
+        if not self.exists():
+            return set()
+        if self.parquet:
+            ids = set()
+            for name in self._part_files():
+                part = pd.read_parquet(os.path.join(self.path, name), columns=['site_id'])
+                ids.update(part['site_id'])
+            return ids
+        return set(pd.read_csv(self.path, usecols=['site_id'], dtype={'site_id': str})['site_id'])
+
+    def write(self, chunk: pd.DataFrame):
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        # Columns missing from this chunk are written empty, ones the output lacks are dropped
+        chunk = chunk.reindex(columns=self.columns)
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._schema is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                # A column with no values in the first chunk has no type yet; it holds text
+                for i, field in enumerate(schema):
+                    if pa.types.is_null(field.type):
+                        schema = schema.set(i, field.with_type(pa.string()))
+                self._schema = schema
+            table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+            os.makedirs(self.path, exist_ok=True)
+            # Write to a temporary name first so a killed run never leaves a torn part
+            final = os.path.join(self.path, f"part-{self._parts:05d}.parquet")
+            pq.write_table(table, final + '.tmp')
+            os.replace(final + '.tmp', final)
+            self._parts += 1
+        else:
+            header = not self.exists() or os.path.getsize(self.path) == 0
+            chunk.to_csv(self.path, mode='a', header=header, index=False)
+
+
+def run(sites: pd.DataFrame, writer: ResultWriter, workers: int = 8, chunk_size: int = 500,
+        groundwater_gdf=None) -> Dict[str, int]:
+    """Enrich, score and write `sites` in chunks; returns ok/failed counts."""
+    total = len(sites)
+    counts = {'ok': 0, 'failed': 0}
+    start = time.monotonic()
+    records = sites.to_dict('records')
+    # Same columns for every chunk, whether or not its sites needed a groundwater lookup
+    columns = list(sites.columns) + [c for c in ENRICHED_COLUMNS if c not in sites.columns]
+
+    def enrich(site):
+        try:
+            return enrich_site(site, groundwater_gdf), None
+        except Exception as e:
+            return None, str(e) or type(e).__name__
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hydro-batch') as executor:
+        for offset in range(0, total, chunk_size):
+            chunk = records[offset:offset + chunk_size]
+            rows = []
+            for site, (enriched, error) in zip(chunk, executor.map(enrich, chunk)):
+                if error is not None:
+                    counts['failed'] += 1
+                    print(f"site {site['site_id']} ({site['lat']:.4f}, {site['lon']:.4f}) failed: {error}",
+                          file=sys.stderr)
+                    continue
+                rows.append({**site, **enriched})
+
+            if rows:
+                enriched_chunk = pd.DataFrame(rows).reindex(columns=columns)
+                enriched_chunk['principal_aquifer_type'] = enriched_chunk['principal_aquifer_type'].astype(object)
+                results = assess_sites(enriched_chunk)
+                writer.write(pd.concat([enriched_chunk, results], axis=1))
+                counts['ok'] += len(rows)
+
+            done = min(offset + chunk_size, total)
+            rate = done / max(time.monotonic() - start, 1e-9)
+            print(f"{done}/{total} sites ({done / total:.1%}), {rate:.1f} sites/s, "
+                  f"{counts['failed']} failed", file=sys.stderr, flush=True)
+    return counts
+
+
+def load_groundwater(path: Optional[str]):
+    """Groundwater layer from a GeoJSON/NDJSON file (streamed) or any other GIS format."""
+    if not path:
+        return None
+    if path.lower().endswith(('.geojson', '.json', '.ndjson', '.geojsonl', '.geojsons')):
+        from .geojson_stream import read_groundwater_file
+
+        return read_groundwater_file(path).to_geodataframe()
+    import geopandas as gpd
+
+    return gpd.read_file(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m hydro_core', description="Bulk rainwater harvesting assessment of many sites.")
+    parser.add_argument('input', help="CSV or GeoJSON file of sites")
+    parser.add_argument('-o', '--output', required=True,
+                        help="Result file: .csv, or .parquet (written as a directory of parts)")
+    parser.add_argument('--groundwater', help="GeoJSON/shapefile of groundwater levels (default: simulated)")
+    parser.add_argument('--workers', type=int, default=8, help="Concurrent site lookups (default: 8)")
+    parser.add_argument('--chunk-size', type=int, default=500, help="Sites per written chunk (default: 500)")
+    parser.add_argument('--resume', action='store_true', help="Skip sites already in the output")
+    parser.add_argument('--overwrite', action='store_true', help="Replace an existing output")
+    parser.add_argument('--area', type=float, default=150.0, help="Default catchment area in m² (default: 150)")
+    parser.add_argument('--surface-type', default=DEFAULT_SURFACE_TYPE, choices=list(RUNOFF_COEFFICIENTS),
+                        help=f"Default surface type (default: {DEFAULT_SURFACE_TYPE})")
+    parser.add_argument('--household-size', type=int, default=4, help="Default household size (default: 4)")
+    parser.add_argument('--city-type', default=DEFAULT_CITY_TYPE,
+                        choices=[DEFAULT_CITY_TYPE, METRO_CITY_TYPE],
+                        help=f"Default city classification (default: {DEFAULT_CITY_TYPE})")
+    parser.add_argument('--water-cost', type=float, default=25.0, help="Default water cost in ₹/m³ (default: 25)")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be at least 1")
+
+    writer = ResultWriter(args.output)
+    if writer.exists() and not (args.resume or args.overwrite):
+        parser.error(f"{args.output} exists; pass --resume to continue it or --overwrite to replace it")
+    if args.overwrite:
+        writer.remove()
+
+    try:
+        sites = apply_defaults(read_sites(args.input), args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Could not read sites: {e}", file=sys.stderr)
+        return 2
+
+    if args.resume:
+        done = writer.done_ids()
+        if done:
+            print(f"Resuming: {len(done)} sites already done", file=sys.stderr)
+            sites = sites[~sites['site_id'].isin(done)]
+
+    if sites.empty:
+        print("Nothing to do", file=sys.stderr)
+        return 0
+
+    counts = run(sites, writer, workers=args.workers, chunk_size=args.chunk_size,
+                 groundwater_gdf=load_groundwater(args.groundwater))
+    print(f"Done: {counts['ok']} sites written to {args.output}, {counts['failed']} failed", file=sys.stderr)
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Gridded groundwater depth rasters for Hydro-Assess
+Interpolating an uploaded well layer at every click is wasted work when the
+layer does not change, so the layer is rasterized once into a float32 grid
+(bands = depth columns) with a north-up affine transform, saved next to the
+disk cache and memory-mapped back. A point lookup is then one array read.
+
+Rasters are keyed by the uploaded file's content hash plus the interpolation
+settings; a new upload or changed settings build a new raster, anything else
+reuses the file on disk.
+
+Configuration (environment variables):
+    HYDRO_GW_RASTER_DEG    Cell size in degrees (default: 0.005, about 550 m)
+    HYDRO_GW_RASTER_CELLS  Largest raster in cells; bigger layers get coarser
+                           cells (default: 250000)
+"""
+
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .cache import cache_directory
+
+RASTER_CELL_DEG = float(os.environ.get('HYDRO_GW_RASTER_DEG', 0.005))
+MAX_RASTER_CELLS = int(os.environ.get('HYDRO_GW_RASTER_CELLS', 250_000))
+
+RASTER_SUBDIR = 'rasters'
+
+# Raster files kept on disk and rasters kept open in this process
+MAX_RASTER_FILES = 16
+MAX_OPEN_RASTERS = 4
+
+# Cell centres evaluated per call while building (bounds temporary memory)
+BUILD_ROWS_PER_PASS = 256
+
+
+class DepthRaster:
+    """Depth bands on a regular lat/lon grid.
+
+    Cell (row, col) covers lon [west + col * cell, west + (col + 1) * cell) and
+    lat (north - (row + 1) * cell, north - row * cell]. NaN means no estimate.
+    """
+
+    def __init__(self, data: np.ndarray, west: float, north: float, cell_deg: float,
+                 bands: List[str]):
+        self.data = data  # float32, shape (bands, rows, cols); may be a memmap
+        self.west = west
+        self.north = north
+        self.cell_deg = cell_deg
+        self.bands = bands
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.data.shape[1], self.data.shape[2]
+
+    def sample(self, lat: float, lon: float) -> Optional[Dict[str, float]]:
+        """Band values of the cell containing (lat, lon), or None outside the raster."""
+        row = math.floor((self.north - lat) / self.cell_deg)
+        col = math.floor((lon - self.west) / self.cell_deg)
+        rows, cols = self.shape
+        if not (0 <= row < rows and 0 <= col < cols):
+            return None
+        values = self.data[:, row, col]
+        if np.isnan(values).any():
+            return None
+        return {band: float(v) for band, v in zip(self.bands, values)}
+
+    @classmethod
+    def from_function(cls, bounds: Tuple[float, float, float, float], cell_deg: float,
+                      fn: Callable[[np.ndarray, np.ndarray], Dict[str, np.ndarray]]) -> 'DepthRaster':
+        """Evaluate `fn(lats, lons) -> {band: values}` at every cell centre of `bounds`.
+
+        `bounds` is (west, south, east, north); the cell size grows if needed to
+        stay within MAX_RASTER_CELLS.
+        """
+        west, south, east, north = bounds
+        cells = max(east - west, cell_deg) * max(north - south, cell_deg) / cell_deg ** 2
+        if cells > MAX_RASTER_CELLS:
+            cell_deg *= math.sqrt(cells / MAX_RASTER_CELLS)
+        cols = max(1, math.ceil((east - west) / cell_deg))
+        rows = max(1, math.ceil((north - south) / cell_deg))
+        centre_lons = west + (np.arange(cols) + 0.5) * cell_deg
+
+        data = None
+        bands = None
+        for start in range(0, rows, BUILD_ROWS_PER_PASS):
+            stop = min(start + BUILD_ROWS_PER_PASS, rows)
+            centre_lats = north - (np.arange(start, stop) + 0.5) * cell_deg
+            grid_lats, grid_lons = np.meshgrid(centre_lats, centre_lons, indexing='ij')
+            values = fn(grid_lats.ravel(), grid_lons.ravel())
+            if data is None:
+                bands = list(values)
+                data = np.full((len(bands), rows, cols), np.nan, dtype=np.float32)
+            for b, band in enumerate(bands):
+                data[b, start:stop] = np.asarray(values[band]).reshape(stop - start, cols)
+        return cls(data, west, north, cell_deg, bands)
+
+    def save(self, path: str):
+        """Write `<path>.npy` and `<path>.json`; the JSON is written last and marks completion."""
+        with open(path + '.npy.tmp', 'wb') as f:
+            np.save(f, np.ascontiguousarray(self.data))
+        os.replace(path + '.npy.tmp', path + '.npy')
+        meta = {'west': self.west, 'north': self.north, 'cell_deg': self.cell_deg, 'bands': self.bands}
+        with open(path + '.json.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(path + '.json.tmp', path + '.json')
+
+    @classmethod
+    def load(cls, path: str) -> Optional['DepthRaster']:
+        """Memory-map a raster written by save(), or None if it is missing or incomplete."""
+        try:
+            with open(path + '.json', encoding='utf-8') as f:
+                meta = json.load(f)
+            data = np.load(path + '.npy', mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        return cls(data, meta['west'], meta['north'], meta['cell_deg'], meta['bands'])
+
+
+def layer_bounds(lats: np.ndarray, lons: np.ndarray, cell_deg: float) -> Tuple[float, float, float, float]:
+    """Bounding box of the wells, padded by 5% of its extent (at least two cells)."""
+    pad_lat = max((lats.max() - lats.min()) * 0.05, 2 * cell_deg)
+    pad_lon = max((lons.max() - lons.min()) * 0.05, 2 * cell_deg)
+    return lons.min() - pad_lon, lats.min() - pad_lat, lons.max() + pad_lon, lats.max() + pad_lat
+
+
+def build_layer_raster(gdf, method: str, cell_deg: float = RASTER_CELL_DEG) -> Optional[DepthRaster]:
+    """Rasterize the interpolated depths of a well layer over its padded extent."""
+    from .interpolation import get_depth_surface
+
+    surface = get_depth_surface(gdf)
+    if not surface.surfaces:
+        return None
+    lats = np.concatenate([s.lat for s in surface.surfaces.values()])
+    lons = np.concatenate([s.lon for s in surface.surfaces.values()])
+    return DepthRaster.from_function(layer_bounds(lats, lons, cell_deg), cell_deg,
+                                     lambda la, lo: surface.estimate(la, lo, method=method))
+
+
+_open_rasters: "OrderedDict[str, Optional[DepthRaster]]" = OrderedDict()
+_open_lock = threading.Lock()
+_build_locks: Dict[str, threading.Lock] = {}
+
+
+def _prune_raster_files(directory: str):
+    metas = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith('.json')]
+    metas.sort(key=os.path.getmtime, reverse=True)
+    for meta in metas[MAX_RASTER_FILES:]:
+        for path in (meta, meta[:-len('.json')] + '.npy'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def get_layer_raster(gdf, content_hash: str, method: str,
+                     cell_deg: float = RASTER_CELL_DEG) -> Optional[DepthRaster]:
+    """Depth raster for an uploaded layer, built only when its content hash is new.
+
+    The raster is looked up in process memory, then on disk (memory-mapped),
+    and only built from `gdf` when neither has it. Returns None for layers with
+    no depth columns.
+    """
+    key = f"{content_hash[:32]}-{method}-{cell_deg:g}"
+    with _open_lock:
+        if key in _open_rasters:
+            _open_rasters.move_to_end(key)
+            return _open_rasters[key]
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+
+    with build_lock:
+        with _open_lock:
+            if key in _open_rasters:
+                return _open_rasters[key]
+
+        directory = cache_directory()
+        path = None
+        raster = None
+        if directory is not None:
+            directory = os.path.join(directory, RASTER_SUBDIR)
+            path = os.path.join(directory, key)
+            raster = DepthRaster.load(path)
+            if raster is not None:
+                os.utime(path + '.json')
+        if raster is None:
+            raster = build_layer_raster(gdf, method, cell_deg)
+            if raster is not None and path is not None:
+                try:
+                    os.makedirs(directory, exist_ok=True)
+                    raster.save(path)
+                    _prune_raster_files(directory)
+                    raster = DepthRaster.load(path) or raster
+                except OSError as e:
+                    print(f"Could not save groundwater raster ({path}): {e}")
+
+        with _open_lock:
+            _open_rasters[key] = raster
+            _build_locks.pop(key, None)
+            while len(_open_rasters) > MAX_OPEN_RASTERS:
+                _open_rasters.popitem(last=False)
+        return raster
@@ -0,0 +1,216 @@
+"""
+Recommendation engine and design/cost model for Hydro-Assess
+Scalar, per-site functions used by the calculator page; see batch.py for the
+vectorized equivalent. Pure Python, no third-party imports.
+"""
+
+import math
+
+RUNOFF_COEFFICIENTS = {
+    "Concrete Roof": 0.90,
+    "Tile Roof": 0.85,
+    "Metal Sheet": 0.90,
+    "Asphalt": 0.85,
+    "Concrete Surface": 0.75,
+    "Paved Area": 0.70
+}
+
+SOIL_INFILTRATION_RATES = {
+    "Sandy": 25,  # mm/hour
+    "Loamy": 13,
+    "Clay": 5,
+    "Rocky": 2
+}
+
+METRO_CITY_TYPE = "Tier 1 (Metro - High Density)"
+
+
+def generate_recommendation(params):
+    """
+    Core recommendation engine that analyzes all parameters and generates
+    a specific RWH strategy recommendation.
+    """
+    # 1. Calculate Annual Potential (in liters)
+    annual_potential = params['area'] * (params['annual_rainfall'] / 1000) * params['runoff_coefficient'] * 1000
+    
+    # 2. Apply Decision Rules in Order
+    recommendation_type = ""
+    reason = ""
+    
+    # Rule 1: Low Rainfall Check
+    if params['annual_rainfall'] < 500:
+        recommendation_type = "Storage Only"
+        reason = "Annual rainfall is too low for effective groundwater recharge."
+    
+    # Rule 2: High Groundwater Level Check
+    elif params['post_monsoon_depth_m'] < 8.0:
+        recommendation_type = "Storage Only"
+        reason = "Groundwater level is too high (<8m), making recharge unsafe and ineffective."
+    
+    # Rule 3: Urban Density Check - FIXED to allow hybrid systems
+    elif params['city_type'] == METRO_CITY_TYPE:
+        # Check if there's enough potential for both storage and recharge
+        household_demand = params['household_size'] * 135 * 20  # 20-day buffer
+        if annual_potential > household_demand * 2:  # If potential is more than 2x household demand
+            recommendation_type = "Hybrid System"
+            reason = "High-density urban area with sufficient rainfall potential for both storage and groundwater recharge to mitigate flooding."
+        else:
+            recommendation_type = "Storage Only"
+            reason = "High-density urban area with limited rainfall potential - prioritizing direct water storage for household use."
+    
+    # Rule 4: Default - Hybrid System
+    else:
+        recommendation_type = "Hybrid System"
+        reason = "Optimal balance of direct use and groundwater recharge."
+    
+    # 3. Calculate System Volumes Based on Recommendation
+    if recommendation_type == "Storage Only":
+        volume_to_store = annual_potential
+        volume_to_recharge = 0
+    elif recommendation_type == "Recharge Only":
+        volume_to_store = 0
+        volume_to_recharge = annual_potential
+    else:  # Hybrid System
+        # Calculate household demand for 20-day buffer
+        demand_liters = params['household_size'] * 135 * 20  # 135 LPCD standard
+        volume_to_store = min(demand_liters, annual_potential * 0.6)  # Increased from 0.5 to 0.6
+        volume_to_recharge = annual_potential - volume_to_store
+    
+    return {
+        'recommendation_type': recommendation_type,
+        'reason': reason,
+        'annual_potential': annual_potential,
+        'volume_to_store': volume_to_store,
+        'volume_to_recharge': volume_to_recharge,
+        'household_demand_20_days': params['household_size'] * 135 * 20,
+        'efficiency_rating': calculate_efficiency_rating(annual_potential, params)
+    }
+
+
+def calculate_efficiency_rating(potential, params):
+    """Calculate system efficiency rating."""
+    annual_household_demand = params['household_size'] * 135 * 365
+    potential_coverage = (potential / annual_household_demand) * 100
+    
+    if potential_coverage >= 80:
+        return "Excellent"
+    elif potential_coverage >= 60:
+        return "Good"
+    elif potential_coverage >= 40:
+        return "Fair"
+    else:
+        return "Limited"
+
+# --- DESIGN AND COST CALCULATIONS ---
+
+
+def calculate_design_and_cost(recommendation_result, params):
+    """Calculate system design specifications and costs."""
+    design = {}
+    cost_breakdown = {}
+    
+    # Storage System Design
+    if recommendation_result['volume_to_store'] > 0:
+        tank_volume_liters = recommendation_result['volume_to_store']
+        tank_volume_m3 = tank_volume_liters / 1000
+        
+        # Calculate optimal cylindrical tank dimensions (height ≈ diameter for efficiency)
+        radius = (tank_volume_m3 / (math.pi * 1.2))**(1/3)  # Assume height = 1.2 * diameter
+        diameter = radius * 2
+        height = tank_volume_m3 / (math.pi * radius**2)
+        
+        design['storage_tank'] = {
+            'volume_liters': tank_volume_liters,
+            'volume_m3': tank_volume_m3,
+            'dimensions': f"{diameter:.1f}m Diameter × {height:.1f}m Height",
+            'type': 'Cylindrical HDPE/Concrete Tank'
+        }
+        
+        # Storage costs (₹4 per liter for HDPE, ₹6 per liter for concrete if >5000L)
+        if tank_volume_liters > 5000:
+            cost_breakdown['storage_tank'] = tank_volume_liters * 6  # Concrete tank
+        else:
+            cost_breakdown['storage_tank'] = tank_volume_liters * 4  # HDPE tank
+    
+    # Recharge System Design
+    if recommendation_result['volume_to_recharge'] > 0:
+        recharge_volume_m3 = recommendation_result['volume_to_recharge'] / 1000
+        
+        # Design recharge pit (assume 2m diameter, calculate required depth)
+        pit_diameter = 2.0
+        pit_area = math.pi * (pit_diameter / 2)**2
+        pit_depth = min(recharge_volume_m3 / pit_area, 4.0)  # Max 4m depth
+        
+        # If single pit is too deep, suggest multiple pits
+        if recharge_volume_m3 / pit_area > 4.0:
+            num_pits = math.ceil(recharge_volume_m3 / (pit_area * 4.0))
+            pit_depth = 4.0
+            design['recharge_system'] = {
+                'volume_m3': recharge_volume_m3,
+                'configuration': f"{num_pits} Recharge Pits",
+                'dimensions': f"Each: {pit_diameter}m Diameter × {pit_depth}m Depth",
+                'total_area': f"{num_pits * pit_area:.1f} m²"
+            }
+        else:
+            design['recharge_system'] = {
+                'volume_m3': recharge_volume_m3,
+                'configuration': "Single Recharge Pit",
+                'dimensions': f"{pit_diameter}m Diameter × {pit_depth:.1f}m Depth",
+                'total_area': f"{pit_area:.1f} m²"
+            }
+        
+        # Recharge costs (₹2500 per cubic meter)
+        cost_breakdown['recharge_system'] = recharge_volume_m3 * 2500
+    
+    # Fixed Components
+    cost_breakdown['first_flush_diverter'] = 3500
+    cost_breakdown['filtration_system'] = 4500
+    cost_breakdown['guttering_and_pipes'] = params['area'] * 15  # ₹15 per m² of catchment
+    cost_breakdown['installation_labor'] = sum(cost_breakdown.values()) * 0.15  # 15% of material cost
+    
+    total_cost = sum(cost_breakdown.values())
+    
+    # Enhanced Financial Analysis - considers both storage and recharge benefits
+    stored_water_m3_annual = recommendation_result['volume_to_store'] / 1000
+    recharged_water_m3_annual = recommendation_result['volume_to_recharge'] / 1000
+    
+    # Direct savings from stored water
+    direct_water_savings = stored_water_m3_annual * params['water_cost_per_m3']
+    
+    # Indirect benefits from groundwater recharge (estimated monetary value)
+    # Benefits: reduced flooding, groundwater table improvement, reduced municipal water stress
+    recharge_benefits = 0
+    if recharged_water_m3_annual > 0:
+        # Conservative estimate: ₹5 per m³ of recharged water in indirect benefits
+        # (flood mitigation, groundwater improvement, environmental benefits)
+        recharge_benefits = recharged_water_m3_annual * 5
+    
+    # Total annual savings/benefits
+    total_annual_savings = direct_water_savings + recharge_benefits
+    
+    # Financial metrics
+    payback_period = total_cost / total_annual_savings if total_annual_savings > 0 else float('inf')
+    
+    # Calculate 10-year ROI
+    if payback_period != float('inf') and payback_period > 0:
+        # ROI = (Total 10-year savings - Initial investment) / Initial investment * 100
+        total_10_year_savings = total_annual_savings * 10
+        maintenance_10_year = (total_cost * 0.02) * 10  # 2% annual maintenance for 10 years
+        net_10_year_benefit = total_10_year_savings - maintenance_10_year - total_cost
+        roi_10_year = (net_10_year_benefit / total_cost) * 100
+    else:
+        roi_10_year = -100  # Negative ROI if no payback
+    
+    return {
+        'design': design,
+        'cost_breakdown': cost_breakdown,
+        'total_cost': total_cost,
+        'annual_savings': total_annual_savings,  # Now includes both direct and indirect benefits
+        'direct_water_savings': direct_water_savings,
+        'recharge_benefits': recharge_benefits,
+        'payback_period_years': payback_period,
+        'roi_10_year': roi_10_year,  # Added missing ROI calculation
+        'flood_mitigation_benefit': recommendation_result['volume_to_recharge'] > 0,
+        'groundwater_recharge_m3_annual': recharged_water_m3_annual,
+        'maintenance_cost_annual': total_cost * 0.02  # 2% of system cost annually
+    }
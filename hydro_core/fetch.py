@@ -0,0 +1,79 @@
+"""
+Concurrent external-data fetch stage for Hydro-Assess
+Starts every independent site lookup (rainfall, soil, ...) at once on a shared
+thread pool and waits for all of them under a single overall deadline, so the
+user waits for the slowest source rather than the sum of all of them.
+Each source reports its own status; a slow or failing source never hides the
+results of the others.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+# Default overall deadline for one site's lookups (seconds)
+DEFAULT_DEADLINE_S = 20.0
+
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('HYDRO_FETCH_WORKERS', 8)),
+    thread_name_prefix='site-fetch'
+)
+
+
+class SourceResult:
+    """Outcome of one lookup: status is 'ok', 'empty' (no data), 'error' or 'timeout'."""
+
+    __slots__ = ('name', 'status', 'value', 'error', 'elapsed')
+
+    def __init__(self, name: str, status: str, value: Any = None,
+                 error: Optional[str] = None, elapsed: float = 0.0):
+        self.name = name
+        self.status = status
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 'ok'
+
+    def __repr__(self):
+        return f"SourceResult({self.name!r}, {self.status!r}, elapsed={self.elapsed:.2f}s)"
+
+
+def _timed_call(fn: Callable[[], Any]):
+    start = time.monotonic()
+    try:
+        return fn(), None, time.monotonic() - start
+    except Exception as e:
+        return None, str(e) or type(e).__name__, time.monotonic() - start
+
+
+def fetch_all(sources: Dict[str, Callable[[], Any]],
+              deadline: float = DEFAULT_DEADLINE_S) -> Dict[str, SourceResult]:
+    """Run every source concurrently and collect what finished before the deadline.
+
+    Sources still running at the deadline are reported as 'timeout'; they keep
+    running in the background, so their results still land in the caches for
+    the next request.
+    """
+    futures = {name: _executor.submit(_timed_call, fn) for name, fn in sources.items()}
+    done, _ = wait(futures.values(), timeout=deadline)
+
+    results = {}
+    for name, future in futures.items():
+        if future not in done:
+            future.cancel()
+            results[name] = SourceResult(name, 'timeout', error=f"no response within {deadline:g} s",
+                                         elapsed=deadline)
+            continue
+        value, error, elapsed = future.result()
+        if error is not None:
+            status = 'error'
+        elif value is None:
+            status = 'empty'
+        else:
+            status = 'ok'
+        results[name] = SourceResult(name, status, value, error, elapsed)
+    return results
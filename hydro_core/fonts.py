@@ -0,0 +1,297 @@
+"""
+Bundled PDF report fonts for Hydro-Assess
+Unicode fonts for the report languages ship in a versioned font directory
+whose manifest records each file's SHA-256. Reports only ever read these
+files, and they are checksummed once per process at startup. A missing or
+damaged font is reported there instead of being downloaded while a user
+waits for a PDF.
+
+Directory layout (HYDRO_FONT_DIR):
+    manifest.json   {"version": 1, "fonts": {"hi": {"name": "NotoSansDevanagari",
+                     "file": "NotoSansDevanagari-Regular.subset.ttf",
+                     "sha256": "...", "source": "...", "glyphs": 312}}}
+    *.ttf           TrueType fonts, subset to the characters the reports use
+
+Fonts are added or refreshed from an upstream TTF with
+    python -m hydro_core.fonts hi /path/to/NotoSansDevanagari-Regular.ttf --text locales.py
+which subsets it to the language's script block plus every character of the
+given text files (needs fontTools), writes it into the directory and bumps
+the manifest version.
+
+Until a language's font is bundled, reports fall back to an installed system
+font, then to the upstream Noto font downloaded once into the cache directory
+(fetch_upstream_font; not in HYDRO_OFFLINE mode). A language with none of
+these is not offered for PDFs (see pdf_generator.report_language_available).
+
+Configuration (environment variables):
+    HYDRO_FONT_DIR       Font directory (default: fonts/ next to hydro_core)
+    HYDRO_REQUIRE_FONTS  Set to 1 to fail at startup when a report language
+                         has no valid bundled font (default: warn and fall
+                         back to system or downloaded fonts)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import urllib.request
+from typing import Dict, Iterable, NamedTuple, Optional, Set
+
+DEFAULT_FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fonts')
+MANIFEST_FILE_NAME = 'manifest.json'
+
+# Languages whose reports need a non-Latin font, with the Unicode block of their script
+SCRIPT_RANGES = {
+    'hi': (0x0900, 0x097F),  # Devanagari
+    'ta': (0x0B80, 0x0BFF),  # Tamil
+}
+
+# Upstream fonts downloaded when a language has no bundled font (the hinted Noto TTFs, OFL)
+UPSTREAM_FONT_URLS = {
+    'hi': 'https://github.com/googlefonts/noto-fonts/raw/main/hinted/ttf/NotoSansDevanagari/NotoSansDevanagari-Regular.ttf',
+    'ta': 'https://github.com/googlefonts/noto-fonts/raw/main/hinted/ttf/NotoSansTamil/NotoSansTamil-Regular.ttf',
+}
+DOWNLOAD_TIMEOUT_S = 30
+
+# First bytes of a TrueType font file ('true' for old Apple fonts)
+_TRUETYPE_MAGIC = (b'\x00\x01\x00\x00', b'true')
+
+# Characters outside the report strings that reports print (units, currency, punctuation)
+EXTRA_CHARACTERS = '₹°²³×–—•…‘’“”'
+
+
+class FontAssetError(Exception):
+    """A required report font is missing from the font directory or fails its checksum."""
+
+
+class FontAsset(NamedTuple):
+    language: str
+    name: str
+    path: str
+    sha256: str
+    version: int
+
+
+def font_directory() -> str:
+    return os.environ.get('HYDRO_FONT_DIR') or DEFAULT_FONT_DIR
+
+
+def fonts_required() -> bool:
+    return os.environ.get('HYDRO_REQUIRE_FONTS', '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(directory: Optional[str] = None) -> Dict:
+    """The directory's manifest, or an empty one if there is none."""
+    path = os.path.join(directory or font_directory(), MANIFEST_FILE_NAME)
+    if not os.path.exists(path):
+        return {'version': 0, 'fonts': {}}
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    manifest.setdefault('version', 0)
+    manifest.setdefault('fonts', {})
+    return manifest
+
+
+def _verify(directory: str) -> Dict[str, object]:
+    """Per report language: its FontAsset, or a string saying why there is none."""
+    try:
+        manifest = load_manifest(directory)
+    except (OSError, ValueError) as e:
+        return {language: f"unreadable manifest: {e}" for language in SCRIPT_RANGES}
+
+    results: Dict[str, object] = {}
+    for language in SCRIPT_RANGES:
+        entry = manifest['fonts'].get(language)
+        if entry is None:
+            results[language] = "no font in manifest"
+            continue
+        path = os.path.join(directory, entry['file'])
+        if not os.path.exists(path):
+            results[language] = f"missing file {entry['file']}"
+            continue
+        actual = _sha256_file(path)
+        if actual != entry['sha256']:
+            results[language] = f"checksum mismatch for {entry['file']}"
+            continue
+        results[language] = FontAsset(language, entry['name'], path, actual, int(manifest['version']))
+    return results
+
+
+_verified: Dict[str, Dict[str, object]] = {}
+_verified_lock = threading.Lock()
+
+
+def verify_fonts(directory: Optional[str] = None) -> Dict[str, object]:
+    """Checksummed status of every report language's font, computed once per directory and process."""
+    directory = directory or font_directory()
+    with _verified_lock:
+        results = _verified.get(directory)
+        if results is None:
+            results = _verified[directory] = _verify(directory)
+        return results
+
+
+def font_for(language: str, directory: Optional[str] = None) -> Optional[FontAsset]:
+    """The verified bundled font for `language`, or None (English needs none)."""
+    result = verify_fonts(directory).get(language)
+    return result if isinstance(result, FontAsset) else None
+
+
+_checked = False
+
+
+def check_fonts(directory: Optional[str] = None, required: Optional[bool] = None) -> Dict[str, object]:
+    """Startup check of the bundled fonts; raises FontAssetError on problems when fonts are required.
+
+    Verification is cached, so calling this on every page load costs nothing
+    after the first call. Problems are printed once per process.
+    """
+    global _checked
+
+    results = verify_fonts(directory)
+    problems = {language: status for language, status in results.items() if not isinstance(status, FontAsset)}
+    if problems and (fonts_required() if required is None else required):
+        raise FontAssetError("Report fonts unavailable in " + (directory or font_directory()) + ": "
+                             + "; ".join(f"{language}: {status}" for language, status in sorted(problems.items())))
+    if not _checked:
+        _checked = True
+        for language, status in sorted(results.items()):
+            if isinstance(status, FontAsset):
+                print(f"Report font for '{language}': {status.name} (v{status.version})")
+            else:
+                print(f"⚠️  No bundled report font for '{language}' ({status}); "
+                      f"its PDFs use a system font or download {os.path.basename(UPSTREAM_FONT_URLS[language])}")
+    return results
+
+
+_fetched: Dict[str, Optional[str]] = {}
+_fetch_lock = threading.Lock()
+
+
+def fetch_upstream_font(language: str) -> Optional[str]:
+    """Path of the upstream Noto font for `language`, downloaded once into the cache directory.
+
+    The fallback for languages whose font is not bundled yet. Returns None if
+    the download fails (tried once per process), in offline mode, or if there
+    is no cache directory to keep the file in.
+    """
+    from .cache import cache_directory, is_offline
+
+    url = UPSTREAM_FONT_URLS.get(language)
+    directory = cache_directory()
+    if url is None or directory is None:
+        return None
+    path = os.path.join(directory, 'fonts', os.path.basename(url))
+    with _fetch_lock:
+        if language in _fetched:
+            return _fetched[language]
+        if not os.path.exists(path):
+            if is_offline():
+                return None
+            print(f"Downloading report font: {url}")
+            try:
+                with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT_S) as response:
+                    data = response.read()
+                if not data.startswith(_TRUETYPE_MAGIC):
+                    raise ValueError("not a TrueType font")
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(data)
+                os.replace(path + '.tmp', path)
+            except (OSError, ValueError) as e:
+                print(f"Report font download failed: {e}")
+                path = None
+        _fetched[language] = path
+        return path
+
+
+def report_charset(language: str, texts: Iterable[str] = ()) -> Set[int]:
+    """Code points a report in `language` can print: its script block, ASCII, and every character of `texts`."""
+    start, end = SCRIPT_RANGES[language]
+    codepoints = set(range(start, end + 1)) | set(range(0x20, 0x7F)) | {ord(c) for c in EXTRA_CHARACTERS}
+    for text in texts:
+        codepoints.update(ord(c) for c in text if c >= ' ')
+    return codepoints
+
+
+def build_font(language: str, source: str, texts: Iterable[str] = (),
+               directory: Optional[str] = None) -> FontAsset:
+    """Subset `source` to `language`'s report charset, add it to the font directory and bump its version.
+
+    `texts` are the strings reports print (e.g. the translation tables); the
+    core package does not know them itself.
+    """
+    from fontTools import subset
+
+    directory = directory or font_directory()
+    os.makedirs(directory, exist_ok=True)
+
+    options = subset.Options()
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    font = subset.load_font(source, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=report_charset(language, texts))
+    subsetter.subset(font)
+
+    name = os.path.splitext(os.path.basename(source))[0]
+    file_name = f"{name}.subset.ttf"
+    path = os.path.join(directory, file_name)
+    tmp_path = path + '.tmp'
+    subset.save_font(font, tmp_path, options)
+    os.replace(tmp_path, path)
+
+    manifest = load_manifest(directory)
+    manifest['version'] = int(manifest['version']) + 1
+    manifest['fonts'][language] = {
+        'name': name.split('-')[0],
+        'file': file_name,
+        'sha256': _sha256_file(path),
+        'source': os.path.basename(source),
+        'glyphs': len(font.getGlyphOrder()),
+    }
+    tmp_manifest = os.path.join(directory, MANIFEST_FILE_NAME + '.tmp')
+    with open(tmp_manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_manifest, os.path.join(directory, MANIFEST_FILE_NAME))
+
+    with _verified_lock:
+        _verified.pop(directory, None)
+    return FontAsset(language, manifest['fonts'][language]['name'], path,
+                     manifest['fonts'][language]['sha256'], manifest['version'])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m hydro_core.fonts',
+                                     description="Add a subset report font to the bundled font directory.")
+    parser.add_argument('language', choices=sorted(SCRIPT_RANGES), help="Report language the font is for")
+    parser.add_argument('source', help="Upstream TrueType font file")
+    parser.add_argument('--text', action='append', default=[], metavar='FILE',
+                        help="UTF-8 file whose characters reports print, e.g. locales.py (repeatable)")
+    parser.add_argument('--font-dir', help="Font directory (default: HYDRO_FONT_DIR or fonts/)")
+    args = parser.parse_args(argv)
+
+    texts = []
+    for path in args.text:
+        with open(path, encoding='utf-8') as f:
+            texts.append(f.read())
+    asset = build_font(args.language, args.source, texts, args.font_dir)
+    print(f"{asset.path}: {os.path.getsize(asset.path) / 1024:,.0f} KiB, "
+          f"sha256 {asset.sha256[:12]}…, manifest v{asset.version}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+Streaming GeoJSON reader for Hydro-Assess
+Reads groundwater layers feature by feature instead of loading the whole
+document, keeping only the columns the assessment uses:
+
+    post_monsoon_depth_m, pre_monsoon_depth_m    float64 arrays (NaN if missing)
+    principal_aquifer_type, aquifer_yield        dictionary-encoded int32 codes
+    lat, lon                                     float64 arrays
+
+Peak memory is the read buffer plus those arrays, independent of how many
+other properties or how much geometry detail the file carries.
+
+Accepts a FeatureCollection (the `features` array is streamed), newline-
+delimited GeoJSON (one Feature per line) and RFC 8142 text sequences. Only
+WGS84 coordinates are accepted; a seekable input is searched for a `crs`
+member before its features are read, wherever in the document it appears.
+"""
+
+import json
+from array import array
+from typing import Dict, Iterator, Optional, TextIO
+
+import numpy as np
+
+NUMERIC_COLUMNS = ('post_monsoon_depth_m', 'pre_monsoon_depth_m')
+CATEGORICAL_COLUMNS = ('principal_aquifer_type', 'aquifer_yield')
+
+# Characters read from the stream at a time
+CHUNK_CHARS = 1 << 20
+
+_WHITESPACE = ' \t\r\n\x1e\ufeff'
+_WGS84_CRS_NAMES = ('urn:ogc:def:crs:OGC:1.3:CRS84', 'urn:ogc:def:crs:OGC::CRS84',
+                    'urn:ogc:def:crs:EPSG::4326', 'EPSG:4326')
+
+_decoder = json.JSONDecoder()
+
+
+class GeoJSONStreamError(ValueError):
+    """The input is not valid GeoJSON for a groundwater layer."""
+
+
+class _Scanner:
+    """Incremental JSON tokenizer over a text stream."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, chars: int = CHUNK_CHARS) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(max(chars, CHUNK_CHARS))
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has been consumed so the buffer stays about one chunk long
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next significant character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def take(self, expected: str):
+        found = self.peek()
+        if found not in expected:
+            raise GeoJSONStreamError(f"expected one of {expected!r} but found {found or 'end of input'!r}")
+        self.pos += 1
+        return found
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        want = CHUNK_CHARS
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # A value touching the end of the buffer (e.g. a number) may continue in the next chunk
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise GeoJSONStreamError(f"invalid JSON: {e}") from e
+            self._fill(want)
+            want *= 2
+
+
+def _check_crs(crs):
+    name = ((crs or {}).get('properties') or {}).get('name', '')
+    if name and name not in _WGS84_CRS_NAMES:
+        raise GeoJSONStreamError(f"unsupported CRS {name!r}; coordinates must be WGS84 longitude/latitude")
+
+
+def _prescan_crs(stream: TextIO):
+    """Check every `crs` member of a seekable stream before any feature is read.
+
+    A FeatureCollection may declare its CRS after `features`; finding it with
+    a plain text search first rejects a projected layer before its features
+    are parsed. The stream is left where it was.
+    """
+    start = stream.tell()
+    scanner = _Scanner(stream)
+    try:
+        while True:
+            found = scanner.buf.find('"crs"', scanner.pos)
+            if found == -1:
+                # Keep a few characters in case the key straddles two chunks
+                scanner.pos = max(scanner.pos, len(scanner.buf) - 4)
+                if not scanner._fill():
+                    return
+                continue
+            scanner.pos = found + len('"crs"')
+            if scanner.peek() != ':':
+                continue
+            scanner.take(':')
+            try:
+                crs = scanner.value()
+            except GeoJSONStreamError:
+                return  # malformed input is reported by the real parse
+            if isinstance(crs, dict):
+                _check_crs(crs)
+    finally:
+        stream.seek(start)
+
+
+def iter_features(stream: TextIO) -> Iterator[dict]:
+    """Yield every Feature in the stream without materializing the document."""
+    if stream.seekable():
+        _prescan_crs(stream)
+    scanner = _Scanner(stream)
+    while scanner.peek():
+        scanner.take('{')
+        members = {}
+        if scanner.peek() == '}':
+            scanner.take('}')
+        else:
+            while True:
+                key = scanner.value()
+                if not isinstance(key, str):
+                    raise GeoJSONStreamError("object keys must be strings")
+                scanner.take(':')
+                if key == 'features' and scanner.peek() == '[':
+                    scanner.take('[')
+                    if scanner.peek() == ']':
+                        scanner.take(']')
+                    else:
+                        while True:
+                            yield scanner.value()
+                            if scanner.take(',]') == ']':
+                                break
+                else:
+                    members[key] = scanner.value()
+                    if key == 'crs':
+                        _check_crs(members[key])
+                if scanner.take(',}') == '}':
+                    break
+        if members.get('type') == 'Feature':
+            yield members
+
+
+class GroundwaterColumns:
+    """Column arrays of a groundwater layer, as read by read_groundwater_columns."""
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, numeric: Dict[str, np.ndarray],
+                 categorical: Dict[str, tuple], seen: set):
+        self.lat = lat
+        self.lon = lon
+        self.numeric = numeric          # column -> float64 values
+        self.categorical = categorical  # column -> (int32 codes, list of categories); -1 = missing
+        self.columns = [c for c in NUMERIC_COLUMNS + CATEGORICAL_COLUMNS if c in seen]
+
+    def __len__(self):
+        return len(self.lat)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.lat, self.lon, *self.numeric.values(), *(c for c, _ in self.categorical.values())]
+        return sum(a.nbytes for a in arrays)
+
+    def to_geodataframe(self):
+        """Point GeoDataFrame (EPSG:4326) holding only the columns present in the file."""
+        import geopandas as gpd
+        import pandas as pd
+
+        data = {}
+        for column in self.columns:
+            if column in self.numeric:
+                data[column] = self.numeric[column]
+            else:
+                codes, categories = self.categorical[column]
+                data[column] = pd.Categorical.from_codes(codes, categories)
+        return gpd.GeoDataFrame(data, geometry=gpd.points_from_xy(self.lon, self.lat), crs='EPSG:4326')
+
+
+def _feature_point(geometry: Optional[dict]):
+    """(lat, lon) of a feature; non-point geometries use a point inside them."""
+    if not geometry:
+        return None
+    if geometry.get('type') == 'Point':
+        coords = geometry.get('coordinates') or []
+        if len(coords) < 2:
+            return None
+        return float(coords[1]), float(coords[0])
+    from shapely.geometry import shape
+
+    try:
+        geom = shape(geometry)
+    except (ValueError, TypeError, AttributeError, KeyError):
+        return None
+    if geom.is_empty:
+        return None
+    point = geom.representative_point()
+    return point.y, point.x
+
+
+def read_groundwater_columns(stream: TextIO) -> GroundwaterColumns:
+    """Stream a GeoJSON/NDJSON groundwater layer into compact column arrays.
+
+    Features without a usable geometry are skipped. Raises GeoJSONStreamError
+    for malformed input.
+    """
+    lat = array('d')
+    lon = array('d')
+    numeric = {column: array('d') for column in NUMERIC_COLUMNS}
+    codes = {column: array('i') for column in CATEGORICAL_COLUMNS}
+    categories: Dict[str, Dict[str, int]] = {column: {} for column in CATEGORICAL_COLUMNS}
+    seen = set()
+
+    for feature in iter_features(stream):
+        if not isinstance(feature, dict):
+            raise GeoJSONStreamError("features must be objects")
+        point = _feature_point(feature.get('geometry'))
+        if point is None:
+            continue
+        lat.append(point[0])
+        lon.append(point[1])
+
+        properties = feature.get('properties') or {}
+        for column, values in numeric.items():
+            value = properties.get(column)
+            if column in properties:
+                seen.add(column)
+            try:
+                values.append(float(value))
+            except (TypeError, ValueError):
+                values.append(float('nan'))
+        for column, column_codes in codes.items():
+            value = properties.get(column)
+            if column in properties:
+                seen.add(column)
+            if value is None:
+                column_codes.append(-1)
+            else:
+                column_codes.append(categories[column].setdefault(str(value), len(categories[column])))
+
+    def as_numpy(values: array, dtype) -> np.ndarray:
+        return np.frombuffer(values, dtype=dtype).copy() if len(values) else np.empty(0, dtype=dtype)
+
+    categorical: Dict[str, tuple] = {
+        column: (as_numpy(codes[column], np.int32), list(categories[column]))
+        for column in CATEGORICAL_COLUMNS
+    }
+    return GroundwaterColumns(
+        as_numpy(lat, np.float64), as_numpy(lon, np.float64),
+        {column: as_numpy(values, np.float64) for column, values in numeric.items()},
+        categorical, seen
+    )
+
+
+def read_groundwater_file(path: str) -> GroundwaterColumns:
+    """read_groundwater_columns for a file on disk."""
+    with open(path, encoding='utf-8-sig') as f:
+        return read_groundwater_columns(f)
+
@@ -0,0 +1,51 @@
+"""
+Spatial grid snapping for Hydro-Assess
+External climate and soil datasets are far coarser than a map click, so
+coordinates are snapped to the dataset's native grid before cache lookup and
+fetch. Nearby sites then share one cache entry and one download.
+
+Configuration (environment variables):
+    HYDRO_RAINFALL_GRID_DEG  Rainfall grid spacing in degrees (default: 0.1, the
+                             ERA5-Land grid behind Open-Meteo's archive)
+    HYDRO_SOIL_GRID_M        Soil grid spacing in metres (default: 250, the
+                             SoilGrids resolution)
+Set either to 0 to disable snapping for that dataset.
+"""
+
+import math
+import os
+from typing import Tuple
+
+METRES_PER_DEGREE_LAT = 111320.0
+
+# Coordinates are always rounded to this many decimals (~11 m) so float noise
+# from widgets and maps does not defeat the cache, even with snapping disabled
+COORD_DECIMALS = 4
+
+
+class GridSpec:
+    """Regular latitude/longitude grid with nodes at multiples of `step_deg`."""
+
+    def __init__(self, name: str, step_deg: float):
+        self.name = name
+        self.step_deg = step_deg
+
+    @classmethod
+    def from_metres(cls, name: str, step_m: float) -> 'GridSpec':
+        """Grid whose north-south spacing is `step_m` metres."""
+        return cls(name, step_m / METRES_PER_DEGREE_LAT)
+
+    def snap(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Return the grid node nearest to (lat, lon)."""
+        lat, lon = float(lat), float(lon)
+        if self.step_deg > 0:
+            lat = math.floor(lat / self.step_deg + 0.5) * self.step_deg
+            lon = math.floor(lon / self.step_deg + 0.5) * self.step_deg
+        return round(lat, COORD_DECIMALS), round(lon, COORD_DECIMALS)
+
+    def __repr__(self):
+        return f"GridSpec({self.name!r}, step_deg={self.step_deg:g})"
+
+
+RAINFALL_GRID = GridSpec('ERA5-Land', float(os.environ.get('HYDRO_RAINFALL_GRID_DEG', 0.1)))
+SOIL_GRID = GridSpec.from_metres('SoilGrids', float(os.environ.get('HYDRO_SOIL_GRID_M', 250)))
@@ -0,0 +1,189 @@
+"""
+Groundwater data for Hydro-Assess
+Simulated groundwater levels for sites without local survey data, and
+nearest-point lookup in an uploaded groundwater dataset (e.g. meerut.geojson).
+
+Uploaded layers are indexed once with an STRtree; a lookup takes the planar
+nearest well as a first guess and then refines by great-circle distance over
+the few wells inside the matching search box, so it stays logarithmic in the
+number of wells and is exact in metres rather than in degrees.
+
+Depths can instead be interpolated from several nearby wells (see
+interpolation.py); HYDRO_GW_INTERPOLATION selects 'idw' (default), 'kriging'
+or 'nearest' (copy the nearest well's values).
+"""
+
+import math
+import os
+import threading
+import weakref
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+METRES_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+
+# Indexed layers kept alive at once (one per uploaded dataset in practice)
+MAX_CACHED_INDEXES = 8
+
+GROUNDWATER_INTERPOLATION = os.environ.get('HYDRO_GW_INTERPOLATION', 'idw').strip().lower()
+
+
+def get_groundwater_data(lat, lon):
+    """Generate simulated groundwater data."""
+    # Create realistic variation based on coordinates
+    depth_base = 10 + ((lat + lon) % 15)
+    seasonal_variation = 2 * np.sin((lat * lon) % 6.28)
+    post_monsoon_depth = max(3, depth_base + seasonal_variation)
+
+    # Determine aquifer type based on location
+    if lat > 25:  # Northern India
+        aquifer_type = "Alluvial Plains"
+    elif lat < 20:  # Southern India
+        aquifer_type = "Hard Rock (Crystalline)"
+    else:
+        aquifer_type = "Mixed Aquifer System"
+
+    return {
+        'post_monsoon_depth_m': post_monsoon_depth,
+        'pre_monsoon_depth_m': post_monsoon_depth + 2,
+        'principal_aquifer_type': aquifer_type,
+        'aquifer_yield': 'Moderate' if post_monsoon_depth < 15 else 'Low'
+    }
+
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    """Great-circle distance in metres; works elementwise on arrays."""
+    lat1, lon1, lat2, lon2 = (np.radians(v) for v in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GroundwaterIndex:
+    """Spatial index over the wells of a groundwater GeoDataFrame.
+
+    Non-point geometries are represented by a point guaranteed to lie inside
+    them. Build it once per dataset (see get_groundwater_index).
+    """
+
+    def __init__(self, gdf):
+        from shapely import STRtree
+
+        geometry = gdf.geometry
+        valid = ~(geometry.isna() | geometry.is_empty).to_numpy()
+        if not valid.any():
+            raise ValueError("groundwater data has no geometries")
+        points = geometry[valid].representative_point()
+        # Plain attribute table, so the index does not keep the GeoDataFrame alive
+        self.attributes = gdf.drop(columns=gdf.geometry.name).reset_index(drop=True)
+        self.positions = np.flatnonzero(valid)  # row positions in gdf
+        self.lat = points.y.to_numpy(dtype=np.float64)
+        self.lon = points.x.to_numpy(dtype=np.float64)
+        self._points = points.to_numpy()
+        self._tree = STRtree(self._points)
+
+    def __len__(self):
+        return len(self.lat)
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Row positions in `attributes` and distances (m) of the k nearest wells."""
+        from shapely import box
+        from shapely.geometry import Point
+
+        k = min(k, len(self))
+        first = self._tree.query_nearest(Point(lon, lat), all_matches=False)[0]
+        radius = max(float(haversine_m(lat, lon, self.lat[first], self.lon[first])), 1.0)
+        while True:
+            # Box containing every point within `radius` metres of the site
+            lat_span = radius / METRES_PER_DEGREE
+            cos_lat = math.cos(math.radians(min(abs(lat) + lat_span, 90.0)))
+            lon_span = min(radius / (METRES_PER_DEGREE * max(cos_lat, 1e-9)), 360.0)
+            candidates = self._tree.query(box(lon - lon_span, lat - lat_span,
+                                              lon + lon_span, lat + lat_span))
+            distances = haversine_m(lat, lon, self.lat[candidates], self.lon[candidates])
+            if np.count_nonzero(distances <= radius) >= k or len(candidates) == len(self):
+                break
+            radius *= 2
+
+        order = np.argsort(distances, kind='stable')[:k]
+        return self.positions[candidates[order]], distances[order]
+
+    def query(self, lat: float, lon: float) -> Dict:
+        """Groundwater attributes of the nearest well, with the calculator's defaults."""
+        positions, distances = self.nearest(lat, lon)
+        nearest_data = self.attributes.iloc[positions[0]]
+        return {
+            'post_monsoon_depth_m': float(nearest_data.get('post_monsoon_depth_m', 12)),
+            'pre_monsoon_depth_m': float(nearest_data.get('pre_monsoon_depth_m', 14)),
+            'principal_aquifer_type': str(nearest_data.get('principal_aquifer_type', 'Unknown')),
+            'aquifer_yield': str(nearest_data.get('aquifer_yield', 'Moderate')),
+            'distance_m': float(distances[0])
+        }
+
+
+class FrameCache:
+    """Objects derived from a GeoDataFrame, built once and reused while it is alive."""
+
+    def __init__(self, build: Callable, max_entries: int = MAX_CACHED_INDEXES):
+        self._build = build
+        self._max_entries = max_entries
+        self._entries: Dict[int, Tuple[weakref.ref, object]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, gdf):
+        key = id(gdf)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is gdf:
+                return entry[1]
+
+        value = self._build(gdf)
+        with self._lock:
+            self._entries[key] = (weakref.ref(gdf), value)
+            # Drop entries whose GeoDataFrame is gone, then the oldest beyond the limit
+            for stale in [k for k, (ref, _) in self._entries.items() if ref() is None]:
+                del self._entries[stale]
+            while len(self._entries) > self._max_entries:
+                del self._entries[next(iter(self._entries))]
+        return value
+
+
+_indexes = FrameCache(GroundwaterIndex)
+
+
+def get_groundwater_index(gdf) -> GroundwaterIndex:
+    """Index for `gdf`, built on first use and reused while the GeoDataFrame is alive."""
+    return _indexes.get(gdf)
+
+
+def query_groundwater(lat, lon, gdf, method: Optional[str] = None,
+                      content_hash: Optional[str] = None) -> Dict:
+    """Groundwater data at (lat, lon) from the wells in `gdf`.
+
+    Depths are interpolated with `method` ('idw', 'kriging' or 'nearest';
+    default HYDRO_GW_INTERPOLATION); aquifer type and yield come from the
+    nearest well. With the upload's `content_hash`, interpolated depths are read
+    from the layer's cached raster (see depth_raster.py), falling back to direct
+    interpolation outside it. Missing attributes get the same defaults as the
+    calculator; errors (empty or malformed data) are raised to the caller.
+    """
+    result = get_groundwater_index(gdf).query(lat, lon)
+    method = method or GROUNDWATER_INTERPOLATION
+    if method == 'nearest':
+        return result
+
+    depths = None
+    if content_hash:
+        from .depth_raster import get_layer_raster
+
+        raster = get_layer_raster(gdf, content_hash, method)
+        depths = raster.sample(lat, lon) if raster is not None else None
+    if depths is None:
+        from .interpolation import get_depth_surface
+
+        estimates = get_depth_surface(gdf).estimate([lat], [lon], method=method)
+        depths = {column: float(values[0]) for column, values in estimates.items()}
+    result.update(depths)
+    return result
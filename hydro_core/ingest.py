@@ -0,0 +1,91 @@
+"""
+Groundwater layer ingestion for Hydro-Assess
+Uploaded groundwater files are parsed, validated and spatially indexed once per
+distinct content. Layers are cached in process memory by the SHA-256 of the
+file, so reruns, re-uploads of the same file and other sessions all reuse the
+same GeoDataFrame (and with it the cached index, depth surface and raster).
+
+Files are read with the streaming reader in geojson_stream.py, so only the
+columns the assessment uses are ever held in memory.
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from typing import List
+
+from .groundwater import GroundwaterIndex, get_groundwater_index
+
+REQUIRED_COLUMNS = ['post_monsoon_depth_m', 'principal_aquifer_type']
+
+# Parsed layers kept in memory at once
+MAX_CACHED_LAYERS = 4
+
+
+class GroundwaterLayerError(ValueError):
+    """The uploaded file could not be parsed or lacks required columns."""
+
+
+class GroundwaterLayer:
+    """A validated, indexed groundwater dataset."""
+
+    __slots__ = ('content_hash', 'gdf', 'index')
+
+    def __init__(self, content_hash: str, gdf, index: GroundwaterIndex):
+        self.content_hash = content_hash
+        self.gdf = gdf
+        self.index = index
+
+    def __len__(self):
+        return len(self.gdf)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def missing_columns(columns) -> List[str]:
+    return [col for col in REQUIRED_COLUMNS if col not in columns]
+
+
+def parse_groundwater_layer(data: bytes, digest: str) -> GroundwaterLayer:
+    """Parse, validate and index one groundwater file (no caching)."""
+    from .geojson_stream import GeoJSONStreamError, read_groundwater_columns
+
+    try:
+        columns = read_groundwater_columns(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8-sig'))
+    except (GeoJSONStreamError, UnicodeDecodeError) as e:
+        raise GroundwaterLayerError(f"Error loading file: {e}") from e
+    missing = missing_columns(columns.columns)
+    if missing:
+        raise GroundwaterLayerError(f"Missing required columns: {missing}")
+    gdf = columns.to_geodataframe()
+    try:
+        index = get_groundwater_index(gdf)
+    except ValueError as e:
+        raise GroundwaterLayerError(str(e)) from e
+    return GroundwaterLayer(digest, gdf, index)
+
+
+_layers: "OrderedDict[str, GroundwaterLayer]" = OrderedDict()
+_layers_lock = threading.Lock()
+
+
+def load_groundwater_layer(data: bytes) -> GroundwaterLayer:
+    """Layer for the file contents `data`, parsed only the first time they are seen.
+
+    Raises GroundwaterLayerError for unreadable files and missing columns.
+    """
+    digest = content_hash(data)
+    with _layers_lock:
+        if digest in _layers:
+            _layers.move_to_end(digest)
+            return _layers[digest]
+
+    layer = parse_groundwater_layer(data, digest)
+    with _layers_lock:
+        _layers[digest] = layer
+        while len(_layers) > MAX_CACHED_LAYERS:
+            _layers.popitem(last=False)
+    return layer
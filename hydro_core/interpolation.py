@@ -0,0 +1,227 @@
+"""
+Groundwater depth interpolation for Hydro-Assess
+Estimates well attributes such as post_monsoon_depth_m at arbitrary points from
+the k nearest wells, either by inverse-distance weighting or by ordinary
+kriging with one exponential variogram fitted to the whole dataset
+("kriging-lite": local neighbourhoods, global variogram).
+
+Everything is vectorized over query points: neighbourhoods for a whole grid or
+batch are found in a few STRtree passes and all kriging systems are solved as
+one stacked linear solve. Surfaces are built once per uploaded dataset and
+cached while its GeoDataFrame is alive.
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .groundwater import METRES_PER_DEGREE, FrameCache, haversine_m
+
+DEPTH_COLUMNS = ('post_monsoon_depth_m', 'pre_monsoon_depth_m')
+
+METHODS = ('idw', 'kriging')
+
+DEFAULT_NEIGHBOURS = 8
+IDW_POWER = 2.0
+
+# Query points handled per vectorized pass (bounds temporary array sizes)
+CHUNK_POINTS = 20000
+
+# Wells sampled when fitting the variogram (pairs grow quadratically)
+VARIOGRAM_SAMPLE = 2000
+VARIOGRAM_BINS = 15
+
+
+class Variogram:
+    """Exponential semivariogram: nugget + psill * (1 - exp(-3h / range))."""
+
+    def __init__(self, nugget: float, psill: float, range_m: float):
+        self.nugget = nugget
+        self.psill = psill
+        self.range_m = range_m
+
+    def __call__(self, h: np.ndarray) -> np.ndarray:
+        gamma = self.nugget + self.psill * (1 - np.exp(-3 * h / self.range_m))
+        return np.where(h > 0, gamma, 0.0)
+
+    @classmethod
+    def fit(cls, lat: np.ndarray, lon: np.ndarray, values: np.ndarray) -> Optional['Variogram']:
+        """Least-squares fit to the binned empirical semivariogram; None if degenerate."""
+        if len(values) > VARIOGRAM_SAMPLE:
+            pick = np.random.default_rng(0).choice(len(values), VARIOGRAM_SAMPLE, replace=False)
+            lat, lon, values = lat[pick], lon[pick], values[pick]
+        i, j = np.triu_indices(len(values), k=1)
+        if len(i) < VARIOGRAM_BINS or np.var(values) == 0:
+            return None
+        h = haversine_m(lat[i], lon[i], lat[j], lon[j])
+        semivariance = 0.5 * (values[i] - values[j]) ** 2
+
+        edges = np.linspace(0, h.max() / 2, VARIOGRAM_BINS + 1)
+        bins = np.digitize(h, edges) - 1
+        used = bins < VARIOGRAM_BINS
+        counts = np.bincount(bins[used], minlength=VARIOGRAM_BINS)
+        sums = np.bincount(bins[used], weights=semivariance[used], minlength=VARIOGRAM_BINS)
+        lags = np.bincount(bins[used], weights=h[used], minlength=VARIOGRAM_BINS)
+        filled = counts > 0
+        if np.count_nonzero(filled) < 3:
+            return None
+        counts, gamma, lags = counts[filled], sums[filled] / counts[filled], lags[filled] / counts[filled]
+
+        # For a fixed range the model is linear in (nugget, psill): scan ranges, solve the rest
+        best = None
+        for range_m in np.geomspace(max(lags[0], 1.0), edges[-1] * 2, 40):
+            design = np.column_stack([np.ones_like(lags), 1 - np.exp(-3 * lags / range_m)])
+            weights = np.sqrt(counts)
+            coef, *_ = np.linalg.lstsq(design * weights[:, None], gamma * weights, rcond=None)
+            nugget, psill = max(coef[0], 0.0), max(coef[1], 0.0)
+            error = np.sum(counts * (design @ np.array([nugget, psill]) - gamma) ** 2)
+            if best is None or error < best[0]:
+                best = (error, nugget, psill, range_m)
+        _, nugget, psill, range_m = best
+        if psill <= 0:
+            return None
+        return cls(nugget, psill, range_m)
+
+
+class WellSurface:
+    """Interpolates one numeric attribute over a set of wells."""
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, values: np.ndarray):
+        from shapely import STRtree, points
+
+        self.lat = lat
+        self.lon = lon
+        self.values = values
+        self._tree = STRtree(points(lon, lat))
+        self._variogram = None
+        self._variogram_fitted = False
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def variogram(self) -> Optional[Variogram]:
+        if not self._variogram_fitted:
+            self._variogram = Variogram.fit(self.lat, self.lon, self.values)
+            self._variogram_fitted = True
+        return self._variogram
+
+    def neighbours(self, lats: np.ndarray, lons: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices and great-circle distances (m) of the k nearest wells, shape (points, k)."""
+        from shapely import box, points
+
+        k = min(k, len(self))
+        m = len(lats)
+        indices = np.empty((m, k), dtype=np.int64)
+        distances = np.empty((m, k))
+
+        # Start from the planar nearest well's distance and grow the radius until k wells fit
+        query, first = self._tree.query_nearest(points(lons, lats), all_matches=False)
+        first = first[np.argsort(query)]
+        radius = np.maximum(haversine_m(lats, lons, self.lat[first], self.lon[first]), 1.0) * math.sqrt(k)
+        pending = np.arange(m)
+        while pending.size:
+            lat_p, lon_p, radius_p = lats[pending], lons[pending], radius[pending]
+            lat_span = radius_p / METRES_PER_DEGREE
+            cos_lat = np.cos(np.radians(np.minimum(np.abs(lat_p) + lat_span, 90.0)))
+            lon_span = np.minimum(radius_p / (METRES_PER_DEGREE * np.maximum(cos_lat, 1e-9)), 360.0)
+            query, well = self._tree.query(box(lon_p - lon_span, lat_p - lat_span,
+                                               lon_p + lon_span, lat_p + lat_span))
+            dist = haversine_m(lat_p[query], lon_p[query], self.lat[well], self.lon[well])
+
+            within = np.bincount(query[dist <= radius_p[query]], minlength=len(pending))
+            found = np.bincount(query, minlength=len(pending))
+            done = (within >= k) | (found == len(self))
+
+            # k smallest distances per finished point: sort by (point, distance), rank within point
+            keep = done[query]
+            query, well, dist = query[keep], well[keep], dist[keep]
+            order = np.lexsort((dist, query))
+            query, well, dist = query[order], well[order], dist[order]
+            rank = np.arange(len(query)) - np.searchsorted(query, query)
+            take = rank < k
+            rows = pending[query[take]]
+            indices[rows, rank[take]] = well[take]
+            distances[rows, rank[take]] = dist[take]
+
+            radius[pending[~done]] *= 2
+            pending = pending[~done]
+        return indices, distances
+
+    def idw(self, indices: np.ndarray, distances: np.ndarray, power: float = IDW_POWER) -> np.ndarray:
+        """Inverse-distance weighted estimates; a well within 1 mm dominates completely."""
+        weights = 1.0 / np.maximum(distances, 1e-3) ** power
+        return (weights * self.values[indices]).sum(axis=1) / weights.sum(axis=1)
+
+    def kriging(self, indices: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        """Ordinary kriging estimates from each point's neighbourhood (IDW if no variogram)."""
+        variogram = self.variogram
+        m, k = indices.shape
+        if variogram is None or k < 3:
+            return self.idw(indices, distances)
+
+        lat, lon = self.lat[indices], self.lon[indices]
+        between = haversine_m(lat[:, :, None], lon[:, :, None], lat[:, None, :], lon[:, None, :])
+        system = np.ones((m, k + 1, k + 1))
+        system[:, :k, :k] = variogram(between)
+        system[:, k, k] = 0.0
+        target = np.ones((m, k + 1, 1))
+        target[:, :k, 0] = variogram(distances)
+        try:
+            weights = np.linalg.solve(system, target)[:, :k, 0]
+        except np.linalg.LinAlgError:
+            # Coincident wells make some systems singular
+            weights = (np.linalg.pinv(system) @ target)[:, :k, 0]
+        estimate = (weights * self.values[indices]).sum(axis=1)
+        # Negative weights can overshoot; stay within the observed range
+        return np.clip(estimate, self.values.min(), self.values.max())
+
+    def estimate(self, lats, lons, method: str = 'idw', k: int = DEFAULT_NEIGHBOURS) -> np.ndarray:
+        if method not in METHODS:
+            raise ValueError(f"unknown interpolation method {method!r}; expected one of {METHODS}")
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        lons = np.asarray(lons, dtype=np.float64).ravel()
+        result = np.empty(len(lats))
+        for start in range(0, len(lats), CHUNK_POINTS):
+            part = slice(start, start + CHUNK_POINTS)
+            indices, distances = self.neighbours(lats[part], lons[part], k)
+            if method == 'kriging':
+                result[part] = self.kriging(indices, distances)
+            else:
+                result[part] = self.idw(indices, distances)
+        return result
+
+
+class DepthSurface:
+    """Interpolated groundwater depths for one well dataset."""
+
+    def __init__(self, gdf):
+        geometry = gdf.geometry
+        valid = ~(geometry.isna() | geometry.is_empty).to_numpy()
+        points = geometry[valid].representative_point()
+        lat = points.y.to_numpy(dtype=np.float64)
+        lon = points.x.to_numpy(dtype=np.float64)
+
+        self.surfaces: Dict[str, WellSurface] = {}
+        for column in DEPTH_COLUMNS:
+            if column not in gdf.columns:
+                continue
+            values = np.asarray(gdf[column].to_numpy()[valid], dtype=np.float64)
+            finite = np.isfinite(values)
+            if finite.any():
+                self.surfaces[column] = WellSurface(lat[finite], lon[finite], values[finite])
+
+    def estimate(self, lats, lons, method: str = 'idw',
+                 k: int = DEFAULT_NEIGHBOURS) -> Dict[str, np.ndarray]:
+        """Estimates of every depth column present in the dataset, one array each."""
+        return {column: surface.estimate(lats, lons, method, k)
+                for column, surface in self.surfaces.items()}
+
+
+_surfaces = FrameCache(DepthSurface)
+
+
+def get_depth_surface(gdf) -> DepthSurface:
+    """Depth surface for `gdf`, built on first use and reused while the GeoDataFrame is alive."""
+    return _surfaces.get(gdf)
@@ -0,0 +1,157 @@
+"""
+Daily rainfall store for Hydro-Assess
+Downloads the Open-Meteo daily precipitation series once per site and year and
+keeps it as a compact NumPy array; annual, monthly and any other aggregates are
+derived from that single array instead of refetching the archive.
+
+Series are cached in process memory and in the persistent disk cache (see
+cache.py), so restarts and other replicas reuse data already downloaded.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .cache import get_disk_cache, is_offline
+from .grid import RAINFALL_GRID
+
+OPEN_METEO_ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+# Last full calendar year used for all rainfall figures
+RAINFALL_YEAR = 2023
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Number of site-years kept in process memory (each is ~1.8 KB)
+MAX_CACHED_SERIES = 1024
+
+
+class DailyRainfall:
+    """Daily precipitation (mm) for one site and calendar year."""
+
+    __slots__ = ('lat', 'lon', 'year', 'precipitation', 'month')
+
+    def __init__(self, lat: float, lon: float, year: int,
+                 precipitation: np.ndarray, month: np.ndarray):
+        self.lat = lat
+        self.lon = lon
+        self.year = year
+        self.precipitation = precipitation  # float32, one value per day
+        self.month = month                  # uint8, 1-12 per day
+
+    def annual_total(self) -> float:
+        """Total rainfall for the year (mm)."""
+        return float(self.precipitation.sum(dtype=np.float64))
+
+    def monthly_totals(self) -> Dict[str, float]:
+        """Rainfall per calendar month (mm), rounded to 0.1 mm."""
+        totals = np.bincount(self.month, weights=self.precipitation, minlength=13)[1:13]
+        return {m: round(float(t), 1) for m, t in zip(MONTHS, totals)}
+
+    def to_bytes(self) -> bytes:
+        """Serialize as the float32 precipitation block followed by the uint8 month block."""
+        return self.precipitation.tobytes() + self.month.tobytes()
+
+    @classmethod
+    def from_bytes(cls, lat: float, lon: float, year: int, blob: bytes) -> 'DailyRainfall':
+        days = len(blob) // 5
+        precipitation = np.frombuffer(blob, dtype=np.float32, count=days)
+        month = np.frombuffer(blob, dtype=np.uint8, offset=days * 4, count=days)
+        return cls(lat, lon, year, precipitation, month)
+
+    def rainy_days(self, threshold_mm: float = 2.5) -> int:
+        """Number of days with at least `threshold_mm` of rain (IMD rainy-day definition)."""
+        return int(np.count_nonzero(self.precipitation >= threshold_mm))
+
+
+def fetch_daily_rainfall(lat: float, lon: float, year: int = RAINFALL_YEAR) -> Optional[DailyRainfall]:
+    """Download one year of daily precipitation from the Open-Meteo archive.
+
+    Returns None when the API answers with a non-200 status; network errors
+    are raised to the caller.
+    """
+    import requests
+
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "start_date": f"{year}-01-01",
+        "end_date": f"{year}-12-31",
+        "daily": "precipitation_sum",
+        "timezone": "auto"
+    }
+    response = requests.get(OPEN_METEO_ARCHIVE_URL, params=params, timeout=10)
+    if response.status_code != 200:
+        return None
+
+    daily = response.json()['daily']
+    precipitation = np.array(
+        [p if p is not None else 0.0 for p in daily['precipitation_sum']], dtype=np.float32
+    )
+    dates = np.array(daily['time'], dtype='datetime64[D]')
+    month = (dates.astype('datetime64[M]').astype(np.int64) % 12 + 1).astype(np.uint8)
+    return DailyRainfall(lat, lon, year, precipitation, month)
+
+
+_cache: "OrderedDict[Tuple[float, float, int], DailyRainfall]" = OrderedDict()
+_cache_lock = threading.Lock()
+_inflight: Dict[Tuple[float, float, int], threading.Lock] = {}
+
+
+def get_daily_rainfall(lat: float, lon: float, year: int = RAINFALL_YEAR) -> Optional[DailyRainfall]:
+    """Return the daily series for a site, fetching it at most once per process.
+
+    Coordinates are snapped to the rainfall grid first, so every site in the
+    same grid cell shares one series. Concurrent callers for the same site
+    wait on a single download instead of issuing their own. Failed fetches
+    are not cached.
+    """
+    lat_q, lon_q = RAINFALL_GRID.snap(lat, lon)
+    key = (lat_q, lon_q, year)
+
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+        key_lock = _inflight.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _cache_lock:
+            if key in _cache:
+                return _cache[key]
+        try:
+            series = _load_series(lat_q, lon_q, year)
+        finally:
+            with _cache_lock:
+                _inflight.pop(key, None)
+        if series is not None:
+            with _cache_lock:
+                _cache[key] = series
+                while len(_cache) > MAX_CACHED_SERIES:
+                    _cache.popitem(last=False)
+        return series
+
+
+def _load_series(lat: float, lon: float, year: int) -> Optional[DailyRainfall]:
+    """Read a series from the disk cache, falling back to the API unless offline."""
+    disk = get_disk_cache()
+    disk_key = f"rainfall:{lat}:{lon}:{year}"
+    if disk is not None:
+        blob = disk.get(disk_key)
+        if blob:
+            return DailyRainfall.from_bytes(lat, lon, year, blob)
+    if is_offline():
+        return None
+    series = fetch_daily_rainfall(lat, lon, year)
+    if series is not None and disk is not None:
+        disk.set(disk_key, series.to_bytes())
+    return series
+
+
+def clear_cache():
+    """Drop all in-memory series (mainly for tests and manual refresh)."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,122 @@
+"""
+PDF report cache for Hydro-Assess
+Generated reports are stored under a hash of everything that goes into them
+(assessment parameters, recommendation, design and financials, site data,
+chart inputs, language and date), first in process memory and then in the
+shared disk cache, so rerunning the results page or reopening the same
+assessment serves the stored PDF instead of rebuilding it.
+
+Configuration (environment variables):
+    HYDRO_REPORT_CACHE_BYTES  Memory for cached reports (default: 64 MiB)
+
+On disk, reports share the HYDRO_CACHE_DIR store and its size budget.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Optional
+
+from .cache import get_disk_cache
+
+# Bump when the report layout changes so stored reports are not served
+REPORT_FORMAT_VERSION = 1
+
+MAX_CACHED_REPORTS = 32
+MAX_REPORT_CACHE_BYTES = int(os.environ.get('HYDRO_REPORT_CACHE_BYTES', 64 * 1024 * 1024))
+
+# Reports print the generation date, so a stored report is only valid on the day it was built
+REPORT_MAX_AGE_S = 86400
+
+DISK_KEY_PREFIX = 'report:'
+
+
+def _jsonable(value):
+    """JSON fallback for numpy scalars and anything else in the inputs."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def report_key(params: Dict, recommendation: Dict, design_financial: Dict, site_data: Dict,
+               chart_keys: Optional[Dict[str, str]], language: str, on: Optional[date] = None) -> str:
+    """Stable SHA-256 over every input of a report.
+
+    Charts enter by their charts.report_chart_keys, which hash the chart
+    inputs, so the key is known before (and without) rendering any chart.
+    """
+    payload = json.dumps({
+        'version': REPORT_FORMAT_VERSION,
+        'date': (on or date.today()).isoformat(),
+        'language': language,
+        'params': params,
+        'recommendation': recommendation,
+        'design_financial': design_financial,
+        'site_data': site_data,
+        'charts': chart_keys or {},
+    }, sort_keys=True, default=_jsonable)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+_reports: "OrderedDict[str, bytes]" = OrderedDict()
+_reports_bytes = 0
+_reports_lock = threading.Lock()
+_stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+
+def _remember(key: str, pdf: bytes):
+    global _reports_bytes
+
+    with _reports_lock:
+        if key in _reports:
+            _reports.move_to_end(key)
+            return
+        _reports[key] = pdf
+        _reports_bytes += len(pdf)
+        while len(_reports) > 1 and (len(_reports) > MAX_CACHED_REPORTS or _reports_bytes > MAX_REPORT_CACHE_BYTES):
+            _, evicted = _reports.popitem(last=False)
+            _reports_bytes -= len(evicted)
+
+
+def get_report(key: str) -> Optional[bytes]:
+    """Stored PDF for `key` from memory or disk, or None (counted as a miss)."""
+    with _reports_lock:
+        if key in _reports:
+            _reports.move_to_end(key)
+            _stats['memory_hits'] += 1
+            return _reports[key]
+
+    disk = get_disk_cache()
+    pdf = disk.get(DISK_KEY_PREFIX + key) if disk is not None else None
+    with _reports_lock:
+        _stats['disk_hits' if pdf is not None else 'misses'] += 1
+    if pdf is not None:
+        _remember(key, pdf)
+    return pdf
+
+
+def put_report(key: str, pdf: bytes):
+    """Store a freshly generated PDF in memory and on disk."""
+    _remember(key, pdf)
+    disk = get_disk_cache()
+    if disk is not None:
+        disk.set(DISK_KEY_PREFIX + key, pdf, max_age_seconds=REPORT_MAX_AGE_S)
+
+
+def report_cache_info() -> Dict[str, int]:
+    """Memory/disk hits, misses (builds), and reports held in memory with their size."""
+    with _reports_lock:
+        return {**_stats, 'entries': len(_reports), 'bytes': _reports_bytes}
+
+
+def clear_report_cache():
+    """Forget reports held in memory (the disk copies expire on their own)."""
+    global _reports_bytes
+
+    with _reports_lock:
+        _reports.clear()
+        _reports_bytes = 0
+        _stats.update(memory_hits=0, disk_hits=0, misses=0)
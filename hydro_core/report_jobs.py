@@ -0,0 +1,240 @@
+"""
+Background PDF report jobs for Hydro-Assess
+Report builds are submitted to a small pool of worker processes instead of
+running in the Streamlit script thread, so a session keeps rerunning while its
+PDF is built and report spikes cannot take more than REPORT_WORKERS cores
+away from interactive users. Pages submit a build only when the user asks for
+the report, poll it by its report key (see report_cache.report_key) with
+report_status, and offer the download once it is done. A page replacing its
+report with a new one cancels the old job with cancel_report if it has not
+started yet.
+
+Finished reports go into the report cache, so every session asking for the
+same report gets the same job and then the cached PDF. A report already being
+built is never submitted twice, and at most MAX_PENDING_REPORT_JOBS builds
+wait or run at once; further requests are turned away as busy until one
+finishes.
+
+Workers use the spawn start method (the Streamlit server is multi-threaded)
+and are started in the background on first use; until they are up, and if
+process pools are unavailable, reports are built in background threads, still
+at most REPORT_WORKERS (or one) at a time.
+
+Configuration (environment variables):
+    HYDRO_REPORT_WORKERS  Report building processes (default: 1; 0 builds in a
+                          background thread of the server process)
+    HYDRO_REPORT_QUEUE    Most report builds queued or running at once (default: 8)
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from .report_cache import get_report, put_report
+
+REPORT_WORKERS = int(os.environ.get('HYDRO_REPORT_WORKERS', 1))
+MAX_PENDING_REPORT_JOBS = int(os.environ.get('HYDRO_REPORT_QUEUE', 8))
+
+# Failed jobs remembered so pages can show the error instead of resubmitting on every rerun
+MAX_FAILED_REPORT_JOBS = 32
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+BUSY = 'busy'
+
+
+class ReportJobStatus(NamedTuple):
+    state: str
+    pdf: Optional[bytes] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+class _Job:
+    __slots__ = ('future', 'submitted_at', 'started')
+
+    def __init__(self):
+        self.future: Optional[Future] = None
+        self.submitted_at = time.time()
+        self.started = False
+
+
+_jobs: "OrderedDict[str, _Job]" = OrderedDict()
+_jobs_lock = threading.Lock()
+_stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0, 'cancelled': 0}
+
+_pool = None
+_pool_warmup: List[Future] = []
+_pool_failed = False
+_pool_lock = threading.Lock()
+# One dispatching thread per build slot: each waits on its worker process, or builds itself without a pool
+_dispatch = ThreadPoolExecutor(max(1, REPORT_WORKERS), thread_name_prefix='hydro-report')
+
+
+def _warm_worker(build_module: str):
+    """Import the report builder in a fresh worker so the first real job does not pay for it."""
+    import importlib
+
+    importlib.import_module(build_module)
+
+
+def _get_pool(build: Callable) -> Optional[ProcessPoolExecutor]:
+    """The report process pool once its workers are up, else None (build in the thread instead)."""
+    global _pool, _pool_warmup, _pool_failed
+
+    if REPORT_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None and not _pool_failed:
+            try:
+                # spawn, not fork: the Streamlit server is multi-threaded
+                _pool = ProcessPoolExecutor(REPORT_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+                _pool_warmup = [_pool.submit(_warm_worker, build.__module__) for _ in range(REPORT_WORKERS)]
+            except (OSError, ValueError, NotImplementedError, RuntimeError) as e:
+                print(f"Report worker pool unavailable, building reports in a background thread: {e}")
+                _pool = None
+                _pool_failed = True
+        if _pool is None or not all(f.done() for f in _pool_warmup):
+            return None
+        errors = [f.exception() for f in _pool_warmup if f.exception() is not None]
+        if errors:
+            print(f"Report worker pool failed to start, building reports in a background thread: {errors[0]}")
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+            _pool_failed = True
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool; the next job starts a new one."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run(job: _Job, build: Callable, args: tuple) -> bytes:
+    """Body of a job: build in the process pool if it is ready, else in this background thread."""
+    job.started = True
+    pool = _get_pool(build)
+    if pool is not None:
+        try:
+            return pool.submit(build, *args).result()
+        except BrokenProcessPool:
+            _discard_pool(pool)
+    return build(*args)
+
+
+def _finish(key: str, job: _Job):
+    """Cache a finished report and forget its job; failed jobs stay so pages can show the error."""
+    future = job.future
+    if future.cancelled():
+        return
+    error = future.exception()
+    with _jobs_lock:
+        if error is None:
+            _stats['completed'] += 1
+        else:
+            _stats['failed'] += 1
+            failed = [k for k, j in _jobs.items() if j.future.done() and j.future.exception() is not None]
+            for stale in failed[:max(0, len(failed) - MAX_FAILED_REPORT_JOBS)]:
+                del _jobs[stale]
+    if error is None:
+        put_report(key, future.result())
+        with _jobs_lock:
+            if _jobs.get(key) is job:
+                del _jobs[key]
+    else:
+        print(f"Report build failed: {error}")
+
+
+def _status(job: _Job) -> ReportJobStatus:
+    elapsed = time.time() - job.submitted_at
+    if not job.future.done():
+        return ReportJobStatus(RUNNING if job.started else QUEUED, elapsed=elapsed)
+    error = job.future.exception()
+    if error is not None:
+        return ReportJobStatus(FAILED, error=f"{type(error).__name__}: {error}", elapsed=elapsed)
+    return ReportJobStatus(DONE, pdf=job.future.result(), elapsed=elapsed)
+
+
+def request_report(key: str, build: Callable, *args, retry: bool = False) -> ReportJobStatus:
+    """Status of the report `key`, submitting `build(*args)` in the background if it is not known yet.
+
+    `build` must be a module-level function returning PDF bytes and `args`
+    must be picklable, since the build may run in another process. A failed
+    job is reported as failed until it is requested again with `retry`.
+    """
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None and not (retry and job.future.done()):
+            return _status(job)
+
+    pdf = get_report(key)
+    if pdf is not None:
+        return ReportJobStatus(DONE, pdf=pdf)
+
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None and not (retry and job.future.done()):
+            return _status(job)
+        if sum(not j.future.done() for j in _jobs.values()) >= MAX_PENDING_REPORT_JOBS:
+            _stats['rejected'] += 1
+            return ReportJobStatus(BUSY)
+        job = _Job()
+        job.future = _dispatch.submit(_run, job, build, args)
+        _jobs[key] = job
+        _jobs.move_to_end(key)
+        _stats['submitted'] += 1
+    job.future.add_done_callback(lambda _: _finish(key, job))
+    return _status(job)
+
+
+def report_status(key: str) -> Optional[ReportJobStatus]:
+    """Status of the report `key` without submitting anything: its job, else its cached PDF, else None."""
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None:
+            return _status(job)
+    pdf = get_report(key)
+    return ReportJobStatus(DONE, pdf=pdf) if pdf is not None else None
+
+
+def cancel_report(key: str) -> bool:
+    """Cancel the job of report `key` if it is still queued; False if it is already building.
+
+    A build in a worker cannot be interrupted; it finishes and its report is
+    cached as usual.
+    """
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is None or job.future.done():
+            return True
+        if job.started:
+            return False
+        del _jobs[key]
+    # Outside the lock: a successful cancel runs _finish right away
+    if job.future.cancel():
+        with _jobs_lock:
+            _stats['cancelled'] += 1
+        return True
+    with _jobs_lock:
+        _jobs.setdefault(key, job)
+    return False
+
+
+def report_jobs_info() -> Dict[str, int]:
+    """Jobs waiting and building now, and totals submitted, completed, failed, cancelled and turned away."""
+    with _jobs_lock:
+        pending = [job for job in _jobs.values() if not job.future.done()]
+        return {**_stats, 'queued': sum(not job.started for job in pending),
+                'running': sum(job.started for job in pending)}
@@ -0,0 +1,312 @@
+"""
+Soil texture lookup for Hydro-Assess
+Reads clay and sand fractions from the local tile store when one is installed
+(see soil_tiles.py); otherwise asks ISRIC SoilGrids for both shallow depths in
+a single request and caches the parsed fractions per SoilGrids grid cell
+(memory and disk). Each classification records where it came from, so the UI
+can show provenance without refetching.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .cache import get_disk_cache, is_offline
+from .grid import SOIL_GRID
+from .soil_tiles import get_tile_texture
+
+ISRIC_QUERY_URL = "https://rest.isric.org/soilgrids/v2.0/properties/query"
+
+ISRIC_HEADERS = {
+    'User-Agent': 'HydroAssess-RainwaterHarvesting/1.0',
+    'Accept': 'application/json'
+}
+
+# Depths in order of preference; the deeper one fills gaps in the topsoil layer
+ISRIC_DEPTHS = ["0-5cm", "5-15cm"]
+
+# Failed ISRIC calls (timeouts, rate limits) are not retried for this long
+FAILURE_RETRY_S = 300
+
+MAX_CACHED_CELLS = 4096
+
+
+class SoilLookupError(Exception):
+    """ISRIC could not be reached or answered with an error; worth retrying later."""
+
+
+# Category codes returned by classify_soil_textures; SOIL_CODE_UNKNOWN marks NaN input
+SOIL_TEXTURE_CLASSES = ('Sandy', 'Loamy', 'Clay')
+SOIL_CODE_SANDY, SOIL_CODE_LOAMY, SOIL_CODE_CLAY = range(3)
+SOIL_CODE_UNKNOWN = -1
+
+
+def classify_soil_textures(clay_pct, sand_pct) -> np.ndarray:
+    """Classify arrays of clay/sand percentages with a simplified USDA texture triangle.
+
+    Returns an int8 array of codes indexing SOIL_TEXTURE_CLASSES, broadcast over
+    the inputs. Rules are checked in order and the first match wins.
+    """
+    clay = np.asarray(clay_pct, dtype=np.float64)
+    sand = np.asarray(sand_pct, dtype=np.float64)
+    silt = 100 - clay - sand
+
+    conditions = [
+        np.isnan(clay) | np.isnan(sand),
+        (sand > 85) & (clay < 10),
+        clay >= 40,
+        (clay >= 35) & (sand < 45),
+        (sand >= 70) & (clay < 30),
+        (clay < 20) & (silt < 50),
+    ]
+    choices = [SOIL_CODE_UNKNOWN, SOIL_CODE_SANDY, SOIL_CODE_CLAY, SOIL_CODE_CLAY,
+               SOIL_CODE_SANDY, SOIL_CODE_SANDY]
+    # Everything else (silty and mixed soils) is loamy
+    return np.select(conditions, choices, default=SOIL_CODE_LOAMY).astype(np.int8)
+
+
+def classify_soil_texture(clay_pct: float, sand_pct: float) -> str:
+    """Classify one clay/sand percentage pair; see classify_soil_textures."""
+    code = int(classify_soil_textures(clay_pct, sand_pct))
+    return SOIL_TEXTURE_CLASSES[code] if code != SOIL_CODE_UNKNOWN else 'Loamy'
+
+
+def parse_isric_texture(data: dict) -> Optional[Dict]:
+    """Extract clay and sand percentages from an ISRIC properties/query response.
+
+    Each property uses the first depth in ISRIC_DEPTHS that has a value.
+    Returns None if either property is missing at every depth.
+    """
+    fractions = {}
+    depths_used = {}
+    for layer in data.get('properties', {}).get('layers', []):
+        name = (layer.get('name') or '').lower()
+        if name not in ('clay', 'sand'):
+            continue
+        # API unit is g/kg unless stated otherwise; convert to %
+        d_factor = float((layer.get('unit_measure') or {}).get('d_factor', 10))
+        by_depth = {
+            d.get('label'): (d.get('values') or {}).get('mean')
+            for d in layer.get('depths') or []
+        }
+        for depth in ISRIC_DEPTHS:
+            if by_depth.get(depth) is not None:
+                fractions[name] = float(by_depth[depth]) / d_factor
+                depths_used[name] = depth
+                break
+
+    if 'clay' not in fractions or 'sand' not in fractions:
+        return None
+    return {
+        'clay_pct': fractions['clay'],
+        'sand_pct': fractions['sand'],
+        'depth': depths_used['clay'] if depths_used['clay'] == depths_used['sand']
+        else f"{depths_used['clay']} / {depths_used['sand']}"
+    }
+
+
+def fetch_isric_texture(lat: float, lon: float) -> Optional[Dict]:
+    """Query clay and sand at every depth in ISRIC_DEPTHS with one request.
+
+    Returns None when SoilGrids has no data for the location and raises
+    SoilLookupError for transient failures.
+    """
+    import requests
+
+    params = {
+        "lon": lon,
+        "lat": lat,
+        "property": ["clay", "sand"],
+        "depth": ISRIC_DEPTHS,
+        "value": "mean"
+    }
+    try:
+        response = requests.get(ISRIC_QUERY_URL, params=params, headers=ISRIC_HEADERS, timeout=15)
+    except requests.exceptions.RequestException as e:
+        raise SoilLookupError(str(e)) from e
+
+    if response.status_code == 404:
+        return None
+    if response.status_code != 200:
+        raise SoilLookupError(f"ISRIC SoilGrids returned HTTP {response.status_code}")
+    try:
+        return parse_isric_texture(response.json())
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+_cache: "OrderedDict[Tuple[float, float], Optional[Dict]]" = OrderedDict()
+_failures: Dict[Tuple[float, float], float] = {}
+_cache_lock = threading.Lock()
+
+
+def get_isric_texture(lat: float, lon: float) -> Optional[Dict]:
+    """Cached ISRIC texture fractions for the SoilGrids cell containing (lat, lon).
+
+    Both hits and "no data" answers are cached in memory and on disk, so each
+    grid cell costs at most one network call.
+    """
+    key = SOIL_GRID.snap(lat, lon)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+        if time.monotonic() - _failures.get(key, float('-inf')) < FAILURE_RETRY_S:
+            raise SoilLookupError("ISRIC SoilGrids failed recently for this location")
+
+    disk = get_disk_cache()
+    disk_key = f"soil:isric:{key[0]}:{key[1]}"
+    blob = disk.get(disk_key) if disk is not None else None
+    if blob is not None:
+        texture = json.loads(blob)
+    elif is_offline():
+        raise SoilLookupError("offline mode and no cached soil data for this location")
+    else:
+        try:
+            texture = fetch_isric_texture(*key)
+        except SoilLookupError:
+            with _cache_lock:
+                _failures[key] = time.monotonic()
+            raise
+        if disk is not None:
+            disk.set(disk_key, json.dumps(texture).encode('utf-8'))
+
+    with _cache_lock:
+        _failures.pop(key, None)
+        _cache[key] = texture
+        while len(_cache) > MAX_CACHED_CELLS:
+            _cache.popitem(last=False)
+    return texture
+
+
+def get_soil_from_isric(lat, lon):
+    """Soil type from ISRIC SoilGrids, or None if unavailable for this location."""
+    try:
+        texture = get_isric_texture(lat, lon)
+    except SoilLookupError:
+        return None
+    if texture is None:
+        return None
+    return classify_soil_texture(texture['clay_pct'], texture['sand_pct'])
+
+
+def get_soil_from_alternative(lat, lon):
+    """Try alternative soil classification based on elevation and climate."""
+    try:
+        # This is a simplified approach based on geographic patterns
+        # You could integrate with other APIs here
+
+        # For now, use the geographic fallback
+        return get_soil_type_fallback(lat, lon)
+
+    except Exception:
+        return None
+
+
+def get_soil_type_fallback(lat, lon):
+    """Enhanced fallback soil type determination based on geographic patterns."""
+    try:
+        # Enhanced geographic-based soil type estimation
+
+        # For India (detailed regional mapping)
+        if 8.0 <= lat <= 37.0 and 68.0 <= lon <= 97.0:
+            # Rajasthan desert regions - sandy
+            if 24.0 <= lat <= 30.0 and 68.0 <= lon <= 78.0:
+                return "Sandy"
+            # Gangetic plains - alluvial/loamy
+            elif 24.0 <= lat <= 31.0 and 75.0 <= lon <= 88.0:
+                return "Loamy"
+            # Deccan plateau - black cotton soil (clay)
+            elif 15.0 <= lat <= 24.0 and 74.0 <= lon <= 80.0:
+                return "Clay"
+            # Western Ghats - rocky/lateritic
+            elif 8.0 <= lat <= 20.0 and 72.0 <= lon <= 77.0:
+                return "Rocky"
+            # Eastern coastal plains - sandy/loamy
+            elif 10.0 <= lat <= 20.0 and 79.0 <= lon <= 87.0:
+                return "Sandy"
+            # Western coastal plains - lateritic/clay
+            elif 8.0 <= lat <= 23.0 and 68.0 <= lon <= 76.0:
+                return "Clay"
+            # Himalayan foothills - rocky/loamy
+            elif lat >= 28.0:
+                return "Rocky"
+            # Southern peninsula - mixed
+            elif lat <= 15.0:
+                # Use longitude to differentiate
+                if lon <= 77.0:
+                    return "Rocky"  # Western side
+                else:
+                    return "Clay"   # Eastern side
+            else:
+                return "Loamy"
+
+        # For other global regions
+        elif lat > 40.0:  # Northern temperate regions
+            return "Clay"
+        elif lat < 10.0:  # Tropical regions
+            if lon < 0:  # Western hemisphere tropics
+                return "Sandy"
+            else:  # Eastern hemisphere tropics
+                return "Loamy"
+        elif 10.0 <= lat <= 40.0:  # Subtropical regions
+            # Arid regions (rough approximation)
+            if 20.0 <= lat <= 35.0 and ((0 <= lon <= 60) or (-120 <= lon <= -90)):
+                return "Sandy"
+            else:
+                return "Loamy"
+        else:
+            return "Loamy"
+
+    except Exception:
+        return "Loamy"
+
+
+def get_soil_info(lat, lon) -> Dict:
+    """Soil type for a site together with its provenance.
+
+    Returns a dict with 'soil_type', 'source' ('tiles', 'isric', 'geographic'
+    or 'default'), and for tile and ISRIC results 'clay_pct', 'sand_pct' and
+    'depth'.
+    """
+    texture = get_tile_texture(lat, lon)
+    if texture is not None:
+        return {
+            'soil_type': classify_soil_texture(texture['clay_pct'], texture['sand_pct']),
+            'source': 'tiles',
+            **texture
+        }
+
+    try:
+        texture = get_isric_texture(lat, lon)
+    except SoilLookupError:
+        texture = None
+    if texture is not None:
+        return {
+            'soil_type': classify_soil_texture(texture['clay_pct'], texture['sand_pct']),
+            'source': 'isric',
+            **texture
+        }
+
+    soil_type = get_soil_from_alternative(lat, lon)
+    if soil_type and soil_type != "Unknown":
+        return {'soil_type': soil_type, 'source': 'geographic'}
+
+    # Final fallback
+    return {'soil_type': "Loamy", 'source': 'default'}
+
+
+def clear_cache(lat: Optional[float] = None, lon: Optional[float] = None):
+    """Drop cached soil data: everything in memory, plus the disk entry for (lat, lon) if given."""
+    with _cache_lock:
+        _cache.clear()
+        _failures.clear()
+    if lat is not None and lon is not None:
+        disk = get_disk_cache()
+        if disk is not None:
+            key = SOIL_GRID.snap(lat, lon)
+            disk.delete(f"soil:isric:{key[0]}:{key[1]}")
@@ -0,0 +1,153 @@
+"""
+Offline soil texture tile store for Hydro-Assess
+Pre-downloaded clay/sand fraction rasters (e.g. exported from SoilGrids) are
+kept as 1-degree tiles of uint8 percentages in .npy files and memory-mapped on
+first use, so a point lookup is a couple of array reads and needs no network.
+
+Directory layout (HYDRO_SOIL_TILE_DIR):
+    index.json     {"cells_per_degree": 480, "nodata": 255, "depth": "0-5cm"}
+    N28E077.npy    uint8 array of shape (2, cells, cells): [0] clay %, [1] sand %;
+                   row 0 is the tile's northern edge, column 0 its western edge
+"""
+
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+INDEX_FILE_NAME = 'index.json'
+
+# Memory-mapped tiles kept open at once
+MAX_OPEN_TILES = 256
+
+
+def tile_name(lat: float, lon: float) -> str:
+    """Name of the 1-degree tile containing (lat, lon), e.g. 'N28E077'."""
+    south = math.floor(lat)
+    west = math.floor(lon)
+    return f"{'N' if south >= 0 else 'S'}{abs(south):02d}{'E' if west >= 0 else 'W'}{abs(west):03d}"
+
+
+class SoilTileStore:
+    """Point sampler over a directory of clay/sand fraction tiles."""
+
+    def __init__(self, directory: str):
+        with open(os.path.join(directory, INDEX_FILE_NAME), encoding='utf-8') as f:
+            index = json.load(f)
+        self.directory = directory
+        self.cells_per_degree = int(index['cells_per_degree'])
+        self.nodata = int(index.get('nodata', 255))
+        self.depth = index.get('depth', '0-5cm')
+        self._tiles: "OrderedDict[str, Optional[np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tile(self, name: str) -> Optional[np.ndarray]:
+        with self._lock:
+            if name in self._tiles:
+                self._tiles.move_to_end(name)
+                return self._tiles[name]
+            path = os.path.join(self.directory, f"{name}.npy")
+            tile = np.load(path, mmap_mode='r') if os.path.exists(path) else None
+            self._tiles[name] = tile
+            while len(self._tiles) > MAX_OPEN_TILES:
+                self._tiles.popitem(last=False)
+            return tile
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Row and column of (lat, lon) inside its tile."""
+        n = self.cells_per_degree
+        row = int((math.floor(lat) + 1 - lat) * n)
+        col = int((lon - math.floor(lon)) * n)
+        return min(row, n - 1), min(col, n - 1)
+
+    def sample(self, lat: float, lon: float) -> Optional[Tuple[float, float]]:
+        """Clay and sand percentages at (lat, lon), or None outside coverage."""
+        tile = self._tile(tile_name(lat, lon))
+        if tile is None:
+            return None
+        row, col = self._cell(lat, lon)
+        clay = int(tile[0, row, col])
+        sand = int(tile[1, row, col])
+        if clay == self.nodata or sand == self.nodata:
+            return None
+        return float(clay), float(sand)
+
+    def sample_many(self, lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized sample(); missing coverage is NaN in both output arrays."""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        clay = np.full(lats.shape, np.nan)
+        sand = np.full(lats.shape, np.nan)
+        n = self.cells_per_degree
+        south = np.floor(lats)
+        west = np.floor(lons)
+        rows = np.minimum(((south + 1 - lats) * n).astype(np.int64), n - 1)
+        cols = np.minimum(((lons - west) * n).astype(np.int64), n - 1)
+
+        # One vectorized read per tile touched
+        tile_keys = south.astype(np.int64) * 1000 + west.astype(np.int64)
+        for key in np.unique(tile_keys):
+            mask = tile_keys == key
+            first = np.flatnonzero(mask)[0]
+            tile = self._tile(tile_name(lats[first], lons[first]))
+            if tile is None:
+                continue
+            c = tile[0, rows[mask], cols[mask]].astype(np.float64)
+            s = tile[1, rows[mask], cols[mask]].astype(np.float64)
+            invalid = (c == self.nodata) | (s == self.nodata)
+            c[invalid] = np.nan
+            s[invalid] = np.nan
+            clay[mask] = c
+            sand[mask] = s
+        return clay, sand
+
+
+def write_tile(directory: str, south: int, west: int, clay: np.ndarray, sand: np.ndarray,
+               nodata: int = 255):
+    """Write one tile from clay/sand percentage grids (NaN becomes nodata)."""
+    stack = np.stack([clay, sand]).astype(np.float64)
+    stack = np.where(np.isnan(stack), nodata, np.clip(np.rint(stack), 0, 100)).astype(np.uint8)
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, f"{tile_name(south + 0.5, west + 0.5)}.npy"), stack)
+
+
+def write_index(directory: str, cells_per_degree: int, nodata: int = 255, depth: str = '0-5cm'):
+    """Write the store's index.json."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, INDEX_FILE_NAME), 'w', encoding='utf-8') as f:
+        json.dump({'cells_per_degree': cells_per_degree, 'nodata': nodata, 'depth': depth}, f)
+
+
+_default_store = None
+_default_store_loaded = False
+_default_store_lock = threading.Lock()
+
+
+def get_tile_store() -> Optional[SoilTileStore]:
+    """Store configured by HYDRO_SOIL_TILE_DIR, or None when no tiles are installed."""
+    global _default_store, _default_store_loaded
+    with _default_store_lock:
+        if not _default_store_loaded:
+            _default_store_loaded = True
+            directory = os.environ.get('HYDRO_SOIL_TILE_DIR', '')
+            if directory and os.path.exists(os.path.join(directory, INDEX_FILE_NAME)):
+                try:
+                    _default_store = SoilTileStore(directory)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Soil tile store disabled ({directory}): {e}")
+        return _default_store
+
+
+def get_tile_texture(lat: float, lon: float) -> Optional[Dict]:
+    """Texture fractions from the local tiles, in the same shape as ISRIC results."""
+    store = get_tile_store()
+    if store is None:
+        return None
+    sample = store.sample(lat, lon)
+    if sample is None:
+        return None
+    return {'clay_pct': sample[0], 'sand_pct': sample[1], 'depth': store.depth}
@@ -8,6 +8,10 @@ import streamlit as st
 import datetime
 from translator import T, language_selector, main_page_language_selector 
 from locales import translations
+from hydro_core.fonts import check_fonts
+
+# Verify the bundled report fonts at startup rather than in the first PDF request
+check_fonts()
 
 
 # Initialize language in session state FIRST
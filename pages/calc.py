@@ -1,23 +1,30 @@
 import streamlit as st
 import pandas as pd
-from translator import T, main_page_language_selector
+from translator import T, get_current_language, main_page_language_selector
 import numpy as np
 import requests
-import matplotlib.pyplot as plt
 # Configure matplotlib to handle Unicode characters
 import matplotlib
 matplotlib.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'sans-serif']
 matplotlib.rcParams['axes.unicode_minus'] = False
 from datetime import datetime
 # Importing our new professional PDF generator
-from pdf_generator import generate_professional_pdf
-import io
-import base64
-from shapely.geometry import Point
-import geopandas as gpd
-import json
-import math
-import os
+from pdf_generator import build_report_pdf, report_language_available
+from hydro_core.chart_specs import cost_components_spec, cost_share_spec, projection_spec, rainfall_spec
+from hydro_core.charts import DARK_THEME, LIGHT_THEME, chart_cache_info, report_chart_keys
+from hydro_core.engine import (
+    RUNOFF_COEFFICIENTS, SOIL_INFILTRATION_RATES,
+    generate_recommendation, calculate_design_and_cost
+)
+from hydro_core.fetch import fetch_all
+from hydro_core.groundwater import get_groundwater_data, query_groundwater
+from hydro_core.ingest import GroundwaterLayerError, load_groundwater_layer
+from hydro_core.report_cache import report_cache_info, report_key
+from hydro_core.report_jobs import (
+    BUSY, DONE, FAILED, cancel_report, report_jobs_info, report_status, request_report
+)
+from hydro_core.rainfall import get_daily_rainfall
+from hydro_core.soil import get_soil_info, get_soil_type_fallback, clear_cache as clear_soil_cache
 import time
 from typing import Optional, Dict
 
@@ -580,525 +587,97 @@ if 'coordinates_from_map' not in st.session_state:
     st.session_state['coordinates_from_map'] = False
 
 # --- CONSTANTS ---
-RUNOFF_COEFFICIENTS = {
-    "Concrete Roof": 0.90,
-    "Tile Roof": 0.85,
-    "Metal Sheet": 0.90,
-    "Asphalt": 0.85,
-    "Concrete Surface": 0.75,
-    "Paved Area": 0.70
-}
+# Overall deadline (seconds) for all external lookups of one site
+SITE_DATA_DEADLINE_S = 20
 
-SOIL_INFILTRATION_RATES = {
-    "Sandy": 25,  # mm/hour
-    "Loamy": 13,
-    "Clay": 5,
-    "Rocky": 2
+# How often (seconds) the summary tab checks on a PDF report being built in the background
+REPORT_POLL_SECONDS = 1
+
+SOURCE_STATUS_LABELS = {
+    'ok': "✅ OK",
+    'empty': "⚠️ No data",
+    'error': "❌ Failed",
+    'timeout': "⏱️ Timed out"
 }
 
 # --- DATA FETCHING FUNCTIONS ---
 
-@st.cache_data(ttl=3600)
 def get_annual_rainfall(lat, lon):
-    """Fetch annual rainfall data from Open-Meteo API."""
+    """Annual rainfall (mm) from the shared daily rainfall store."""
     try:
-        url = "https://archive-api.open-meteo.com/v1/archive"
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "start_date": "2023-01-01",
-            "end_date": "2023-12-31",
-            "daily": "precipitation_sum",
-            "timezone": "auto"
-        }
-        response = requests.get(url, params=params, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            precipitation = [p if p is not None else 0 for p in data['daily']['precipitation_sum']]
-            return sum(precipitation)
-        return None
+        series = get_daily_rainfall(lat, lon)
+        return series.annual_total() if series is not None else None
     except Exception as e:
         st.warning(f"Could not fetch rainfall data: {e}")
         return None
 
-@st.cache_data(ttl=3600)
 def get_soil_type(lat, lon):
-    """Fetch soil type from multiple sources with enhanced error handling."""
-    
-    # Try multiple soil APIs in order of preference
-    soil_apis = [
-        ("ISRIC SoilGrids", get_soil_from_isric),
-        ("Alternative API", get_soil_from_alternative),
-        ("Geographic Fallback", get_soil_type_fallback)
-    ]
-    
-    for api_name, api_func in soil_apis:
-        try:
-            result = api_func(lat, lon)
-            if result and result != "Unknown":
-                return result
-        except Exception as e:
-            continue
-    
-    # Final fallback
-    return "Loamy"
+    """Soil type for the SoilGrids cell containing (lat, lon)."""
+    return get_soil_info(lat, lon)['soil_type']
 
-def get_soil_from_isric(lat, lon):
-    """Get soil data from ISRIC SoilGrids API - FIXED implementation."""
+def get_monthly_rainfall(lat: float, lon: float) -> Optional[Dict[str, float]]:
+    """Monthly rainfall totals (mm) for the last full year, from the shared daily rainfall store."""
     try:
-        # Correct ISRIC SoilGrids REST API endpoint for point queries
-        base_url = "https://rest.isric.org/soilgrids/v2.0/properties/query"
-        
-        # Request clay and sand properties at 0-5cm depth
-        # Use list for 'property' so requests encodes property=clay&property=sand
-        params = {
-            "lon": lon,
-            "lat": lat,
-            "property": ["clay", "sand"],  # Multiple properties in one call
-            "depth": "0-5cm",
-            "value": "mean"
-        }
-        
-        headers = {
-            'User-Agent': 'HydroAssess-RainwaterHarvesting/1.0',
-            'Accept': 'application/json'
-        }
-        
-        # Helper to parse a response into clay/sand percentages
-        def _parse_layers(data_json):
-            properties = data_json.get('properties', {})
-            layers = properties.get('layers', [])
-            clay_pct = None
-            sand_pct = None
-            for layer in layers:
-                name = (layer.get('name') or '').lower()
-                depths = layer.get('depths') or []
-                if not depths:
-                    continue
-                values = (depths[0].get('values') or {})
-                mean_val = values.get('mean')
-                if mean_val is None:
-                    continue
-                # API unit is g/kg; convert to %
-                pct = float(mean_val) / 10.0
-                if 'clay' in name:
-                    clay_pct = pct
-                if 'sand' in name:
-                    sand_pct = pct
-            return clay_pct, sand_pct
-
-        response = requests.get(base_url, params=params, headers=headers, timeout=15)
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Parse the response structure
-            try:
-                clay_content, sand_content = _parse_layers(data)
-                
-                # If combined query didn't return, try separate calls (some servers ignore multiple props)
-                if clay_content is None or sand_content is None:
-                    for prop in ["clay", "sand"]:
-                        resp2 = requests.get(
-                            base_url,
-                            params={"lon": lon, "lat": lat, "property": prop, "depth": "0-5cm", "value": "mean"},
-                            headers=headers,
-                            timeout=10
-                        )
-                        if resp2.status_code == 200:
-                            c2, s2 = _parse_layers(resp2.json())
-                            if c2 is not None:
-                                clay_content = c2
-                            if s2 is not None:
-                                sand_content = s2
-                
-                # Still nothing? Try the next available shallow depth as a fallback
-                if clay_content is None or sand_content is None:
-                    resp3 = requests.get(
-                        base_url,
-                        params={"lon": lon, "lat": lat, "property": "clay,sand", "depth": "5-15cm", "value": "mean"},
-                        headers=headers,
-                        timeout=10
-                    )
-                    if resp3.status_code == 200:
-                        c3, s3 = _parse_layers(resp3.json())
-                        if clay_content is None:
-                            clay_content = c3
-                        if sand_content is None:
-                            sand_content = s3
-                
-                # Classify soil based on USDA texture triangle
-                if clay_content is not None and sand_content is not None:
-                    # Calculate silt content
-                    silt_content = 100 - clay_content - sand_content
-                    
-                    # USDA soil classification logic (simplified)
-                    if sand_content > 85 and clay_content < 10:
-                        return 'Sandy'
-                    elif clay_content >= 40:
-                        return 'Clay'
-                    elif clay_content >= 35 and sand_content < 45:
-                        return 'Clay'
-                    elif sand_content >= 70 and clay_content < 30:
-                        return 'Sandy'
-                    elif clay_content < 20 and silt_content < 50:
-                        return 'Sandy'
-                    elif clay_content < 27 and 50 <= silt_content < 80:
-                        return 'Loamy'
-                    elif silt_content >= 80:
-                        return 'Loamy'
-                    else:
-                        return 'Loamy'  # Default to loamy for mixed soils
-                
-                return None
-                
-            except (KeyError, IndexError, TypeError, ValueError):
-                return None
-        
-        elif response.status_code == 404:
-            # No data available for this location
-            return None
-        elif response.status_code == 429:
-            # Rate limited
-            return None
-        else:
-            return None
-            
-    except requests.exceptions.Timeout:
-        return None
-    except requests.exceptions.ConnectionError:
-        return None
+        series = get_daily_rainfall(lat, lon)
+        return series.monthly_totals() if series is not None else None
     except Exception as e:
+        st.warning(f"Could not fetch monthly rainfall data: {e}")
         return None
 
-def get_soil_from_alternative(lat, lon):
-    """Try alternative soil classification based on elevation and climate."""
-    try:
-        # This is a simplified approach based on geographic patterns
-        # You could integrate with other APIs here
-        
-        # For now, use the geographic fallback
-        return get_soil_type_fallback(lat, lon)
-        
-    except Exception:
-        return None
+def fetch_site_data(lat, lon):
+    """Fetch rainfall and soil for a site concurrently under one overall deadline.
 
-def get_soil_type_fallback(lat, lon):
-    """Enhanced fallback soil type determination based on geographic patterns."""
-    try:
-        # Enhanced geographic-based soil type estimation
-        
-        # For India (detailed regional mapping)
-        if 8.0 <= lat <= 37.0 and 68.0 <= lon <= 97.0:
-            # Rajasthan desert regions - sandy
-            if 24.0 <= lat <= 30.0 and 68.0 <= lon <= 78.0:
-                return "Sandy"
-            # Gangetic plains - alluvial/loamy
-            elif 24.0 <= lat <= 31.0 and 75.0 <= lon <= 88.0:
-                return "Loamy"
-            # Deccan plateau - black cotton soil (clay)
-            elif 15.0 <= lat <= 24.0 and 74.0 <= lon <= 80.0:
-                return "Clay"
-            # Western Ghats - rocky/lateritic
-            elif 8.0 <= lat <= 20.0 and 72.0 <= lon <= 77.0:
-                return "Rocky"
-            # Eastern coastal plains - sandy/loamy
-            elif 10.0 <= lat <= 20.0 and 79.0 <= lon <= 87.0:
-                return "Sandy"
-            # Western coastal plains - lateritic/clay
-            elif 8.0 <= lat <= 23.0 and 68.0 <= lon <= 76.0:
-                return "Clay"
-            # Himalayan foothills - rocky/loamy
-            elif lat >= 28.0:
-                return "Rocky"
-            # Southern peninsula - mixed
-            elif lat <= 15.0:
-                # Use longitude to differentiate
-                if lon <= 77.0:
-                    return "Rocky"  # Western side
-                else:
-                    return "Clay"   # Eastern side
-            else:
-                return "Loamy"
-        
-        # For other global regions
-        elif lat > 40.0:  # Northern temperate regions
-            return "Clay"
-        elif lat < 10.0:  # Tropical regions
-            if lon < 0:  # Western hemisphere tropics
-                return "Sandy"
-            else:  # Eastern hemisphere tropics
-                return "Loamy"
-        elif 10.0 <= lat <= 40.0:  # Subtropical regions
-            # Arid regions (rough approximation)
-            if 20.0 <= lat <= 35.0 and ((0 <= lon <= 60) or (-120 <= lon <= -90)):
-                return "Sandy"
-            else:
-                return "Loamy"
-        else:
-            return "Loamy"
-            
-    except Exception:
-        return "Loamy"
+    Annual and monthly rainfall come from the same daily series, so only two
+    network lookups are started. Per-source results are returned under
+    'sources'; soil falls back to the geographic estimate if its lookup fails.
+    """
+    sources = fetch_all({
+        'rainfall': lambda: get_daily_rainfall(lat, lon),
+        'soil': lambda: get_soil_info(lat, lon),
+    }, deadline=SITE_DATA_DEADLINE_S)
 
-@st.cache_data(ttl=3600)
-def get_monthly_rainfall(lat: float, lon: float) -> Optional[Dict[str, float]]:
-    """Fetch monthly rainfall totals (mm) for the last full year (2023)."""
-    try:
-        url = "https://archive-api.open-meteo.com/v1/archive"
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "start_date": "2023-01-01",
-            "end_date": "2023-12-31",
-            "daily": "precipitation_sum",
-            "timezone": "auto"
-        }
-        response = requests.get(url, params=params, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            df = pd.DataFrame({
-                'date': pd.to_datetime(data['daily']['time']),
-                'precipitation': [p or 0 for p in data['daily']['precipitation_sum']]
-            })
-            df['month'] = df['date'].dt.month
-            monthly = df.groupby('month')['precipitation'].sum().round(1)
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            return {m: float(monthly.get(i + 1, 0.0)) for i, m in enumerate(months)}
-        return None
-    except Exception as e:
-        st.warning(f"Could not fetch monthly rainfall data: {e}")
-        return None
+    rainfall = sources['rainfall']
+    if rainfall.status in ('error', 'timeout'):
+        st.warning(f"Could not fetch rainfall data: {rainfall.error}")
+    series = rainfall.value
 
-def get_groundwater_data(lat, lon):
-    """Generate simulated groundwater data."""
-    # Create realistic variation based on coordinates
-    depth_base = 10 + ((lat + lon) % 15)
-    seasonal_variation = 2 * np.sin((lat * lon) % 6.28)
-    post_monsoon_depth = max(3, depth_base + seasonal_variation)
-    
-    # Determine aquifer type based on location
-    if lat > 25:  # Northern India
-        aquifer_type = "Alluvial Plains"
-    elif lat < 20:  # Southern India
-        aquifer_type = "Hard Rock (Crystalline)"
+    if sources['soil'].ok:
+        soil_info = sources['soil'].value
     else:
-        aquifer_type = "Mixed Aquifer System"
-    
+        soil_info = {'soil_type': get_soil_type_fallback(lat, lon), 'source': 'geographic'}
+
     return {
-        'post_monsoon_depth_m': post_monsoon_depth,
-        'pre_monsoon_depth_m': post_monsoon_depth + 2,
-        'principal_aquifer_type': aquifer_type,
-        'aquifer_yield': 'Moderate' if post_monsoon_depth < 15 else 'Low'
+        'annual_rainfall': series.annual_total() if series is not None else None,
+        'monthly_rainfall': series.monthly_totals() if series is not None else None,
+        'soil_type': soil_info['soil_type'],
+        'soil_info': soil_info,
+        'sources': sources
     }
 
 def query_groundwater_from_gdf(lat, lon, gdf):
     """Query groundwater data from uploaded GeoDataFrame."""
     try:
-        user_point = Point(lon, lat)
-        distances = gdf.geometry.distance(user_point)
-        nearest_idx = distances.idxmin()
-        nearest_data = gdf.loc[nearest_idx]
-        return {
-            'post_monsoon_depth_m': float(nearest_data.get('post_monsoon_depth_m', 12)),
-            'pre_monsoon_depth_m': float(nearest_data.get('pre_monsoon_depth_m', 14)),
-            'principal_aquifer_type': str(nearest_data.get('principal_aquifer_type', 'Unknown')),
-            'aquifer_yield': str(nearest_data.get('aquifer_yield', 'Moderate'))
-        }
+        return query_groundwater(lat, lon, gdf, content_hash=st.session_state.get('groundwater_hash'))
     except Exception as e:
         st.warning(f"Error querying uploaded data: {e}")
         return get_groundwater_data(lat, lon)
 
-# --- CORE RECOMMENDATION ENGINE ---
+def load_uploaded_groundwater(uploaded_file):
+    """Parse an uploaded groundwater file once and keep it in session state.
 
-def generate_recommendation(params):
-    """
-    Core recommendation engine that analyzes all parameters and generates
-    a specific RWH strategy recommendation.
+    Reruns with the same upload reuse the layer without rereading the file;
+    identical content uploaded again, or in another session, is served from
+    the ingestion cache by its content hash.
     """
-    # 1. Calculate Annual Potential (in liters)
-    annual_potential = params['area'] * (params['annual_rainfall'] / 1000) * params['runoff_coefficient'] * 1000
-    
-    # 2. Apply Decision Rules in Order
-    recommendation_type = ""
-    reason = ""
-    
-    # Rule 1: Low Rainfall Check
-    if params['annual_rainfall'] < 500:
-        recommendation_type = "Storage Only"
-        reason = "Annual rainfall is too low for effective groundwater recharge."
-    
-    # Rule 2: High Groundwater Level Check
-    elif params['post_monsoon_depth_m'] < 8.0:
-        recommendation_type = "Storage Only"
-        reason = "Groundwater level is too high (<8m), making recharge unsafe and ineffective."
-    
-    # Rule 3: Urban Density Check - FIXED to allow hybrid systems
-    elif params['city_type'] == "Tier 1 (Metro - High Density)":
-        # Check if there's enough potential for both storage and recharge
-        household_demand = params['household_size'] * 135 * 20  # 20-day buffer
-        if annual_potential > household_demand * 2:  # If potential is more than 2x household demand
-            recommendation_type = "Hybrid System"
-            reason = "High-density urban area with sufficient rainfall potential for both storage and groundwater recharge to mitigate flooding."
-        else:
-            recommendation_type = "Storage Only"
-            reason = "High-density urban area with limited rainfall potential - prioritizing direct water storage for household use."
-    
-    # Rule 4: Default - Hybrid System
-    else:
-        recommendation_type = "Hybrid System"
-        reason = "Optimal balance of direct use and groundwater recharge."
-    
-    # 3. Calculate System Volumes Based on Recommendation
-    if recommendation_type == "Storage Only":
-        volume_to_store = annual_potential
-        volume_to_recharge = 0
-    elif recommendation_type == "Recharge Only":
-        volume_to_store = 0
-        volume_to_recharge = annual_potential
-    else:  # Hybrid System
-        # Calculate household demand for 20-day buffer
-        demand_liters = params['household_size'] * 135 * 20  # 135 LPCD standard
-        volume_to_store = min(demand_liters, annual_potential * 0.6)  # Increased from 0.5 to 0.6
-        volume_to_recharge = annual_potential - volume_to_store
-    
-    return {
-        'recommendation_type': recommendation_type,
-        'reason': reason,
-        'annual_potential': annual_potential,
-        'volume_to_store': volume_to_store,
-        'volume_to_recharge': volume_to_recharge,
-        'household_demand_20_days': params['household_size'] * 135 * 20,
-        'efficiency_rating': calculate_efficiency_rating(annual_potential, params)
-    }
-
-def calculate_efficiency_rating(potential, params):
-    """Calculate system efficiency rating."""
-    annual_household_demand = params['household_size'] * 135 * 365
-    potential_coverage = (potential / annual_household_demand) * 100
-    
-    if potential_coverage >= 80:
-        return "Excellent"
-    elif potential_coverage >= 60:
-        return "Good"
-    elif potential_coverage >= 40:
-        return "Fair"
-    else:
-        return "Limited"
-
-# --- DESIGN AND COST CALCULATIONS ---
-
-def calculate_design_and_cost(recommendation_result, params):
-    """Calculate system design specifications and costs."""
-    design = {}
-    cost_breakdown = {}
-    
-    # Storage System Design
-    if recommendation_result['volume_to_store'] > 0:
-        tank_volume_liters = recommendation_result['volume_to_store']
-        tank_volume_m3 = tank_volume_liters / 1000
-        
-        # Calculate optimal cylindrical tank dimensions (height ≈ diameter for efficiency)
-        radius = (tank_volume_m3 / (math.pi * 1.2))**(1/3)  # Assume height = 1.2 * diameter
-        diameter = radius * 2
-        height = tank_volume_m3 / (math.pi * radius**2)
-        
-        design['storage_tank'] = {
-            'volume_liters': tank_volume_liters,
-            'volume_m3': tank_volume_m3,
-            'dimensions': f"{diameter:.1f}m Diameter × {height:.1f}m Height",
-            'type': 'Cylindrical HDPE/Concrete Tank'
-        }
-        
-        # Storage costs (₹4 per liter for HDPE, ₹6 per liter for concrete if >5000L)
-        if tank_volume_liters > 5000:
-            cost_breakdown['storage_tank'] = tank_volume_liters * 6  # Concrete tank
-        else:
-            cost_breakdown['storage_tank'] = tank_volume_liters * 4  # HDPE tank
-    
-    # Recharge System Design
-    if recommendation_result['volume_to_recharge'] > 0:
-        recharge_volume_m3 = recommendation_result['volume_to_recharge'] / 1000
-        
-        # Design recharge pit (assume 2m diameter, calculate required depth)
-        pit_diameter = 2.0
-        pit_area = math.pi * (pit_diameter / 2)**2
-        pit_depth = min(recharge_volume_m3 / pit_area, 4.0)  # Max 4m depth
-        
-        # If single pit is too deep, suggest multiple pits
-        if recharge_volume_m3 / pit_area > 4.0:
-            num_pits = math.ceil(recharge_volume_m3 / (pit_area * 4.0))
-            pit_depth = 4.0
-            design['recharge_system'] = {
-                'volume_m3': recharge_volume_m3,
-                'configuration': f"{num_pits} Recharge Pits",
-                'dimensions': f"Each: {pit_diameter}m Diameter × {pit_depth}m Depth",
-                'total_area': f"{num_pits * pit_area:.1f} m²"
-            }
-        else:
-            design['recharge_system'] = {
-                'volume_m3': recharge_volume_m3,
-                'configuration': "Single Recharge Pit",
-                'dimensions': f"{pit_diameter}m Diameter × {pit_depth:.1f}m Depth",
-                'total_area': f"{pit_area:.1f} m²"
-            }
-        
-        # Recharge costs (₹2500 per cubic meter)
-        cost_breakdown['recharge_system'] = recharge_volume_m3 * 2500
-    
-    # Fixed Components
-    cost_breakdown['first_flush_diverter'] = 3500
-    cost_breakdown['filtration_system'] = 4500
-    cost_breakdown['guttering_and_pipes'] = params['area'] * 15  # ₹15 per m² of catchment
-    cost_breakdown['installation_labor'] = sum(cost_breakdown.values()) * 0.15  # 15% of material cost
-    
-    total_cost = sum(cost_breakdown.values())
-    
-    # Enhanced Financial Analysis - considers both storage and recharge benefits
-    stored_water_m3_annual = recommendation_result['volume_to_store'] / 1000
-    recharged_water_m3_annual = recommendation_result['volume_to_recharge'] / 1000
-    
-    # Direct savings from stored water
-    direct_water_savings = stored_water_m3_annual * params['water_cost_per_m3']
-    
-    # Indirect benefits from groundwater recharge (estimated monetary value)
-    # Benefits: reduced flooding, groundwater table improvement, reduced municipal water stress
-    recharge_benefits = 0
-    if recharged_water_m3_annual > 0:
-        # Conservative estimate: ₹5 per m³ of recharged water in indirect benefits
-        # (flood mitigation, groundwater improvement, environmental benefits)
-        recharge_benefits = recharged_water_m3_annual * 5
-    
-    # Total annual savings/benefits
-    total_annual_savings = direct_water_savings + recharge_benefits
-    
-    # Financial metrics
-    payback_period = total_cost / total_annual_savings if total_annual_savings > 0 else float('inf')
-    
-    # Calculate 10-year ROI
-    if payback_period != float('inf') and payback_period > 0:
-        # ROI = (Total 10-year savings - Initial investment) / Initial investment * 100
-        total_10_year_savings = total_annual_savings * 10
-        maintenance_10_year = (total_cost * 0.02) * 10  # 2% annual maintenance for 10 years
-        net_10_year_benefit = total_10_year_savings - maintenance_10_year - total_cost
-        roi_10_year = (net_10_year_benefit / total_cost) * 100
-    else:
-        roi_10_year = -100  # Negative ROI if no payback
-    
-    return {
-        'design': design,
-        'cost_breakdown': cost_breakdown,
-        'total_cost': total_cost,
-        'annual_savings': total_annual_savings,  # Now includes both direct and indirect benefits
-        'direct_water_savings': direct_water_savings,
-        'recharge_benefits': recharge_benefits,
-        'payback_period_years': payback_period,
-        'roi_10_year': roi_10_year,  # Added missing ROI calculation
-        'flood_mitigation_benefit': recommendation_result['volume_to_recharge'] > 0,
-        'groundwater_recharge_m3_annual': recharged_water_m3_annual,
-        'maintenance_cost_annual': total_cost * 0.02  # 2% of system cost annually
-    }
+    file_id = getattr(uploaded_file, 'file_id', None)
+    layer = st.session_state.get('groundwater_layer')
+    if layer is None or file_id is None or st.session_state.get('groundwater_file_id') != file_id:
+        layer = load_groundwater_layer(uploaded_file.getvalue())
+        st.session_state.groundwater_layer = layer
+        st.session_state.groundwater_file_id = file_id
+        st.session_state.groundwater_gdf = layer.gdf
+        st.session_state.groundwater_hash = layer.content_hash
+    return layer
 
 # --- PDF REPORT GENERATION ---
 
@@ -1555,14 +1134,11 @@ def main():
     uploaded_file = st.sidebar.file_uploader(T('calc_upload_geojson'), type=['geojson'])
     if uploaded_file:
         try:
-            gdf = gpd.read_file(uploaded_file)
-            required_cols = ['post_monsoon_depth_m', 'principal_aquifer_type']
-            if all(col in gdf.columns for col in required_cols):
-                st.session_state.groundwater_gdf = gdf
-                st.session_state.data_source = 'uploaded'
-                st.sidebar.success(f"Loaded {len(gdf)} groundwater points")
-            else:
-                st.sidebar.error(f"Missing required columns: {required_cols}")
+            layer = load_uploaded_groundwater(uploaded_file)
+            st.session_state.data_source = 'uploaded'
+            st.sidebar.success(f"Loaded {len(layer)} groundwater points")
+        except GroundwaterLayerError as e:
+            st.sidebar.error(str(e))
         except Exception as e:
             st.sidebar.error(f"Error loading file: {e}")
     else:
@@ -1599,52 +1175,61 @@ def main():
     else:
         st.sidebar.info(f"📍 Using coordinates: {current_lat:.4f}°N, {current_lon:.4f}°E")
     
+    # Fetch rainfall and soil concurrently
+    site_data = fetch_site_data(current_lat, current_lon)
+    sources = site_data['sources']
+    
     # Show API status
     with st.sidebar.expander(T('calc_api_status'), expanded=False):
         st.write(f"**{T('calc_data_sources')}**")
-        st.write("• Rainfall: Open-Meteo API")
-        st.write("• Soil: ISRIC SoilGrids API")
+        st.write(f"• Rainfall: Open-Meteo API — {SOURCE_STATUS_LABELS[sources['rainfall'].status]} ({sources['rainfall'].elapsed:.1f} s)")
+        soil_provider = "Local soil tiles" if site_data['soil_info']['source'] == 'tiles' else "ISRIC SoilGrids API"
+        st.write(f"• Soil: {soil_provider} — {SOURCE_STATUS_LABELS[sources['soil'].status]} ({sources['soil'].elapsed:.1f} s)")
         st.write("• Coordinates: " + ("Map Selection" if st.session_state.get('coordinates_from_map', False) else "GPS/Manual"))
+        charts_info = chart_cache_info()
+        st.write(f"• Charts: {charts_info['entries']} cached ({charts_info['bytes'] / 1024:,.0f} KiB), "
+                 f"{charts_info['live_figures']} live figures")
+        reports_info = report_cache_info()
+        st.write(f"• PDF reports: {reports_info['memory_hits'] + reports_info['disk_hits']} cache hits, "
+                 f"{reports_info['misses']} builds")
+        jobs_info = report_jobs_info()
+        st.write(f"• PDF jobs: {jobs_info['running']} building, {jobs_info['queued']} queued, "
+                 f"{jobs_info['failed']} failed")
     
     # Get rainfall data with status tracking
-    params['annual_rainfall'] = get_annual_rainfall(current_lat, current_lon)
+    params['annual_rainfall'] = site_data['annual_rainfall']
     if params['annual_rainfall'] is None:
         st.error("Could not fetch rainfall data. Please check your internet connection and try again.")
         st.stop()
     
-    soil_type = get_soil_type(current_lat, current_lon)
+    soil_type = site_data['soil_type']
     
     # Display soil type result with proper API status tracking
     with st.sidebar.expander(T('calc_detected_soil'), expanded=False):
         st.write(f"**{T('calc_soil_type')}** {soil_type}")
         st.write(f"**{T('calc_infiltration_rate')}** {SOIL_INFILTRATION_RATES.get(soil_type, 13)} mm/hour")
         
-        # Show the actual source of the soil data
-        with st.spinner("Checking soil data source..."):
-            api_result = get_soil_from_isric(current_lat, current_lon)
-            
-            if api_result and api_result != "Unknown":
-                if api_result == soil_type:
-                    st.success("✅ Retrieved from ISRIC SoilGrids API")
-                else:
-                    st.success(f"✅ ISRIC API returned: {api_result}")
-                    st.info(f"📊 Currently using: {soil_type}")
-            else:
-                # Check if it matches geographic analysis
-                geo_result = get_soil_type_fallback(current_lat, current_lon)
-                if soil_type == geo_result:
-                    st.info("📍 Determined using geographic analysis")
-                    st.caption("⚠️ ISRIC API data not available for this location")
-                else:
-                    st.warning("🔄 Using fallback estimate")
-                    st.caption("API and geographic analysis both unavailable")
+        # Show where the soil classification came from (recorded by the lookup, no refetch)
+        soil_info = site_data['soil_info']
+        if soil_info['source'] == 'tiles':
+            st.success("✅ Read from local soil texture tiles")
+            st.caption(f"Clay {soil_info['clay_pct']:.0f}% · Sand {soil_info['sand_pct']:.0f}% ({soil_info['depth']})")
+        elif soil_info['source'] == 'isric':
+            st.success("✅ Retrieved from ISRIC SoilGrids API")
+            st.caption(f"Clay {soil_info['clay_pct']:.0f}% · Sand {soil_info['sand_pct']:.0f}% ({soil_info['depth']})")
+        elif soil_info['source'] == 'geographic':
+            st.info("📍 Determined using geographic analysis")
+            st.caption("⚠️ ISRIC API data not available for this location")
+        else:
+            st.warning("🔄 Using fallback estimate")
+            st.caption("API and geographic analysis both unavailable")
         
         # Add a button to force refresh soil data
         if st.button("🔄 Refresh Soil Data", key="refresh_soil"):
-            st.cache_data.clear()
+            clear_soil_cache(current_lat, current_lon)
             st.rerun()
     
-    monthly_rainfall = get_monthly_rainfall(current_lat, current_lon) or {m: 0.0 for m in ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']}
+    monthly_rainfall = site_data['monthly_rainfall'] or {m: 0.0 for m in ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']}
     
     if st.session_state.data_source == 'uploaded' and st.session_state.groundwater_gdf is not None:
         groundwater_data = query_groundwater_from_gdf(current_lat, current_lon, st.session_state.groundwater_gdf)
@@ -1716,201 +1301,14 @@ def main():
     
     def get_dark_theme_colors():
         """Colors matching config_dark.toml"""
-        return {
-            'bg_color': '#1A1F2E',  # backgroundColor from config_dark.toml
-            'text_color': '#E8EAED',  # textColor from config_dark.toml
-            'grid_color': '#242B3D',  # secondaryBackgroundColor from config_dark.toml
-            'primary_bar': '#00D4FF',  # primaryColor from config_dark.toml
-            'secondary_bar': '#F59E0B',  # Complementary amber color
-            'edge_color': '#242B3D'
-        }
+        return dict(DARK_THEME)
     
     def get_light_theme_colors():
         """Colors matching config.toml"""
-        return {
-            'bg_color': '#FAFBFC',  # backgroundColor from config.toml
-            'text_color': '#1E2329',  # textColor from config.toml
-            'grid_color': '#F0F2F5',  # secondaryBackgroundColor from config.toml
-            'primary_bar': '#0066CC',  # primaryColor from config.toml
-            'secondary_bar': '#FFA500',  # Complementary orange color
-            'edge_color': '#1E2329'
-        }
+        return dict(LIGHT_THEME)
     
     theme_colors = get_streamlit_theme_colors()
     
-    # Build figures for analytics and PDF with theme-aware styling
-    # Rainfall chart
-    fig_rain, ax_rain = plt.subplots(figsize=(10, 6))
-    fig_rain.patch.set_facecolor(theme_colors['bg_color'])
-    ax_rain.set_facecolor(theme_colors['bg_color'])
-    
-    months = list(monthly_rainfall.keys())
-    values = list(monthly_rainfall.values())
-    colors = [theme_colors['primary_bar'] if v >= (np.mean(values) if len(values) else 0) else theme_colors['secondary_bar'] for v in values]
-    bars = ax_rain.bar(months, values, color=colors, edgecolor=theme_colors['edge_color'], linewidth=1, alpha=0.8)
-    
-    ax_rain.set_xlabel('Month', fontsize=12, fontweight='bold', color=theme_colors['text_color'])
-    ax_rain.set_ylabel('Rainfall (mm)', fontsize=12, fontweight='bold', color=theme_colors['text_color'])
-    ax_rain.set_title('Monthly Rainfall Distribution (2023)', fontsize=14, fontweight='bold', color=theme_colors['text_color'])
-    ax_rain.grid(axis='y', alpha=0.3, linestyle='--', color=theme_colors['grid_color'])
-    ax_rain.tick_params(colors=theme_colors['text_color'])
-    ax_rain.spines['bottom'].set_color(theme_colors['text_color'])
-    ax_rain.spines['left'].set_color(theme_colors['text_color'])
-    ax_rain.spines['top'].set_visible(False)
-    ax_rain.spines['right'].set_visible(False)
-    
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        ax_rain.text(bar.get_x() + bar.get_width()/2., height, f'{value:.0f}', 
-                    ha='center', va='bottom', fontsize=9, color=theme_colors['text_color'], fontweight='bold')
-    plt.tight_layout()
-    
-    # Cost breakdown chart - Enhanced styling with theme support
-    costs = design_financial['cost_breakdown']
-    filtered_costs = {k: v for k, v in costs.items() if v > 0}
-    fig_cost, ax_cost = plt.subplots(figsize=(10, 8))
-    fig_cost.patch.set_facecolor(theme_colors['bg_color'])
-    ax_cost.set_facecolor(theme_colors['bg_color'])
-    
-    if filtered_costs:
-        # Dynamic theme-aware professional color palette
-        is_dark_theme = theme_colors['bg_color'].lower() in ['#1a1f2e', '#0e1117', '#262730']
-        
-        if is_dark_theme:  # Dark mode colors - brighter and more vibrant
-            custom_colors = [
-                theme_colors['primary_bar'],  # Primary theme color
-                '#ffb74d',  # Light Orange
-                '#81c784',  # Light Green
-                '#f06292',  # Light Pink
-                '#ba68c8',  # Light Purple
-                '#4db6ac',  # Light Teal
-                '#ffcc02',  # Light Yellow
-                '#ff8a65',  # Light Deep Orange
-            ]
-        else:  # Light mode colors - deeper and more professional
-            custom_colors = [
-                theme_colors['primary_bar'],  # Primary theme color
-                theme_colors['secondary_bar'],  # Secondary theme color
-                '#2E8B57',  # Sea Green
-                '#4682B4',  # Steel Blue
-                '#FF6347',  # Tomato
-                '#9370DB',  # Medium Purple
-                '#20B2AA',  # Light Sea Green
-                '#DC143C',  # Crimson
-            ]
-        
-        labels = [k.replace('_', ' ').title() for k in filtered_costs.keys()]
-        values = list(filtered_costs.values())
-        
-        # Use custom colors, cycling through if needed
-        colors = [custom_colors[i % len(custom_colors)] for i in range(len(values))]
-        
-        # Create enhanced pie chart
-        wedges, texts, autotexts = ax_cost.pie(
-            values, 
-            labels=labels, 
-            autopct=lambda pct: f'{pct:.1f}%' if pct <= 5 else f'{pct:.1f}%\n(₹{pct/100 * sum(values)/1000:.0f}K)',
-            colors=colors, 
-            startangle=90,
-            explode=[0.05 if v == max(values) else 0 for v in values],  # Explode the largest slice
-            shadow=True,
-            wedgeprops=dict(width=0.8, edgecolor=theme_colors['edge_color'], linewidth=2)
-        )
-        
-        ax_cost.set_title('System Cost Distribution', fontsize=16, fontweight='bold', 
-                         pad=20, color=theme_colors['text_color'])
-        
-        # Improve text styling with theme colors
-        for text in texts:
-            text.set_fontsize(11)
-            text.set_fontweight('bold')
-            text.set_color(theme_colors['text_color'])
-        
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(9)
-        
-        # Add a legend with cost values
-        legend_labels = [f'{label}: ₹{value/1000:.0f}K ({value/sum(values)*100:.1f}%)' 
-                       for label, value in zip(labels, values)]
-        legend = ax_cost.legend(wedges, legend_labels, title="Components", loc="center left", 
-                               bbox_to_anchor=(1, 0, 0.5, 1), fontsize=10)
-        legend.get_title().set_color(theme_colors['text_color'])
-        for text in legend.get_texts():
-            text.set_color(theme_colors['text_color'])
-        
-        ax_cost.axis('equal')
-        plt.tight_layout()
-    
-    # Savings projection chart - Enhanced styling with theme support
-    fig_save, ax_save = plt.subplots(figsize=(10, 6))
-    fig_save.patch.set_facecolor(theme_colors['bg_color'])
-    ax_save.set_facecolor(theme_colors['bg_color'])
-    
-    years = list(range(1, 11))
-    annual_savings_arr = [design_financial['annual_savings']] * 10
-    annual_maintenance_arr = [design_financial['maintenance_cost_annual']] * 10
-    net_annual = [s - m for s, m in zip(annual_savings_arr, annual_maintenance_arr)]
-    cumulative_savings = np.cumsum(net_annual)
-    
-    # Dynamic theme-aware colors for savings chart
-    is_dark_theme = theme_colors['bg_color'].lower() in ['#1a1f2e', '#0e1117', '#262730']
-    
-    if is_dark_theme:
-        savings_color = theme_colors['primary_bar']  # Use theme primary color
-        investment_color = '#ff8a65'  # Light orange for dark mode
-    else:
-        savings_color = theme_colors['primary_bar']  # Use theme primary color
-        investment_color = '#DC143C'  # Dark red for light mode
-    
-    bars = ax_save.bar(years, cumulative_savings, alpha=0.8, color=savings_color, 
-                      label='Cumulative Net Savings', edgecolor=theme_colors['edge_color'], linewidth=1)
-    
-    # Add investment line with better styling
-    ax_save.axhline(y=design_financial['total_cost'], color=investment_color, linestyle='--', 
-                   linewidth=2.5, label='Initial Investment', alpha=0.9)
-    
-    # Find and mark payback period if within 10 years
-    investment = design_financial['total_cost']
-    payback_year = next((i+1 for i, val in enumerate(cumulative_savings) if val >= investment), None)
-    if payback_year and payback_year <= 10:
-        # Use the same color as investment line for consistency
-        marker_color = investment_color
-        ax_save.plot(payback_year, investment, 'o', color=marker_color, markersize=8, 
-                    markeredgecolor='white', markeredgewidth=2)
-        ax_save.annotate(f'Payback: Year {payback_year}', 
-                        xy=(payback_year, investment),
-                        xytext=(payback_year + 0.5, investment * 0.8),
-                        arrowprops=dict(arrowstyle='->', color=theme_colors['text_color']),
-                        fontsize=10, fontweight='bold', color=theme_colors['text_color'])
-    
-    # Enhanced styling with theme colors
-    ax_save.set_xlabel('Years', fontsize=12, fontweight='bold', color=theme_colors['text_color'])
-    ax_save.set_ylabel('Amount (₹)', fontsize=12, fontweight='bold', color=theme_colors['text_color'])
-    ax_save.set_title('10-Year Financial Projection', fontsize=14, fontweight='bold', 
-                     pad=20, color=theme_colors['text_color'])
-    
-    # Style legend and grid with theme colors
-    ax_save.tick_params(colors=theme_colors['text_color'])
-    ax_save.spines['bottom'].set_color(theme_colors['text_color'])
-    ax_save.spines['left'].set_color(theme_colors['text_color'])
-    
-    legend = ax_save.legend(fontsize=10, framealpha=0.9)
-    legend.get_frame().set_facecolor(theme_colors['bg_color'])
-    legend.get_frame().set_edgecolor(theme_colors['text_color'])
-    for text in legend.get_texts():
-        text.set_color(theme_colors['text_color'])
-    
-    ax_save.grid(True, alpha=0.3, linestyle='--', color=theme_colors['grid_color'])
-    
-    # Remove top and right spines for cleaner look
-    for spine in ['top', 'right']:
-        ax_save.spines[spine].set_visible(False)
-    
-    ax_save.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/1000:.0f}K'))
-    plt.tight_layout()
-    
     # Persist computed artifacts for PDF
     st.session_state.assessment_params = params
     st.session_state.recommendation_result = recommendation
@@ -1918,9 +1316,8 @@ def main():
     st.session_state.soil_type = soil_type
     st.session_state.data_source_message = data_source_msg
     st.session_state.monthly_rainfall = monthly_rainfall
-    st.session_state.fig_rain = fig_rain
-    st.session_state.fig_cost = fig_cost
-    st.session_state.fig_save = fig_save
+    # Report charts are drawn by the report build from these inputs, not on every rerun
+    st.session_state.report_chart_theme = theme_colors
     
     # Header recommendation and KPIs
     # Translate recommendation type
@@ -2027,7 +1424,7 @@ def main():
     
     with t4:
         st.header(T('results_hydro_analysis'))
-        st.pyplot(fig_rain)
+        st.vega_lite_chart(rainfall_spec(monthly_rainfall, theme_colors), use_container_width=True)
         col_a, col_b = st.columns(2)
         with col_a:
             st.subheader(T('results_rainfall_statistics'))
@@ -2096,14 +1493,11 @@ def show_site_selection():
         uploaded_file = st.file_uploader("Upload GeoJSON file with groundwater data", type=['geojson'])
         if uploaded_file:
             try:
-                gdf = gpd.read_file(uploaded_file)
-                required_cols = ['post_monsoon_depth_m', 'principal_aquifer_type']
-                if all(col in gdf.columns for col in required_cols):
-                    st.session_state.groundwater_gdf = gdf
-                    st.session_state.data_source = 'uploaded'
-                    st.success(f"✅ Successfully loaded {len(gdf)} groundwater data points")
-                else:
-                    st.error(f"❌ Missing required columns: {required_cols}")
+                layer = load_uploaded_groundwater(uploaded_file)
+                st.session_state.data_source = 'uploaded'
+                st.success(f"✅ Successfully loaded {len(layer)} groundwater data points")
+            except GroundwaterLayerError as e:
+                st.error(f"❌ {e}")
             except Exception as e:
                 st.error(f"❌ Error loading file: {e}")
     
@@ -2177,15 +1571,16 @@ def run_complete_assessment():
     # Ensure both APIs use the same coordinates
     current_lat, current_lon = params['latitude'], params['longitude']
     
-    params['annual_rainfall'] = get_annual_rainfall(current_lat, current_lon)
+    site_data = fetch_site_data(current_lat, current_lon)
+    params['annual_rainfall'] = site_data['annual_rainfall']
     if params['annual_rainfall'] is None:
         st.error("Could not fetch rainfall data. Please check your internet connection and try again.")
         return
     
-    soil_type = get_soil_type(current_lat, current_lon)
+    soil_type = site_data['soil_type']
     
     # Monthly rainfall for charts
-    monthly_rainfall = get_monthly_rainfall(current_lat, current_lon)
+    monthly_rainfall = site_data['monthly_rainfall']
     if monthly_rainfall is None:
         monthly_rainfall = {m: 0.0 for m in ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']}
     
@@ -2216,121 +1611,6 @@ def run_complete_assessment():
     
     design_financial = calculate_design_and_cost(recommendation_result, params)
     
-    # Build charts to embed in PDF
-    fig_rain, ax_rain = plt.subplots(figsize=(10, 6))
-    months = list(monthly_rainfall.keys())
-    values = list(monthly_rainfall.values())
-    colors = ['#1f77b4' if v >= (np.mean(values) if values else 0) else '#ff7f0e' for v in values]
-    bars = ax_rain.bar(months, values, color=colors, edgecolor='black', linewidth=1)
-    ax_rain.set_xlabel('Month', fontsize=12, fontweight='bold')
-    ax_rain.set_ylabel('Rainfall (mm)', fontsize=12, fontweight='bold')
-    ax_rain.set_title('Monthly Rainfall Distribution (2023)', fontsize=14, fontweight='bold')
-    ax_rain.grid(axis='y', alpha=0.3, linestyle='--')
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        ax_rain.text(bar.get_x() + bar.get_width()/2., height, f'{value:.0f}', ha='center', va='bottom', fontsize=9)
-    plt.tight_layout()
-
-    # Cost breakdown chart - Enhanced for PDF
-    costs = design_financial['cost_breakdown']
-    filtered_costs = {k: v for k, v in costs.items() if v > 0}
-    fig_cost, ax_cost = plt.subplots(figsize=(10, 8))
-    if filtered_costs:
-        # Use the same professional color palette as the web interface
-        custom_colors = [
-            '#2E8B57',  # Sea Green
-            '#FFD700',  # Gold
-            '#4682B4',  # Steel Blue
-            '#FF6347',  # Tomato
-            '#9370DB',  # Medium Purple
-            '#20B2AA',  # Light Sea Green
-            '#FFA500',  # Orange
-            '#DC143C',  # Crimson
-        ]
-        
-        labels = [k.replace('_', ' ').title() for k in filtered_costs.keys()]
-        values = list(filtered_costs.values())
-        
-        # Use custom colors, cycling through if needed
-        colors = [custom_colors[i % len(custom_colors)] for i in range(len(values))]
-        
-        # Create enhanced pie chart for PDF
-        wedges, texts, autotexts = ax_cost.pie(
-            values, 
-            labels=labels, 
-            autopct=lambda pct: f'{pct:.1f}%\n(₹{pct/100 * sum(values)/1000:.0f}K)' if pct > 5 else f'{pct:.1f}%',
-            colors=colors, 
-            startangle=90,
-            explode=[0.05 if v == max(values) else 0 for v in values],  # Explode the largest slice
-            shadow=True,
-            wedgeprops=dict(width=0.8, edgecolor='white', linewidth=2)
-        )
-        
-        ax_cost.set_title('System Cost Distribution', fontsize=16, fontweight='bold', pad=20)
-        
-        # Improve text styling
-        for text in texts:
-            text.set_fontsize(11)
-            text.set_fontweight('bold')
-        
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(9)
-        
-        # Add a legend with cost values for PDF
-        legend_labels = [f'{label}: ₹{value/1000:.0f}K ({value/sum(values)*100:.1f}%)' 
-                       for label, value in zip(labels, values)]
-        ax_cost.legend(wedges, legend_labels, title="Components", loc="center left", 
-                     bbox_to_anchor=(1, 0, 0.5, 1), fontsize=10)
-        
-        ax_cost.axis('equal')
-        plt.tight_layout()
-
-    # Savings projection chart - Enhanced for PDF
-    fig_save, ax_save = plt.subplots(figsize=(10, 6))
-    years = list(range(1, 11))
-    annual_savings_arr = [design_financial['annual_savings']] * 10
-    annual_maintenance_arr = [design_financial['maintenance_cost_annual']] * 10
-    net_annual = [s - m for s, m in zip(annual_savings_arr, annual_maintenance_arr)]
-    cumulative_savings = np.cumsum(net_annual)
-    
-    # Enhanced styling for PDF
-    bars = ax_save.bar(years, cumulative_savings, alpha=0.8, color='#2E8B57', 
-                      label='Cumulative Net Savings', edgecolor='white', linewidth=1)
-    
-    # Add investment line with better styling
-    ax_save.axhline(y=design_financial['total_cost'], color='#DC143C', linestyle='--', 
-                   linewidth=2.5, label='Initial Investment', alpha=0.9)
-    
-    # Find and mark payback period if within 10 years
-    investment = design_financial['total_cost']
-    payback_year = next((i+1 for i, val in enumerate(cumulative_savings) if val >= investment), None)
-    if payback_year and payback_year <= 10:
-        ax_save.plot(payback_year, investment, 'ro', markersize=8, 
-                    markeredgecolor='white', markeredgewidth=2)
-        ax_save.annotate(f'Payback: Year {payback_year}', 
-                        xy=(payback_year, investment),
-                        xytext=(payback_year + 0.5, investment * 0.8),
-                        arrowprops=dict(arrowstyle='->', color='black'),
-                        fontsize=10, fontweight='bold')
-    
-    # Enhanced styling
-    ax_save.set_xlabel('Years', fontsize=12, fontweight='bold')
-    ax_save.set_ylabel('Amount (₹)', fontsize=12, fontweight='bold')
-    ax_save.set_title('10-Year Financial Projection', fontsize=14, fontweight='bold', pad=20)
-    
-    # Style legend and grid
-    ax_save.legend(fontsize=10, framealpha=0.9)
-    ax_save.grid(True, alpha=0.3, linestyle='--')
-    
-    # Remove top and right spines for cleaner look
-    for spine in ['top', 'right']:
-        ax_save.spines[spine].set_visible(False)
-    
-    ax_save.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/1000:.0f}K'))
-    plt.tight_layout()
-    
     # Store results in session state
     st.session_state.assessment_params = params
     st.session_state.recommendation_result = recommendation_result
@@ -2338,9 +1618,7 @@ def run_complete_assessment():
     st.session_state.soil_type = soil_type
     st.session_state.data_source_message = data_source_msg
     st.session_state.monthly_rainfall = monthly_rainfall
-    st.session_state.fig_rain = fig_rain
-    st.session_state.fig_cost = fig_cost
-    st.session_state.fig_save = fig_save
+    st.session_state.report_chart_theme = LIGHT_THEME
     
     status_text.text("Assessment completed!")
     progress_bar.progress(100)
@@ -2429,9 +1707,7 @@ def show_results_and_report():
         st.header(T('results_hydro_analysis'))
         monthly = st.session_state.get('monthly_rainfall', None)
         if monthly:
-            fig = st.session_state.get('fig_rain')
-            if fig:
-                st.pyplot(fig)
+            st.vega_lite_chart(rainfall_spec(monthly, LIGHT_THEME), use_container_width=True)
             col_a, col_b = st.columns([1, 1])
             with col_a:
                 st.subheader(T('results_rainfall_statistics'))
@@ -2527,87 +1803,7 @@ def show_financial_analysis_tab(design_financial, recommendation):
         filtered_costs = {k: v for k, v in costs.items() if v > 0}
         
         if filtered_costs:
-            # Enhanced pie chart with professional styling and dark mode support
-            fig, ax = plt.subplots(figsize=(10, 8))
-            
-            # Detect if we're in dark mode (simple heuristic based on Streamlit's theme)
-            # Set dark mode compatible styling
-            is_dark_mode = True  # We'll assume dark mode for better compatibility
-            
-            if is_dark_mode:
-                fig.patch.set_facecolor('#0e1117')  # Streamlit dark background
-                ax.set_facecolor('#0e1117')
-                text_color = '#ffffff'
-                title_color = '#ffffff'
-            else:
-                fig.patch.set_facecolor('white')
-                ax.set_facecolor('white')
-                text_color = '#2c3e50'
-                title_color = '#2c3e50'
-            
-            # Custom color palette - professional and visually appealing
-            custom_colors = [
-                '#2E8B57',  # Sea Green
-                '#FFD700',  # Gold
-                '#4682B4',  # Steel Blue
-                '#FF6347',  # Tomato
-                '#9370DB',  # Medium Purple
-                '#20B2AA',  # Light Sea Green
-                '#FFA500',  # Orange
-                '#DC143C',  # Crimson
-            ]
-            
-            labels = [k.replace('_', ' ').title() for k in filtered_costs.keys()]
-            values = list(filtered_costs.values())
-            
-            # Use custom colors, cycling through if needed
-            colors = [custom_colors[i % len(custom_colors)] for i in range(len(values))]
-            
-            # Create pie chart with enhanced styling
-            wedges, texts, autotexts = ax.pie(
-                values, 
-                labels=labels, 
-                autopct=lambda pct: f'{pct:.1f}%\n(₹{pct/100 * sum(values)/1000:.0f}K)' if pct > 5 else f'{pct:.1f}%',
-                colors=colors, 
-                startangle=90,
-                explode=[0.05 if v == max(values) else 0 for v in values],  # Explode the largest slice
-                shadow=True,
-                wedgeprops=dict(width=0.8, edgecolor='white', linewidth=2)
-            )
-            
-            # Enhanced title with better styling
-            ax.set_title(T('results_cost_distribution'), fontsize=16, fontweight='bold', 
-                        pad=20, color=title_color)
-            
-            # Improve text styling for dark mode compatibility
-            for text in texts:
-                text.set_fontsize(11)
-                text.set_fontweight('bold')
-                text.set_color(text_color)
-            
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-                autotext.set_fontsize(9)
-            
-            # Add a legend with cost values
-            legend_labels = [f'{label}: ₹{value/1000:.0f}K ({value/sum(values)*100:.1f}%)' 
-                           for label, value in zip(labels, values)]
-            legend = ax.legend(wedges, legend_labels, title="Components", loc="center left", 
-                             bbox_to_anchor=(1, 0, 0.5, 1), fontsize=10)
-            
-            # Style legend for dark mode
-            legend.get_title().set_color(text_color)
-            for text in legend.get_texts():
-                text.set_color(text_color)
-            
-            # Equal aspect ratio ensures that pie is drawn as a circle
-            ax.axis('equal')
-            
-            # Adjust layout to prevent legend cutoff
-            plt.tight_layout()
-            
-            st.pyplot(fig)
+            st.vega_lite_chart(cost_share_spec(filtered_costs, T('results_cost_distribution')), use_container_width=True)
         
         # Cost summary table
         st.markdown(f"""
@@ -2625,125 +1821,18 @@ def show_financial_analysis_tab(design_financial, recommendation):
         
         # Create bar chart for cost breakdown
         if filtered_costs:
-            # Create bar chart
-            fig_bar, ax_bar = plt.subplots(figsize=(10, 6))
-            
-            # Set dark mode compatible styling
-            is_dark_mode = True  # Assume dark mode for better compatibility
-            
-            if is_dark_mode:
-                fig_bar.patch.set_facecolor('#0e1117')  # Streamlit dark background
-                ax_bar.set_facecolor('#0e1117')
-                text_color = '#ffffff'
-                grid_color = '#404040'
-            else:
-                fig_bar.patch.set_facecolor('white')
-                ax_bar.set_facecolor('white')
-                text_color = '#2c3e50'
-                grid_color = '#cccccc'
-            
-            # Prepare data for bar chart
-            components = [k.replace('_', ' ').title() for k in filtered_costs.keys()]
-            cost_values = list(filtered_costs.values())
-            
-            # Create horizontal bar chart for better readability
-            bars = ax_bar.barh(components, cost_values, color=colors, alpha=0.8, 
-                              edgecolor='white', linewidth=1)
-            
-            # Style the chart
-            ax_bar.set_xlabel('Cost (₹)', fontsize=12, fontweight='bold', color=text_color)
-            ax_bar.set_ylabel('Components', fontsize=12, fontweight='bold', color=text_color)
-            ax_bar.set_title('Cost Breakdown by Component', fontsize=14, fontweight='bold', 
-                           color=text_color, pad=20)
-            
-            # Add value labels on bars
-            for bar, value in zip(bars, cost_values):
-                width = bar.get_width()
-                ax_bar.text(width + max(cost_values) * 0.02, bar.get_y() + bar.get_height()/2,
-                           f'₹{value/1000:.0f}K', ha='left', va='center', 
-                           fontweight='bold', fontsize=10, color=text_color)
-            
-            # Style grid and ticks
-            ax_bar.grid(True, alpha=0.3, color=grid_color, linestyle='--', axis='x')
-            ax_bar.tick_params(colors=text_color)
-            
-            # Remove top and right spines
-            for spine in ['top', 'right']:
-                ax_bar.spines[spine].set_visible(False)
-            
-            # Style remaining spines
-            for spine in ['bottom', 'left']:
-                ax_bar.spines[spine].set_color(text_color)
-            
-            # Format x-axis labels
-            ax_bar.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/1000:.0f}K'))
-            
-            # Adjust layout
-            plt.tight_layout()
-            
-            st.pyplot(fig_bar)
+            st.vega_lite_chart(cost_components_spec(filtered_costs), use_container_width=True)
         
         if design_financial['annual_savings'] > 0:
-            # Create savings projection chart
+            # Cumulative savings for the projection chart and ROI
             years = list(range(1, 11))
             annual_savings = [design_financial['annual_savings']] * 10
             annual_maintenance = [design_financial['maintenance_cost_annual']] * 10
             net_annual_savings = [s - m for s, m in zip(annual_savings, annual_maintenance)]
             cumulative_savings = np.cumsum(net_annual_savings)
             
-            # Create financial projection chart with dark mode support
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            # Set dark mode compatible styling
-            is_dark_mode = True  # Assume dark mode for better compatibility
-            
-            if is_dark_mode:
-                fig.patch.set_facecolor('#0e1117')  # Streamlit dark background
-                ax.set_facecolor('#0e1117')
-                text_color = '#ffffff'
-                grid_color = '#404040'
-            else:
-                fig.patch.set_facecolor('white')
-                ax.set_facecolor('white')
-                text_color = '#2c3e50'
-                grid_color = '#cccccc'
-            
-            # Plot with enhanced styling
-            bars = ax.bar(years, cumulative_savings, alpha=0.8, color='#2E8B57', 
-                         label='Cumulative Net Savings', edgecolor='white', linewidth=1)
-            
-            # Add investment line
-            ax.axhline(y=design_financial['total_cost'], color='#DC143C', linestyle='--', 
-                      linewidth=2.5, label='Initial Investment', alpha=0.9)
-            
-            # Style axes and labels
-            ax.set_xlabel('Years', fontsize=12, fontweight='bold', color=text_color)
-            ax.set_ylabel('Amount (₹)', fontsize=12, fontweight='bold', color=text_color)
-            ax.set_title(T('results_financial_projection'), fontsize=14, fontweight='bold', 
-                        color=text_color, pad=20)
-            
-            # Style legend
-            legend = ax.legend(fontsize=10, framealpha=0.9)
-            legend.get_frame().set_facecolor('#2d2d2d' if is_dark_mode else 'white')
-            for text in legend.get_texts():
-                text.set_color(text_color)
-            
-            # Style grid and ticks
-            ax.grid(True, alpha=0.3, color=grid_color, linestyle='--')
-            ax.tick_params(colors=text_color)
-            
-            # Remove top and right spines
-            for spine in ['top', 'right']:
-                ax.spines[spine].set_visible(False)
-            
-            # Style remaining spines
-            for spine in ['bottom', 'left']:
-                ax.spines[spine].set_color(text_color)
-            
-            # Format y-axis labels
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/1000:.0f}K'))
-            
-            st.pyplot(fig)
+            st.vega_lite_chart(projection_spec(design_financial, T('results_financial_projection')),
+                               use_container_width=True)
             
             # Financial metrics
             payback_years = design_financial['payback_period_years']
@@ -2849,6 +1938,64 @@ def show_site_data_tab(params, soil_type):
     for factor in suitability_factors:
         st.markdown(f"• {factor}")
 
+def show_report_download(report_id: str, build_args: tuple):
+    """Generate button for the session's report, then its download once the background build is done.
+
+    A build starts only when the user asks for it, and a session has one build
+    in flight at most: a replaced report's job is cancelled if it is still
+    queued, else waited for.
+    """
+    def blocking_report() -> Optional[str]:
+        previous = st.session_state.get('report_job_key')
+        if previous and previous != report_id and not cancel_report(previous):
+            return previous
+        return None
+
+    def waiting() -> bool:
+        status = report_status(report_id)
+        if status is not None:
+            return status.state not in (DONE, FAILED)
+        return blocking_report() is not None
+
+    polling = waiting()
+
+    @st.fragment(run_every=REPORT_POLL_SECONDS if polling else None)
+    def report_download():
+        if polling and not waiting():
+            # Rerun the page once so the finished build stops the polling
+            st.rerun()
+        current = report_status(report_id)
+        if current is None:
+            if blocking_report() is not None:
+                st.info("⏳ Your previous report is still being generated; you can generate this one when it is done.")
+            elif st.button("📄 Generate PDF report", key='report_generate', type="primary"):
+                submitted = request_report(report_id, build_report_pdf, *build_args)
+                if submitted.state == BUSY:
+                    st.info("⏳ Many reports are being generated right now; please try again in a moment.")
+                else:
+                    st.session_state.report_job_key = report_id
+                    st.rerun()
+        elif current.state == DONE:
+            st.success("Your comprehensive assessment report is ready!")
+            st.download_button(
+                label=T('results_download_pdf'),
+                data=current.pdf,
+                file_name=f"Hydro_Assess_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+                mime="application/pdf",
+                type="primary"
+            )
+        elif current.state == FAILED:
+            st.error(T('results_pdf_generation_error') + f": {current.error}")
+            if st.button("🔄 Retry report generation", key='report_retry'):
+                request_report(report_id, build_report_pdf, *build_args, retry=True)
+                st.session_state.report_job_key = report_id
+                st.rerun()
+        else:
+            st.info(f"⏳ Generating comprehensive PDF report in the background... ({current.elapsed:.0f} s)")
+
+    report_download()
+
+
 def show_summary_report_tab(params, recommendation, design_financial, soil_type):
     st.header(T('results_executive_summary'))
     
@@ -2860,37 +2007,23 @@ def show_summary_report_tab(params, recommendation, design_financial, soil_type)
         'aquifer_yield': params.get('aquifer_yield', 'Moderate') if params.get('aquifer_yield') and params.get('aquifer_yield').strip() else 'Moderate'
     }
     
+    language = get_current_language()
     try:
-        charts = {
-            'rainfall_chart': st.session_state.get('fig_rain'),
-            'cost_chart': st.session_state.get('fig_cost'),
-            'savings_chart': st.session_state.get('fig_save')
-        }
-        
-        # Generate PDF with better error handling
-        with st.spinner('Generating comprehensive PDF report...'):
-            # Add missing site data fields
-            site_data['pre_monsoon_depth_m'] = params.get('pre_monsoon_depth_m', params['post_monsoon_depth_m'] + 2.0)
-            pdf_buffer = generate_professional_pdf(params, recommendation, design_financial, site_data, charts)
-            pdf_bytes = pdf_buffer.getvalue()
-            
-        # Validate PDF bytes
-        if not pdf_bytes or len(pdf_bytes) == 0:
-            raise ValueError("Generated PDF is empty")
-            
-        if not isinstance(pdf_bytes, bytes):
-            raise TypeError(f"PDF generation returned {type(pdf_bytes)} instead of bytes")
-        
-        st.success("Your comprehensive assessment report is ready!")
-        
-        # Download button
-        st.download_button(
-            label=T('results_download_pdf'),
-            data=pdf_bytes,
-            file_name=f"Hydro_Assess_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
-            mime="application/pdf",
-            type="primary"
-        )
+        monthly_rainfall = st.session_state.get('monthly_rainfall') or {}
+        chart_theme = st.session_state.get('report_chart_theme') or LIGHT_THEME
+        # Add missing site data fields
+        site_data['pre_monsoon_depth_m'] = params.get('pre_monsoon_depth_m', params['post_monsoon_depth_m'] + 2.0)
+        
+        # The report is built on request by a background job keyed by everything that goes
+        # into it, so unchanged inputs reuse the stored PDF and the page keeps responding meanwhile
+        if not report_language_available(language):
+            st.warning("⚠️ PDF reports are not available in this language because no report font for it "
+                       "is installed. The report below is in English.")
+            language = 'en'
+        chart_keys = report_chart_keys(monthly_rainfall, design_financial, chart_theme)
+        report_id = report_key(params, recommendation, design_financial, site_data, chart_keys, language)
+        show_report_download(report_id, (params, recommendation, design_financial, site_data,
+                                         monthly_rainfall, chart_theme, language))
         
         # Report preview
         st.subheader(T('results_report_preview'))
@@ -2953,7 +2086,8 @@ def show_summary_report_tab(params, recommendation, design_financial, soil_type)
             # Try alternative PDF generation without charts
             try:
                 st.warning(T('results_generating_simplified'))
-                pdf_bytes_simple = generate_pdf_report(params, recommendation, design_financial, site_data, None)
+                pdf_bytes_simple = build_report_pdf(params, recommendation, design_financial, site_data, None, None,
+                                                    language)
                 
                 if pdf_bytes_simple and isinstance(pdf_bytes_simple, bytes):
                     st.success(T('results_simplified_success'))
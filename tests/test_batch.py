@@ -0,0 +1,86 @@
+"""assess_sites gives the same recommendation, design and costs as the scalar engine for every site."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hydro_core.batch import REASONS, assess_sites
+from hydro_core.engine import (METRO_CITY_TYPE, RUNOFF_COEFFICIENTS, calculate_design_and_cost,
+                               generate_recommendation)
+
+OTHER_CITY_TYPE = "Tier 2 & 3 (Lower Density)"
+
+RECOMMENDATION_FIELDS = ['recommendation_type', 'reason', 'annual_potential', 'volume_to_store',
+                         'volume_to_recharge', 'household_demand_20_days', 'efficiency_rating']
+FINANCIAL_FIELDS = ['total_cost', 'annual_savings', 'direct_water_savings', 'recharge_benefits',
+                    'payback_period_years', 'roi_10_year', 'flood_mitigation_benefit',
+                    'groundwater_recharge_m3_annual', 'maintenance_cost_annual']
+COST_FIELDS = ['storage_tank', 'recharge_system', 'first_flush_diverter', 'filtration_system',
+               'guttering_and_pipes', 'installation_labor']
+
+
+def _random_sites(n, seed):
+    rng = np.random.default_rng(seed)
+    sites = pd.DataFrame({
+        # Log-uniform, so small roofs (one pit, metro storage-only) are as common as large ones
+        'area': np.exp(rng.uniform(math.log(5), math.log(2000), n)).round(1),
+        'annual_rainfall': rng.uniform(200, 3000, n).round(1),
+        'runoff_coefficient': rng.choice(list(RUNOFF_COEFFICIENTS.values()), n),
+        'household_size': rng.integers(1, 13, n),
+        'post_monsoon_depth_m': rng.uniform(2, 30, n).round(2),
+        'city_type': rng.choice([METRO_CITY_TYPE, OTHER_CITY_TYPE], n),
+        'water_cost_per_m3': rng.uniform(10, 100, n).round(1),
+    })
+    # Rule thresholds themselves
+    sites.loc[0, 'annual_rainfall'] = 500
+    sites.loc[1, 'post_monsoon_depth_m'] = 8.0
+    return sites
+
+
+def _num_pits(design):
+    recharge = design.get('recharge_system')
+    if recharge is None:
+        return 0
+    configuration = recharge['configuration']
+    return 1 if configuration == "Single Recharge Pit" else int(configuration.split()[0])
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_batch_matches_scalar_engine(seed):
+    sites = _random_sites(300, seed)
+    batch = assess_sites(sites)
+    assert set(batch['reason']) == set(REASONS)
+
+    for i, params in enumerate(sites.to_dict('records')):
+        row = batch.iloc[i]
+        recommendation = generate_recommendation(params)
+        financial = calculate_design_and_cost(recommendation, params)
+
+        for field in RECOMMENDATION_FIELDS:
+            assert row[field] == recommendation[field], (i, field)
+        for field in FINANCIAL_FIELDS:
+            assert row[field] == financial[field], (i, field)
+        for field in COST_FIELDS:
+            assert row[f'{field}_cost'] == financial['cost_breakdown'].get(field, 0), (i, field)
+
+        design = financial['design']
+        tank = design.get('storage_tank')
+        assert row['tank_volume_m3'] == (tank['volume_m3'] if tank else 0), i
+        if tank:
+            diameter, height = row['tank_diameter_m'], row['tank_height_m']
+            assert tank['dimensions'] == f"{diameter:.1f}m Diameter × {height:.1f}m Height", i
+        recharge = design.get('recharge_system')
+        assert row['recharge_volume_m3'] == (recharge['volume_m3'] if recharge else 0), i
+        assert row['num_pits'] == _num_pits(design), i
+
+
+def test_zero_potential_never_pays_back():
+    sites = _random_sites(2, 0).assign(area=0.0)
+    batch = assess_sites(sites)
+    for i, params in enumerate(sites.to_dict('records')):
+        financial = calculate_design_and_cost(generate_recommendation(params), params)
+        assert math.isinf(batch['payback_period_years'].iloc[i])
+        assert financial['payback_period_years'] == batch['payback_period_years'].iloc[i]
+        assert financial['roi_10_year'] == batch['roi_10_year'].iloc[i] == -100
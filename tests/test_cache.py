@@ -0,0 +1,65 @@
+"""DiskCache keeps to its size budget, expires old entries and serves them anyway when offline."""
+
+import pytest
+
+from hydro_core import cache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, 'time', clock)
+    return clock
+
+
+def test_least_recently_used_evicted_over_budget(tmp_path, clock):
+    disk = cache.DiskCache(str(tmp_path), max_bytes=300)
+    for key in ('a', 'b', 'c'):
+        clock.now += 1
+        disk.set(key, key.encode() * 100)
+    assert disk.total_bytes() == 300
+
+    clock.now += 1
+    assert disk.get('a') == b'a' * 100  # 'b' is now the least recently used
+    clock.now += 1
+    disk.set('d', b'd' * 100)
+
+    assert disk.get('b') is None
+    assert [disk.get(key) for key in ('a', 'c', 'd')] == [b'a' * 100, b'c' * 100, b'd' * 100]
+    assert disk.total_bytes() == 300
+
+
+def test_entry_expires_after_age_limit(tmp_path, clock):
+    disk = cache.DiskCache(str(tmp_path), max_age_seconds=60)
+    disk.set('short', b'1')
+    disk.set('long', b'2', max_age_seconds=3600)
+
+    clock.now += 59
+    assert disk.get('short') == b'1'
+    clock.now += 2
+    assert disk.get('short') is None
+    assert disk.get('long') == b'2'
+    assert disk.total_bytes() == 1
+
+
+def test_offline_reads_expired_entries(tmp_path, clock):
+    cache.DiskCache(str(tmp_path), max_age_seconds=60).set('rainfall', b'series')
+    clock.now += 3600
+
+    offline = cache.DiskCache(str(tmp_path), max_age_seconds=60, offline=True)
+    assert offline.get('rainfall') == b'series'
+    # Writing while offline does not purge expired rows either
+    offline.set('other', b'x')
+    assert offline.get('rainfall') == b'series'
+
+    online = cache.DiskCache(str(tmp_path), max_age_seconds=60)
+    assert online.get('rainfall') is None
+    assert offline.get('rainfall') is None
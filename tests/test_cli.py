@@ -0,0 +1,57 @@
+"""Bulk CLI output stays one table when chunks differ in which sites needed a groundwater lookup."""
+
+import pandas as pd
+import pytest
+
+from hydro_core import cli
+
+
+class _Rainfall:
+    def annual_total(self):
+        return 820.0
+
+
+@pytest.fixture(autouse=True)
+def offline_lookups(monkeypatch):
+    monkeypatch.setattr(cli, 'get_daily_rainfall', lambda lat, lon: _Rainfall())
+    monkeypatch.setattr(cli, 'get_soil_info', lambda lat, lon: {'soil_type': 'Loamy', 'source': 'test'})
+
+
+@pytest.fixture
+def sites_csv(tmp_path):
+    # First chunk (size 2) has every depth given, the second needs lookups
+    path = tmp_path / 'sites.csv'
+    pd.DataFrame({
+        'site_id': ['a', 'b', 'c', 'd'],
+        'lat': [28.98, 28.99, 29.00, 29.01],
+        'lon': [77.70, 77.71, 77.72, 77.73],
+        'post_monsoon_depth_m': [6.5, 14.0, None, None],
+    }).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('suffix', ['csv', 'parquet'])
+def test_mixed_depth_chunks_share_one_schema(tmp_path, sites_csv, suffix):
+    output = tmp_path / f'results.{suffix}'
+    assert cli.main([str(sites_csv), '-o', str(output), '--chunk-size', '2', '--workers', '1']) == 0
+
+    results = pd.read_csv(output) if suffix == 'csv' else pd.read_parquet(output)
+    assert list(results['site_id'].astype(str)) == ['a', 'b', 'c', 'd']
+    assert results['post_monsoon_depth_m'].notna().all()
+    assert results['principal_aquifer_type'].isna().tolist() == [True, True, False, False]
+    assert results['annual_rainfall'].eq(820.0).all()
+
+
+@pytest.mark.parametrize('suffix', ['csv', 'parquet'])
+def test_resume_appends_with_existing_columns(tmp_path, sites_csv, suffix):
+    output = tmp_path / f'results.{suffix}'
+    first = pd.read_csv(sites_csv).iloc[:2]
+    first_csv = tmp_path / 'first.csv'
+    first.to_csv(first_csv, index=False)
+    assert cli.main([str(first_csv), '-o', str(output), '--chunk-size', '2', '--workers', '1']) == 0
+
+    assert cli.main([str(sites_csv), '-o', str(output), '--chunk-size', '1', '--workers', '1', '--resume']) == 0
+
+    results = pd.read_csv(output) if suffix == 'csv' else pd.read_parquet(output)
+    assert sorted(results['site_id'].astype(str)) == ['a', 'b', 'c', 'd']
+    assert results['principal_aquifer_type'].notna().sum() == 2
@@ -0,0 +1,33 @@
+"""A non-WGS84 layer is rejected before its features are read, wherever it declares its CRS."""
+
+import io
+import json
+
+import pytest
+
+from hydro_core import geojson_stream
+
+PROJECTED = {'type': 'name', 'properties': {'name': 'EPSG:32643'}}
+WGS84 = {'type': 'name', 'properties': {'name': 'urn:ogc:def:crs:OGC:1.3:CRS84'}}
+
+
+def _layer(crs):
+    features = [{'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [77.70 + i / 100, 28.98]},
+                 'properties': {'post_monsoon_depth_m': 5.0 + i}} for i in range(3)]
+    # crs after features, as some exporters write it
+    return io.StringIO(json.dumps({'type': 'FeatureCollection', 'features': features, 'crs': crs}))
+
+
+def test_late_projected_crs_fails_before_features(monkeypatch):
+    parsed = []
+    monkeypatch.setattr(geojson_stream, '_feature_point', lambda geometry: parsed.append(geometry))
+
+    with pytest.raises(geojson_stream.GeoJSONStreamError, match='EPSG:32643'):
+        geojson_stream.read_groundwater_columns(_layer(PROJECTED))
+    assert parsed == []
+
+
+def test_late_wgs84_crs_is_read():
+    columns = geojson_stream.read_groundwater_columns(_layer(WGS84))
+    assert len(columns) == 3
+    assert columns.numeric['post_monsoon_depth_m'].tolist() == [5.0, 6.0, 7.0]
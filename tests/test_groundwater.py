@@ -0,0 +1,64 @@
+"""The STRtree well lookup finds the same wells as a brute-force great-circle search."""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Point
+
+from hydro_core.groundwater import get_groundwater_index, haversine_m, query_groundwater
+
+
+def _wells(lats, lons, **columns):
+    return gpd.GeoDataFrame(columns, geometry=[Point(lon, lat) for lat, lon in zip(lats, lons)],
+                            crs='EPSG:4326')
+
+
+@pytest.fixture(scope='module')
+def wells():
+    rng = np.random.default_rng(7)
+    n = 60
+    lats = rng.uniform(28.8, 29.2, n)
+    lons = rng.uniform(77.5, 77.9, n)
+    return _wells(lats, lons,
+                  post_monsoon_depth_m=rng.uniform(3, 25, n).round(2),
+                  pre_monsoon_depth_m=rng.uniform(5, 30, n).round(2),
+                  principal_aquifer_type=[f"aquifer-{i}" for i in range(n)],
+                  aquifer_yield=rng.choice(['Low', 'Moderate', 'High'], n))
+
+
+def _brute_force(gdf, lat, lon):
+    distances = haversine_m(lat, lon, gdf.geometry.y.to_numpy(), gdf.geometry.x.to_numpy())
+    return np.argsort(distances, kind='stable'), np.sort(distances, kind='stable')
+
+
+def test_nearest_well_matches_brute_force(wells):
+    rng = np.random.default_rng(8)
+    # Inside the well field and well outside it
+    sites = np.column_stack([rng.uniform(28.5, 29.5, 200), rng.uniform(77.2, 78.2, 200)])
+    for lat, lon in sites:
+        order, distances = _brute_force(wells, lat, lon)
+        result = query_groundwater(lat, lon, wells, method='nearest')
+        nearest = wells.iloc[order[0]]
+        assert result['principal_aquifer_type'] == nearest['principal_aquifer_type']
+        assert result['post_monsoon_depth_m'] == nearest['post_monsoon_depth_m']
+        assert result['distance_m'] == pytest.approx(distances[0], abs=1e-6)
+
+
+def test_k_nearest_matches_brute_force(wells):
+    index = get_groundwater_index(wells)
+    for lat, lon in [(29.0, 77.7), (28.0, 76.0), (29.19, 77.51)]:
+        order, distances = _brute_force(wells, lat, lon)
+        positions, found = index.nearest(lat, lon, k=8)
+        assert positions.tolist() == order[:8].tolist()
+        np.testing.assert_allclose(found, distances[:8], rtol=0, atol=1e-6)
+
+
+def test_great_circle_not_planar_nearest():
+    # At 60°N a degree of longitude is half a degree of latitude in metres:
+    # the planar nearest well (north) is not the closest on the ground (east)
+    gdf = _wells([60.8, 60.0], [10.0, 11.0], principal_aquifer_type=['north', 'east'])
+    result = query_groundwater(60.0, 10.0, gdf, method='nearest')
+    assert result['principal_aquifer_type'] == 'east'
+    assert result['distance_m'] == pytest.approx(haversine_m(60.0, 10.0, 60.0, 11.0))
+    # Missing depth columns fall back to the calculator defaults
+    assert result['post_monsoon_depth_m'] == 12
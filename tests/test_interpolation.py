@@ -0,0 +1,81 @@
+"""IDW and kriging estimates match hand-computed and loop-by-loop reference results."""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Point
+
+from hydro_core.groundwater import haversine_m, query_groundwater
+from hydro_core.interpolation import WellSurface
+
+
+@pytest.fixture(scope='module')
+def surface():
+    rng = np.random.default_rng(3)
+    n = 40
+    lat = rng.uniform(28.8, 29.2, n)
+    lon = rng.uniform(77.5, 77.9, n)
+    # A smooth trend plus noise, so the variogram has structure to fit
+    values = 5 + 20 * (lat - 28.8) + 10 * (lon - 77.5) + rng.normal(0, 0.5, n)
+    return WellSurface(lat, lon, values)
+
+
+def test_idw_by_hand():
+    # On the equator, steps of 0.01° along either axis are equal great-circle distances,
+    # so the three wells sit at d, 2d and 3d from the origin: weights 1, 1/4, 1/9
+    gdf = gpd.GeoDataFrame({'post_monsoon_depth_m': [10.0, 20.0, 30.0],
+                            'pre_monsoon_depth_m': [12.0, 12.0, 12.0]},
+                           geometry=[Point(0.01, 0), Point(-0.02, 0), Point(0, 0.03)], crs='EPSG:4326')
+    result = query_groundwater(0.0, 0.0, gdf, method='idw')
+    assert result['post_monsoon_depth_m'] == pytest.approx((10 + 20 / 4 + 30 / 9) / (1 + 1 / 4 + 1 / 9))
+    assert result['post_monsoon_depth_m'] == pytest.approx(660 / 49)
+    assert result['pre_monsoon_depth_m'] == pytest.approx(12.0)
+    # Aquifer attributes and distance still come from the nearest well
+    assert result['distance_m'] == pytest.approx(haversine_m(0, 0, 0, 0.01))
+
+
+def test_neighbours_match_brute_force(surface):
+    rng = np.random.default_rng(4)
+    lats, lons = rng.uniform(28.6, 29.4, 50), rng.uniform(77.3, 78.1, 50)
+    indices, distances = surface.neighbours(lats, lons, k=8)
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        all_distances = haversine_m(lat, lon, surface.lat, surface.lon)
+        expected = np.argsort(all_distances, kind='stable')[:8]
+        assert indices[i].tolist() == expected.tolist()
+        np.testing.assert_allclose(distances[i], all_distances[expected], rtol=0, atol=1e-6)
+
+
+def _reference_kriging(surface, lat, lon, k):
+    """Ordinary kriging for one point, system assembled element by element."""
+    variogram = surface.variogram
+    distances = haversine_m(lat, lon, surface.lat, surface.lon)
+    near = np.argsort(distances, kind='stable')[:k]
+    system = np.zeros((k + 1, k + 1))
+    target = np.zeros(k + 1)
+    for a in range(k):
+        for b in range(k):
+            h = haversine_m(surface.lat[near[a]], surface.lon[near[a]],
+                            surface.lat[near[b]], surface.lon[near[b]])
+            system[a, b] = variogram(np.array(h))
+        system[a, k] = system[k, a] = 1.0
+        target[a] = variogram(np.array(distances[near[a]]))
+    target[k] = 1.0
+    weights = np.linalg.solve(system, target)[:k]
+    assert weights.sum() == pytest.approx(1.0)
+    estimate = float(weights @ surface.values[near])
+    return min(max(estimate, surface.values.min()), surface.values.max())
+
+
+def test_kriging_matches_reference(surface):
+    assert surface.variogram is not None
+    rng = np.random.default_rng(5)
+    lats, lons = rng.uniform(28.8, 29.2, 20), rng.uniform(77.5, 77.9, 20)
+    estimates = surface.estimate(lats, lons, method='kriging', k=8)
+    expected = [_reference_kriging(surface, lat, lon, 8) for lat, lon in zip(lats, lons)]
+    np.testing.assert_allclose(estimates, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize('method', ['idw', 'kriging'])
+def test_estimate_at_a_well_is_its_value(surface, method):
+    estimates = surface.estimate(surface.lat[:5], surface.lon[:5], method=method)
+    np.testing.assert_allclose(estimates, surface.values[:5], rtol=1e-6)
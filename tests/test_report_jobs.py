@@ -0,0 +1,56 @@
+"""Report jobs start only when requested, and a replaced job is cancelled while it is still queued."""
+
+import threading
+import time
+
+import pytest
+
+from hydro_core import report_jobs
+
+_release = threading.Event()
+_started = threading.Event()
+
+
+def _blocking_build(tag):
+    _started.set()
+    _release.wait(10)
+    return b'%PDF-' + tag.encode()
+
+
+@pytest.fixture(autouse=True)
+def thread_builds(monkeypatch):
+    stored = {}
+    monkeypatch.setattr(report_jobs, 'REPORT_WORKERS', 0)
+    monkeypatch.setattr(report_jobs, 'get_report', stored.get)
+    monkeypatch.setattr(report_jobs, 'put_report', stored.__setitem__)
+    _release.clear()
+    _started.clear()
+    yield stored
+    _release.set()
+
+
+def test_status_does_not_submit():
+    before = report_jobs.report_jobs_info()['submitted']
+    assert report_jobs.report_status('never-requested') is None
+    assert report_jobs.report_jobs_info()['submitted'] == before
+
+
+def test_queued_job_is_cancelled_running_job_is_not():
+    running = report_jobs.request_report('running', _blocking_build, 'a')
+    assert running.state in (report_jobs.QUEUED, report_jobs.RUNNING)
+    assert _started.wait(5)
+    assert report_jobs.request_report('queued', _blocking_build, 'b').state == report_jobs.QUEUED
+
+    assert report_jobs.cancel_report('queued')
+    assert report_jobs.report_status('queued') is None
+    assert not report_jobs.cancel_report('running')
+
+    future = report_jobs._jobs['running'].future
+    _release.set()
+    future.result(5)
+    for _ in range(50):
+        status = report_jobs.report_status('running')
+        if status.state == report_jobs.DONE:
+            break
+        time.sleep(0.1)
+    assert status.pdf == b'%PDF-a'
@@ -0,0 +1,63 @@
+"""The vectorized texture classifier agrees with the rule-by-rule USDA triangle everywhere."""
+
+import math
+
+import numpy as np
+
+from hydro_core.soil import (SOIL_CODE_SANDY, SOIL_CODE_UNKNOWN, SOIL_TEXTURE_CLASSES,
+                             classify_soil_texture, classify_soil_textures)
+
+
+def _reference_texture(clay_pct, sand_pct):
+    """The original one-pair-at-a-time rules, for finite percentages."""
+    silt_pct = 100 - clay_pct - sand_pct
+
+    if sand_pct > 85 and clay_pct < 10:
+        return 'Sandy'
+    elif clay_pct >= 40:
+        return 'Clay'
+    elif clay_pct >= 35 and sand_pct < 45:
+        return 'Clay'
+    elif sand_pct >= 70 and clay_pct < 30:
+        return 'Sandy'
+    elif clay_pct < 20 and silt_pct < 50:
+        return 'Sandy'
+    elif clay_pct < 27 and 50 <= silt_pct < 80:
+        return 'Loamy'
+    elif silt_pct >= 80:
+        return 'Loamy'
+    else:
+        return 'Loamy'
+
+
+def _texture_grid():
+    # Half-percent steps land on every rule threshold; keep sand + clay <= 100 (silt >= 0)
+    steps = np.arange(0, 100.5, 0.5)
+    clay, sand = np.meshgrid(steps, steps, indexing='ij')
+    valid = clay + sand <= 100
+    return clay[valid], sand[valid]
+
+
+def test_vectorized_matches_rules_over_triangle():
+    clay, sand = _texture_grid()
+    codes = classify_soil_textures(clay, sand)
+    assert codes.dtype == np.int8
+    classes = [SOIL_TEXTURE_CLASSES[code] for code in codes]
+    expected = [_reference_texture(c, s) for c, s in zip(clay.tolist(), sand.tolist())]
+    assert classes == expected
+    assert set(classes) == set(SOIL_TEXTURE_CLASSES)
+
+
+def test_scalar_wrapper_matches_rules():
+    clay, sand = _texture_grid()
+    for c, s in zip(clay[::37].tolist(), sand[::37].tolist()):
+        assert classify_soil_texture(c, s) == _reference_texture(c, s), (c, s)
+
+
+def test_nan_is_unknown_and_loamy():
+    # Any missing fraction is unknown, even where the other one alone would decide the class
+    clay = np.array([math.nan, 50.0, math.nan, 5.0])
+    sand = np.array([90.0, math.nan, math.nan, 90.0])
+    assert classify_soil_textures(clay, sand).tolist() == [SOIL_CODE_UNKNOWN] * 3 + [SOIL_CODE_SANDY]
+    assert [classify_soil_texture(c, s) for c, s in zip(clay.tolist(), sand.tolist())] == \
+        ['Loamy', 'Loamy', 'Loamy', 'Sandy']
@@ -26,11 +26,20 @@ def T(key: str) -> str:
     except:
         current_lang = 'en'
     
-    # Try to get the translation for the current language
-    if current_lang in translations and key in translations[current_lang]:
-        return translations[current_lang][key]
+    return translate(key, current_lang)
+
+
+def translate(key: str, language: str) -> str:
+    """
+    Translation of `key` in an explicit language, for code that runs outside
+    a Streamlit session (e.g. report builds in worker processes).
+    Falls back to English, then to the key itself, like T().
+    """
+    # Try to get the translation for the requested language
+    if language in translations and key in translations[language]:
+        return translations[language][key]
     
-    # Fallback to English if translation not found in current language
+    # Fallback to English if translation not found in the language
     if key in translations['en']:
         return translations['en'][key]
     